@@ -1,21 +1,30 @@
 """The Eloverblik integration.""" 
 import asyncio
 import logging
-from datetime import timedelta, datetime
-from typing import Optional, Dict, Any
+from datetime import date, timedelta, datetime
+from typing import Optional, Dict, Any, List, Tuple
+import requests
 import voluptuous as vol
-from homeassistant.util import Throttle
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-
-from .const import DOMAIN
-from .api_client import EloverblikAPI, EloverblikAPIError, EloverblikAuthError
-from .models import TimeSeries, ChargesData, DayData, YearData
-
-# Module-level cache for tariffs and year data
-# Format: metering_point: (data, timestamp)
-_TARIFF_CACHE: Dict[str, tuple] = {}
-_YEAR_DATA_CACHE: Dict[str, tuple] = {}
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import STORAGE_DIR, Store
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .const import DOMAIN, TIME_SERIES_AGGREGATION
+from .api_client import (
+    EloverblikAPI,
+    EloverblikAsyncAPI,
+    EloverblikAPIError,
+    EloverblikAuthError,
+    EloverblikTokenManager,
+    create_session,
+)
+from .batch import EntryBatchFetcher
+from .cache import CachePolicy, ResponseCache
+from .models import TimeSeries, ChargesData, DayData, YearData, iter_periods
+from .streaming import iter_point_periods
+from .timeseries_store import TimeSeriesStore
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,11 +43,47 @@ CONFIG_SCHEMA = vol.Schema({DOMAIN: vol.Schema({})}, extra=vol.ALLOW_EXTRA)
 PLATFORMS = ["sensor"]
 
 # Different throttling intervals for different data types
-MIN_TIME_BETWEEN_ENERGY_UPDATES = timedelta(minutes=60)  # Hourly for daily data
+MIN_TIME_BETWEEN_ENERGY_UPDATES = timedelta(minutes=60)  # Hourly for daily data (coordinator interval)
 MIN_TIME_BETWEEN_TARIFF_UPDATES = timedelta(hours=24)  # Daily for tariffs (rarely change)
 MIN_TIME_BETWEEN_YEAR_UPDATES = timedelta(hours=24)  # Daily for yearly data (monthly changes)
+
+# A closed month is final once the data delay (typically 1-3 days) has passed
+MONTH_FINALIZE_DELAY = timedelta(days=5)
 MIN_TIME_BETWEEN_STATISTICS_UPDATES = timedelta(hours=6)  # Every 6 hours for statistics
 
+# Storage for the access token, so restarts reuse it instead of calling /token
+TOKEN_STORAGE_VERSION = 1
+TOKEN_STORAGE_KEY = f"{DOMAIN}.token"
+
+# Local store of received time series, one file per metering point
+TIME_SERIES_STORAGE_KEY = f"{DOMAIN}.timeseries"
+
+# Number of metering points refreshed at the same time during setup
+MAX_CONCURRENT_SETUP_REFRESHES = 4
+
+# Kinds of data in the response cache
+CACHE_TARIFFS = "tariffs"
+CACHE_YEAR_DATA = "year_data"
+CACHE_DETAILS = "details"
+
+# Entries per kind and metering point: one for tariffs and details, and year
+# data for the current and the previous year around new year
+CACHE_MAX_ENTRIES_PER_METERING_POINT = 2
+
+# How long tariffs and details may be served from the cache after their TTL,
+# while they are refreshed in the background (stale-while-revalidate)
+TARIFF_STALE_WHILE_REVALIDATE = timedelta(days=7)
+DETAILS_MAX_AGE = timedelta(days=1)
+DETAILS_STALE_WHILE_REVALIDATE = timedelta(days=30)
+
+# Cache shared by all config entries. Keys start with the metering point ID,
+# and its size bound grows with the metering points set up.
+_RESPONSE_CACHE = ResponseCache({
+    CACHE_TARIFFS: CachePolicy(MIN_TIME_BETWEEN_TARIFF_UPDATES, CACHE_MAX_ENTRIES_PER_METERING_POINT, TARIFF_STALE_WHILE_REVALIDATE),
+    CACHE_YEAR_DATA: CachePolicy(MIN_TIME_BETWEEN_YEAR_UPDATES, CACHE_MAX_ENTRIES_PER_METERING_POINT),
+    CACHE_DETAILS: CachePolicy(DETAILS_MAX_AGE, CACHE_MAX_ENTRIES_PER_METERING_POINT, DETAILS_STALE_WHILE_REVALIDATE),
+})
+
 
 async def async_setup(hass: HomeAssistant, config: dict):
     """Set up the Eloverblik component."""
@@ -62,25 +107,45 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         _LOGGER.error(f"[v{VERSION}] Missing required config data: refresh_token or metering_points")
         return False
     
-    # Create clients for all metering points
+    # All clients for this refresh token share one pooled HTTP session
+    # and one access token
+    session = create_session()
+    token_manager = await _async_create_token_manager(hass, entry, refresh_token)
+
+    # Create clients and update coordinators for all metering points
     clients = {}
+    coordinators = {}
+    batch = EntryBatchFetcher(EloverblikAPI(refresh_token, session, token_manager))
     for metering_point in metering_points:
         # Validate metering point ID format (should be 18 alphanumeric characters)
         if not metering_point or not isinstance(metering_point, str) or len(metering_point) != 18 or not metering_point.isalnum():
             _LOGGER.warning(f"[v{VERSION}] Skipping invalid metering point ID: {metering_point}. Expected 18 alphanumeric characters.")
             continue
         
-        client = HassEloverblik(refresh_token, metering_point)
-        
-        # Fetch metering point details for additional information
-        try:
-            await hass.async_add_executor_job(client._fetch_metering_point_details)
-        except Exception as e:
-            _LOGGER.warning(f"[v{VERSION}] Could not fetch metering point details for {metering_point}: {e}. Continuing without details.")
-        
+        store = TimeSeriesStore(_time_series_store_path(hass, metering_point))
+        batch.add_metering_point(metering_point)
+        _RESPONSE_CACHE.add_metering_point(metering_point)
+        client = HassEloverblik(refresh_token, metering_point, session, token_manager, store, batch)
         clients[metering_point] = client
-    
-    hass.data[DOMAIN][entry.entry_id] = clients
+        coordinators[metering_point] = EloverblikCoordinator(hass, client)
+
+    hass.data[DOMAIN][entry.entry_id] = {
+        "clients": clients,
+        "coordinators": coordinators,
+        "session": session,
+        "token_manager": token_manager,
+    }
+
+    # Details and the first data fetch run in the background, so setup
+    # finishes without waiting for the API. Sensors fill in when data arrives.
+    # Background tasks are cancelled automatically when the entry unloads.
+    initial_refresh = _async_initial_refresh(hass, refresh_token, token_manager, clients, coordinators)
+    if hasattr(entry, "async_create_background_task"):
+        entry.async_create_background_task(hass, initial_refresh, f"{DOMAIN} initial refresh {entry.entry_id}")
+    else:
+        # Home Assistant before 2023.5 has no entry background tasks
+        task = hass.async_create_task(initial_refresh)
+        entry.async_on_unload(task.cancel)
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -98,37 +163,186 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
         )
     )
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+        # Background refreshes still use the session
+        for coordinator in entry_data["coordinators"].values():
+            await coordinator.async_shutdown()
+        await hass.async_add_executor_job(entry_data["session"].close)
+        _RESPONSE_CACHE.log_stats()
+        for metering_point in entry_data["clients"]:
+            _RESPONSE_CACHE.remove_metering_point(metering_point)
 
     return unload_ok
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry):
+    """Remove the cached access token and time series when a config entry is removed."""
+    await _token_store(hass, entry).async_remove()
+    
+    metering_points = entry.data.get('metering_points') or [entry.data.get('metering_point')]
+    for metering_point in metering_points:
+        if metering_point:
+            store = TimeSeriesStore(_time_series_store_path(hass, metering_point))
+            await hass.async_add_executor_job(store.remove)
+
+
+def _time_series_store_path(hass: HomeAssistant, metering_point: str) -> str:
+    """Get the path of the local time series store for a metering point."""
+    return hass.config.path(STORAGE_DIR, f"{TIME_SERIES_STORAGE_KEY}.{metering_point}.json")
+
+
+def _token_store(hass: HomeAssistant, entry: ConfigEntry) -> Store:
+    """Get the access token store for a config entry."""
+    return Store(hass, TOKEN_STORAGE_VERSION, f"{TOKEN_STORAGE_KEY}.{entry.entry_id}")
+
+
+async def _async_create_token_manager(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    refresh_token: str
+) -> EloverblikTokenManager:
+    """Create the token manager for a config entry, restoring a cached token.
+    
+    The access token is valid for 24 hours, so it is persisted and reused
+    across restarts and reloads. Invalid, expired or foreign tokens are
+    ignored and a new token is requested on first use.
+    """
+    store = _token_store(hass, entry)
+
+    async def _async_save_token(access_token: str, expires_at: datetime):
+        await store.async_save({
+            "refresh_token_fingerprint": token_manager.refresh_token_fingerprint,
+            "access_token": access_token,
+            "expires_at": expires_at.timestamp(),
+        })
+
+    def _on_token_refreshed(access_token: str, expires_at: datetime):
+        # May be called from an executor thread
+        hass.add_job(_async_save_token, access_token, expires_at)
+
+    token_manager = EloverblikTokenManager(refresh_token, _on_token_refreshed)
+
+    try:
+        stored = await store.async_load()
+    except Exception as e:
+        _LOGGER.debug(f"[v{VERSION}] Could not load cached access token: {e}")
+        stored = None
+
+    if isinstance(stored, dict) and stored.get("refresh_token_fingerprint") == token_manager.refresh_token_fingerprint:
+        if token_manager.restore_token(stored.get("access_token"), stored.get("expires_at")):
+            _LOGGER.debug(f"[v{VERSION}] Restored cached access token")
+        else:
+            _LOGGER.debug(f"[v{VERSION}] Cached access token is invalid or expired, a new one will be requested")
+
+    return token_manager
+
+
+async def _async_initial_refresh(
+    hass: HomeAssistant,
+    refresh_token: str,
+    token_manager: EloverblikTokenManager,
+    clients: Dict[str, "HassEloverblik"],
+    coordinators: Dict[str, "EloverblikCoordinator"]
+):
+    """Fetch metering point details and the first data for all metering points.
+    
+    Details are fetched in batches so several metering points share one request.
+    The first coordinator refreshes run concurrently, bounded by
+    MAX_CONCURRENT_SETUP_REFRESHES to stay well below the API rate limits.
+    """
+    try:
+        uncached = [metering_point for metering_point, client in clients.items() if not client.load_cached_metering_point_details()]
+        if uncached:
+            async_api = EloverblikAsyncAPI(refresh_token, async_get_clientsession(hass), token_manager)
+            details = await async_api.get_metering_point_details_batch(uncached)
+            for metering_point, details_response in details.items():
+                if metering_point in clients:
+                    clients[metering_point].set_metering_point_details(details_response)
+    except Exception as e:
+        _LOGGER.warning(f"[v{VERSION}] Could not fetch metering point details: {e}. Continuing without details.")
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SETUP_REFRESHES)
+
+    async def _refresh(coordinator: "EloverblikCoordinator"):
+        async with semaphore:
+            await coordinator.async_refresh()
+
+    await asyncio.gather(*(_refresh(coordinator) for coordinator in coordinators.values()))
+    _LOGGER.debug(f"[v{VERSION}] Initial refresh done for {len(coordinators)} metering point(s)")
+
+
 class HassEloverblik:
     """Wrapper class for Eloverblik API client."""
 
-    def __init__(self, refresh_token: str, metering_point: str):
-        """Initialize the Eloverblik client."""
-        self._api = EloverblikAPI(refresh_token)
+    def __init__(
+        self,
+        refresh_token: str,
+        metering_point: str,
+        session: Optional[requests.Session] = None,
+        token_manager: Optional[EloverblikTokenManager] = None,
+        store: Optional[TimeSeriesStore] = None,
+        batch: Optional[EntryBatchFetcher] = None
+    ):
+        """Initialize the Eloverblik client.
+        
+        Args:
+            refresh_token: Refresh token from eloverblik.dk portal
+            metering_point: Metering point ID
+            session: HTTP session shared by all clients of the config entry
+            token_manager: Access token manager shared by all clients of the config entry
+            store: Local store of received time series. If not given, an
+                in-memory store is used.
+            batch: Batch fetcher shared by the metering points of the config
+                entry. If not given, the client batches on its own.
+        """
+        self._api = EloverblikAPI(refresh_token, session, token_manager)
         self._metering_point = metering_point
+        self._store = store if store is not None else TimeSeriesStore(None)
+        self._batch = batch if batch is not None else EntryBatchFetcher(self._api)
+        self._batch.add_metering_point(metering_point)
 
         self._day_data: Optional[DayData] = None
         self._year_data: Optional[YearData] = None
         self._tariff_data: Optional[ChargesData] = None
         self._metering_point_details: Optional[Dict[str, Any]] = None
+        # Data served stale by update(), to be refreshed by revalidate()
+        self._revalidate_tariffs = False
+        self._revalidate_details = False
 
     def _fetch_metering_point_details(self):
         """Fetch metering point details from API."""
         try:
             details_response = self._api.get_metering_point_details(self._metering_point)
-            if details_response and "result" in details_response:
-                result_list = details_response["result"]
-                if result_list and len(result_list) > 0:
-                    result_item = result_list[0]
-                    if "result" in result_item:
-                        self._metering_point_details = result_item["result"]
-                        _LOGGER.debug(f"[v{VERSION}] Fetched metering point details for {self._metering_point}")
+            self.set_metering_point_details(details_response)
         except Exception as e:
             _LOGGER.debug(f"[v{VERSION}] Could not fetch metering point details: {e}")
 
+    def set_metering_point_details(self, details_response: Optional[Dict[str, Any]]):
+        """Store metering point details from a getdetails response.
+        
+        Args:
+            details_response: Raw API response for this metering point
+        """
+        if details_response and "result" in details_response:
+            result_list = details_response["result"]
+            if result_list and len(result_list) > 0:
+                result_item = result_list[0]
+                if "result" in result_item:
+                    self._metering_point_details = result_item["result"]
+                    _RESPONSE_CACHE.set(CACHE_DETAILS, (self._metering_point,), self._metering_point_details)
+                    _LOGGER.debug(f"[v{VERSION}] Fetched metering point details for {self._metering_point}")
+
+    def load_cached_metering_point_details(self) -> bool:
+        """Use cached metering point details if they are fresh.
+        
+        Returns:
+            True if details were loaded from the cache
+        """
+        cached_details = _RESPONSE_CACHE.get(CACHE_DETAILS, (self._metering_point,))
+        if cached_details is None:
+            return False
+        self._metering_point_details = cached_details
+        return True
+
     def get_metering_point_info(self) -> Dict[str, Any]:
         """Get metering point information for attributes.
         
@@ -191,25 +405,54 @@ class HassEloverblik:
                 return 0
         return None
 
-    @Throttle(MIN_TIME_BETWEEN_STATISTICS_UPDATES)
-    def get_hourly_data(self, from_date: datetime, to_date: datetime) -> Optional[Dict[datetime, TimeSeries]]:
-        """Get hourly data for a meter between two dates."""
+    def fetch_hourly_data(
+        self,
+        from_date: datetime,
+        to_date: datetime,
+        use_export: bool = False
+    ) -> bool:
+        """Fetch the hourly data for a meter between two dates into the local store.
+        
+        Days already in the local store are not requested again; only the
+        missing ranges are fetched from the API, so repeated calls are cheap.
+        Read the data with get_hourly_data() afterwards.
+        
+        Args:
+            from_date: Start date (inclusive)
+            to_date: End date (exclusive)
+            use_export: Fetch the missing ranges from the CSV export first.
+                Meant for large backfills; days the export did not deliver
+                are fetched as regular time series.
+        
+        Returns:
+            True if the store was brought up to date as far as the API allowed
+        """
         try:
-            # Check if service is alive first
-            if not self._api.check_isalive():
-                _LOGGER.warning(f"[v{VERSION}] Eloverblik service is not available")
-                return None
-                
-            raw_data = self._api.get_time_series(
-                self._metering_point,
-                from_date,
-                to_date,
-                aggregation="Hour"
-            )
+            missing_ranges = self._store.missing_day_ranges(from_date.date(), to_date.date())
             
-            if raw_data:
-                # Parse response into TimeSeries objects
-                return self._parse_time_series_response(raw_data)
+            if missing_ranges:
+                # Fail fast while the service is known to be down
+                if not self._api.is_available():
+                    _LOGGER.warning(f"[v{VERSION}] Eloverblik service is not available")
+                    return False
+                
+                if use_export:
+                    self._fill_store_from_export(missing_ranges)
+                    missing_ranges = self._store.missing_day_ranges(from_date.date(), to_date.date())
+                
+                _LOGGER.debug(f"[v{VERSION}] Fetching {len(missing_ranges)} missing range(s) for {self._metering_point}")
+                for gap_from, gap_to in missing_ranges:
+                    # Stream the response bodies straight into the store, so
+                    # backfills never hold a full multi-year document in memory
+                    points = self._api.stream_time_series_range(
+                        self._metering_point,
+                        datetime.combine(gap_from, datetime.min.time()),
+                        datetime.combine(gap_to, datetime.min.time()),
+                        aggregation=TIME_SERIES_AGGREGATION
+                    )
+                    self._store.add_day_periods(iter_point_periods(points))
+                self._store.save()
+            return True
                 
         except EloverblikAuthError as e:
             _LOGGER.warning(f"[v{VERSION}] Authentication error: {e}")
@@ -217,7 +460,47 @@ class HassEloverblik:
             _LOGGER.warning(f"[v{VERSION}] API error while getting historic data: {e}")
         except Exception as e:
             _LOGGER.warning(f"[v{VERSION}] Unexpected exception while getting historic data: {e}", exc_info=True)
-        return None
+        return False
+
+    def get_hourly_data(self, from_date: datetime, to_date: datetime) -> Optional[Dict[datetime, TimeSeries]]:
+        """Get the stored hourly data for a meter between two dates.
+        
+        Only reads the local store; call fetch_hourly_data() first to fill it.
+        
+        Args:
+            from_date: Start date (inclusive)
+            to_date: End date (exclusive)
+        
+        Returns:
+            Dictionary mapping the end of each day to its TimeSeries, or None
+            if no days are stored in the range
+        """
+        result: Dict[datetime, TimeSeries] = {
+            period.end: TimeSeries.from_period(period)
+            for period in self._store.get_days(from_date.date(), to_date.date())
+        }
+        return result or None
+
+    def _fill_store_from_export(self, missing_ranges: List[Tuple[date, date]]):
+        """Fill missing days in the store from the CSV time series export.
+        
+        Errors other than authentication errors are logged, leaving the days
+        to the regular time series requests.
+        """
+        try:
+            for gap_from, gap_to in missing_ranges:
+                points = self._api.stream_time_series_export(
+                    [self._metering_point],
+                    datetime.combine(gap_from, datetime.min.time()),
+                    datetime.combine(gap_to, datetime.min.time()),
+                    aggregation=TIME_SERIES_AGGREGATION
+                )
+                self._store.add_day_periods(iter_point_periods(point for _, point in points))
+        except EloverblikAuthError:
+            raise
+        except EloverblikAPIError as e:
+            _LOGGER.warning(f"[v{VERSION}] Time series export failed: {e}. Falling back to time series requests.")
+        self._store.save()
 
     def get_data_date(self) -> Optional[str]:
         """Get the date of the current data."""
@@ -230,28 +513,80 @@ class HassEloverblik:
         return self._metering_point
 
     def get_tariff_sum_hour(self, hour: int) -> Optional[float]:
-        """Get the sum of all tariffs for a specific hour."""
+        """Get the sum of all tariffs for a specific hour.
+        
+        Tariffs with quarter-hour prices count with the mean of the hour's
+        four prices.
+        """
         if self._tariff_data is not None:
-            tariff_sum = 0.0
-            for tariff in self._tariff_data.charges.values():
-                if isinstance(tariff, list):
-                    if len(tariff) == 24:
-                        tariff_sum += tariff[hour - 1]
-                    else:
-                        _LOGGER.warning(f"[v{VERSION}] Unexpected length of tariff array ({len(tariff)}), expected 24 entries.")
-                else:
-                    tariff_sum += float(tariff)
-            return tariff_sum
+            return self._tariff_data.get_price_sum_hour(hour)
         return None
 
-    @Throttle(MIN_TIME_BETWEEN_ENERGY_UPDATES)
+    def get_tariff_sum_at(self, when: datetime) -> Optional[float]:
+        """Get the sum of all tariffs at a point in time.
+        
+        Uses the quarter-hour price of tariffs that have one, and the hourly
+        price of the others. Naive datetimes are Danish local time, so pass
+        an aware datetime such as dt_util.now().
+        """
+        if self._tariff_data is not None:
+            return self._tariff_data.get_price_sum_at(when)
+        return None
+
+    def get_tariff_data(self) -> Optional[ChargesData]:
+        """Get the charges of the metering point, if fetched."""
+        return self._tariff_data
+
+    def has_quarter_hour_tariffs(self) -> bool:
+        """True if any tariff has quarter-hour prices."""
+        return self._tariff_data is not None and self._tariff_data.slots_per_day == 96
+
+    def update(self):
+        """Update all data for the metering point.
+
+        Called once per interval by the coordinator. Tariffs are served from
+        the cache while fresh, so most cycles only fetch energy data.
+        """
+        self.update_energy()
+        self.update_tariffs()
+        self._update_metering_point_details()
+
+    @property
+    def needs_revalidation(self) -> bool:
+        """True if the last update served cached data that should be refreshed."""
+        return self._revalidate_tariffs or self._revalidate_details
+
+    def revalidate(self):
+        """Refresh the data the last update served stale from the cache.
+        
+        Meant to run in the background after update(), so sensors are served
+        the cached data without waiting for the API.
+        """
+        if self._revalidate_tariffs:
+            self._revalidate_tariffs = False
+            self.refresh_tariffs()
+        if self._revalidate_details:
+            self._revalidate_details = False
+            self._fetch_metering_point_details()
+
+    def _update_metering_point_details(self):
+        """Serve metering point details from the cache, flagging them for refresh when stale.
+        
+        Details only feed sensor attributes, so they are never fetched in
+        the update itself, not even when nothing is cached.
+        """
+        cached_details, revalidate = _RESPONSE_CACHE.get_revalidating(CACHE_DETAILS, (self._metering_point,))
+        if cached_details is not None:
+            self._metering_point_details = cached_details
+        self._revalidate_details = revalidate
+
     def update_energy(self):
         """Update energy data from Eloverblik API."""
         _LOGGER.debug(f"[v{VERSION}] Fetching energy data from Eloverblik")
 
         try:
-            # Check if service is alive first
-            if not self._api.check_isalive():
+            # Fail fast while the service is known to be down
+            if not self._api.is_available():
                 _LOGGER.warning(f"[v{VERSION}] Eloverblik service is not available, skipping energy update")
                 return
 
@@ -267,118 +602,58 @@ class HassEloverblik:
             _LOGGER.debug(f"[v{VERSION}] Requesting day data from {date_from.date()} to {date_to.date()} (today UTC: {today_utc.date()}) - using same logic as test.py")
             _LOGGER.debug(f"[v{VERSION}] Using metering point: {self._metering_point}")
             
-            try:
-                day_data_response = self._api.get_time_series(
-                    self._metering_point,
-                    date_from,
-                    date_to,
-                    aggregation="Hour"
-                )
-            except Exception as e:
-                _LOGGER.error(f"[v{VERSION}] Exception when calling get_time_series: {e}", exc_info=True)
-                day_data_response = None
-            
-            if day_data_response is None:
-                _LOGGER.warning(f"[v{VERSION}] API returned None for day data. Check API logs above for errors.")
-            elif not day_data_response:
-                _LOGGER.warning(f"[v{VERSION}] API returned empty response for day data: {day_data_response}")
+            # Days already received are served from the local store
+            stored_day = self._store.get_day(date_from.date())
+            if stored_day is not None:
+                _LOGGER.debug(f"[v{VERSION}] Using stored day data for {date_from.date()}")
+                self._day_data = DayData(TimeSeries.from_period(stored_day))
             else:
-                _LOGGER.debug(f"[v{VERSION}] API returned response (type: {type(day_data_response)})")
+                try:
+                    # Shared with the other metering points of the entry
+                    day_data_response = self._batch.get_time_series(
+                        self._metering_point,
+                        date_from,
+                        date_to,
+                        TIME_SERIES_AGGREGATION
+                    )
+                except Exception as e:
+                    _LOGGER.error(f"[v{VERSION}] Exception when calling get_time_series: {e}", exc_info=True)
+                    day_data_response = None
+            
+                if day_data_response is None:
+                    _LOGGER.warning(f"[v{VERSION}] API returned None for day data. Check API logs above for errors.")
+                elif not day_data_response:
+                    _LOGGER.warning(f"[v{VERSION}] API returned empty response for day data: {day_data_response}")
+                else:
+                    _LOGGER.debug(f"[v{VERSION}] API returned response (type: {type(day_data_response)})")
             
-            if day_data_response:
-                _LOGGER.debug(f"[v{VERSION}] Received day data response, keys: {list(day_data_response.keys()) if isinstance(day_data_response, dict) else 'not a dict'}")
-                if isinstance(day_data_response, dict) and "result" in day_data_response:
-                    result_count = len(day_data_response.get("result", []))
-                    _LOGGER.debug(f"[v{VERSION}] Response contains {result_count} result(s)")
-                    if result_count > 0:
-                        first_result = day_data_response["result"][0]
-                        _LOGGER.debug(f"[v{VERSION}] First result keys: {list(first_result.keys()) if isinstance(first_result, dict) else 'not a dict'}")
-                        _LOGGER.debug(f"[v{VERSION}] First result success: {first_result.get('success', 'N/A')}")
+                if day_data_response:
+                    _LOGGER.debug(f"[v{VERSION}] Received day data response, keys: {list(day_data_response.keys()) if isinstance(day_data_response, dict) else 'not a dict'}")
+                    if isinstance(day_data_response, dict) and "result" in day_data_response:
+                        result_count = len(day_data_response.get("result", []))
+                        _LOGGER.debug(f"[v{VERSION}] Response contains {result_count} result(s)")
+                        if result_count > 0:
+                            first_result = day_data_response["result"][0]
+                            _LOGGER.debug(f"[v{VERSION}] First result keys: {list(first_result.keys()) if isinstance(first_result, dict) else 'not a dict'}")
+                            _LOGGER.debug(f"[v{VERSION}] First result success: {first_result.get('success', 'N/A')}")
                 
-                time_series_dict = self._parse_time_series_response(day_data_response)
-                if time_series_dict:
-                    # Get the first (and should be only) time series
-                    time_series = next(iter(time_series_dict.values()))
-                    self._day_data = DayData(time_series)
-                    _LOGGER.info(f"[v{VERSION}] Successfully updated day data with {len(time_series._metering_data) if time_series._metering_data else 0} data points")
+                    time_series_dict = self._parse_time_series_response(day_data_response)
+                    if time_series_dict:
+                        # Get the first (and should be only) time series
+                        time_series = next(iter(time_series_dict.values()))
+                        self._day_data = DayData(time_series)
+                        self._store.add_day_periods(iter_periods(day_data_response))
+                        _LOGGER.info(f"[v{VERSION}] Successfully updated day data with {len(time_series._metering_data) if time_series._metering_data else 0} data points")
+                    else:
+                        _LOGGER.warning(f"[v{VERSION}] No day data parsed from response. Data may not be available yet (typically 1-3 days delayed).")
+                        _LOGGER.debug(f"[v{VERSION}] Response structure (first 1000 chars): {str(day_data_response)[:1000]}")  # Log first 1000 chars for debugging
+                        # Keep existing data if available
                 else:
-                    _LOGGER.warning(f"[v{VERSION}] No day data parsed from response. Data may not be available yet (typically 1-3 days delayed).")
-                    _LOGGER.debug(f"[v{VERSION}] Response structure (first 1000 chars): {str(day_data_response)[:1000]}")  # Log first 1000 chars for debugging
+                    _LOGGER.warning(f"[v{VERSION}] Failed to get day data from Eloverblik. Data may not be available yet (typically 1-3 days delayed).")
                     # Keep existing data if available
-            else:
-                _LOGGER.warning(f"[v{VERSION}] Failed to get day data from Eloverblik. Data may not be available yet (typically 1-3 days delayed).")
-                # Keep existing data if available
 
-            # Get year data (monthly aggregation) - only fetch new months
-            cache_key = self._metering_point
-            year_start = datetime(datetime.now().year, 1, 1)
-            
-            # Check cache for year data
-            if cache_key in _YEAR_DATA_CACHE:
-                cached_data, cache_time = _YEAR_DATA_CACHE[cache_key]
-                # If cache is less than 24 hours old, use it
-                if datetime.now() - cache_time < timedelta(hours=24):
-                    _LOGGER.debug(f"[v{VERSION}] Using cached year data")
-                    self._year_data = cached_data
-                else:
-                    # Only fetch new months (from last cached month)
-                    # For simplicity, we'll still fetch full year but cache it
-                    pass
-            else:
-                # First time, fetch from start of year
-                pass
-            
-            year_data_response = self._api.get_time_series(
-                self._metering_point,
-                year_start,
-                datetime.now(),
-                aggregation="Month"
-            )
-            
-            if year_data_response:
-                time_series_dict = self._parse_time_series_response(year_data_response)
-                if time_series_dict:
-                    # For year data, combine all monthly values
-                    # Create a combined TimeSeries with all monthly values
-                    all_monthly_values = []
-                    for ts in sorted(time_series_dict.values(), key=lambda x: x.data_date if x.data_date else datetime.min):
-                        if ts._metering_data:
-                            all_monthly_values.extend(ts._metering_data)
-                    
-                    if all_monthly_values:
-                        # Create a combined TimeSeries
-                        from .models import TimeSeries
-                        # Use the latest date
-                        latest_date = max(ts.data_date for ts in time_series_dict.values() if ts.data_date)
-                        fake_response = {
-                            "result": [{
-                                "success": True,
-                                "MyEnergyData_MarketDocument": {
-                                    "TimeSeries": [{
-                                        "Period": [{
-                                            "timeInterval": {"end": latest_date.isoformat()},
-                                            "Point": [{"position": str(i+1), "out_Quantity": {"quantity": str(val)}} 
-                                                     for i, val in enumerate(all_monthly_values)]
-                                        }]
-                                    }]
-                                }
-                            }]
-                        }
-                        combined_ts = TimeSeries(fake_response)
-                        self._year_data = YearData(combined_ts)
-                        # Cache the year data
-                        _YEAR_DATA_CACHE[cache_key] = (self._year_data, datetime.now())
-                        _LOGGER.debug(f"[v{VERSION}] Year data updated and cached")
-                else:
-                    _LOGGER.warning(f"[v{VERSION}] No year data parsed from response. Data may not be available yet.")
-            else:
-                _LOGGER.warning(f"[v{VERSION}] Failed to get year data from Eloverblik. Data may not be available yet.")
-                # Use cached data if available
-                if cache_key in _YEAR_DATA_CACHE:
-                    cached_data, _ = _YEAR_DATA_CACHE[cache_key]
-                    self._year_data = cached_data
-                    _LOGGER.debug(f"[v{VERSION}] Using cached year data due to API failure")
-                
+            self._update_year_data()
+
         except EloverblikAuthError as e:
             _LOGGER.warning(f"[v{VERSION}] Authentication error while fetching energy data: {e}")
         except EloverblikAPIError as e:
@@ -386,8 +661,70 @@ class HassEloverblik:
         except Exception as e:
             _LOGGER.warning(f"[v{VERSION}] Unexpected exception while fetching energy data: {e}", exc_info=True)
 
+        self._store.save()
         _LOGGER.debug(f"[v{VERSION}] Done fetching energy data from Eloverblik")
 
+    def _update_year_data(self):
+        """Update year data (monthly aggregation), fetching only open months.
+        
+        Closed months are marked final in the local store once the data delay
+        has passed, and are never requested again. Only the current month and
+        a previous month that is not final yet are refetched, and nothing is
+        fetched while the cached year data is fresh.
+        """
+        now = datetime.now()
+        year_start = datetime(now.year, 1, 1)
+        cache_key = (self._metering_point, now.year)
+        
+        # Use the cached year data while it is fresh
+        cached_data = _RESPONSE_CACHE.get(CACHE_YEAR_DATA, cache_key)
+        if cached_data is not None:
+            _LOGGER.debug(f"[v{VERSION}] Using cached year data")
+            self._year_data = cached_data
+            return
+        
+        # Start at the first month of the year that is not final yet
+        final_months = self._store.get_final_months()
+        fetch_from = year_start
+        while fetch_from.month < now.month and fetch_from.strftime("%Y-%m") in final_months:
+            fetch_from = fetch_from.replace(month=fetch_from.month + 1)
+        _LOGGER.debug(f"[v{VERSION}] Requesting year data from {fetch_from.date()}")
+        
+        year_data_response = self._api.get_time_series(
+            self._metering_point,
+            fetch_from,
+            now,
+            aggregation="Month"
+        )
+        
+        if year_data_response:
+            # Months that ended before the data delay are final
+            finalize_before = (datetime.utcnow() - MONTH_FINALIZE_DELAY).date()
+            self._store.add_month_periods(iter_periods(year_data_response), finalize_before)
+        else:
+            _LOGGER.warning(f"[v{VERSION}] Failed to get year data from Eloverblik. Data may not be available yet.")
+        
+        # Year total is the sum of this year's months in the store
+        year_prefix = f"{year_start.year:04d}-"
+        monthly_values = [
+            value for month, value in sorted(self._store.get_months().items())
+            if month.startswith(year_prefix)
+        ]
+        if monthly_values:
+            self._year_data = YearData(TimeSeries.from_values(monthly_values, now))
+            # Cache the year data
+            _RESPONSE_CACHE.set(CACHE_YEAR_DATA, cache_key, self._year_data)
+            _LOGGER.debug(f"[v{VERSION}] Year data updated and cached")
+            return
+        
+        # Use cached data if available
+        cached_data = _RESPONSE_CACHE.get(CACHE_YEAR_DATA, cache_key, allow_stale=True)
+        if cached_data is not None:
+            self._year_data = cached_data
+            _LOGGER.debug(f"[v{VERSION}] Using cached year data due to API failure")
+        else:
+            _LOGGER.warning(f"[v{VERSION}] No year data parsed from response. Data may not be available yet.")
+
     def _parse_time_series_response(self, response: Dict) -> Optional[Dict[datetime, TimeSeries]]:
         """Parse time series response into TimeSeries objects.
         
@@ -418,70 +755,128 @@ class HassEloverblik:
             
         return result_dict if result_dict else None
 
-    @Throttle(MIN_TIME_BETWEEN_TARIFF_UPDATES)
     def update_tariffs(self):
-        """Update tariff data from Eloverblik API.
+        """Update tariff data, from the cache if possible.
         
-        Uses caching to avoid unnecessary API calls since tariffs rarely change.
+        Tariffs rarely change, so cached tariffs past their TTL are still
+        served at once and flagged for revalidate(). Only without usable
+        cached tariffs is the API called right away. The cache policy alone
+        decides when tariffs are refreshed.
         """
+        cached_data, revalidate = _RESPONSE_CACHE.get_revalidating(CACHE_TARIFFS, (self._metering_point,))
+        if cached_data is not None:
+            _LOGGER.debug(f"[v{VERSION}] Using cached tariff data{' while refreshing it' if revalidate else ''}")
+            self._tariff_data = cached_data
+            self._revalidate_tariffs = revalidate
+            return
+        self.refresh_tariffs()
+
+    def refresh_tariffs(self):
+        """Fetch tariff data from Eloverblik API and cache it."""
         _LOGGER.debug(f"[v{VERSION}] Fetching tariff data from Eloverblik")
 
+        cache_key = (self._metering_point,)
         try:
-            # Check cache first
-            cache_key = self._metering_point
-            if cache_key in _TARIFF_CACHE:
-                cached_data, cache_time = _TARIFF_CACHE[cache_key]
-                # Use cached data if less than 24 hours old
-                if datetime.now() - cache_time < timedelta(hours=24):
-                    _LOGGER.debug(f"[v{VERSION}] Using cached tariff data")
-                    self._tariff_data = cached_data
-                    return
-            
-            # Check if service is alive first
-            if not self._api.check_isalive():
+            # Fail fast while the service is known to be down
+            if not self._api.is_available():
                 _LOGGER.warning(f"[v{VERSION}] Eloverblik service is not available, skipping tariff update")
-                # Use cached data if available
-                if cache_key in _TARIFF_CACHE:
-                    cached_data, _ = _TARIFF_CACHE[cache_key]
-                    self._tariff_data = cached_data
+                if self._use_stale_tariffs():
                     _LOGGER.debug(f"[v{VERSION}] Using cached tariff data due to service unavailability")
                 return
                 
-            charges_response = self._api.get_charges(self._metering_point)
+            # Shared with the other metering points of the entry
+            charges_response = self._batch.get_charges(self._metering_point)
             
             if charges_response:
                 new_tariff_data = ChargesData(charges_response)
+                if self._tariff_data is not None:
+                    # Keep expired charge versions for pricing older data
+                    new_tariff_data.merge_history(self._tariff_data)
                 # Check if data actually changed
-                if self._tariff_data is None or new_tariff_data.charges != self._tariff_data.charges:
+                if self._tariff_data is None or set(new_tariff_data.versions) != set(self._tariff_data.versions):
                     self._tariff_data = new_tariff_data
-                    # Update cache
-                    _TARIFF_CACHE[cache_key] = (new_tariff_data, datetime.now())
                     _LOGGER.debug(f"[v{VERSION}] Tariff data updated and cached")
                 else:
                     _LOGGER.debug(f"[v{VERSION}] Tariff data unchanged, using existing data")
-                    # Update cache timestamp
-                    _TARIFF_CACHE[cache_key] = (self._tariff_data, datetime.now())
+                # Update cache (and its timestamp)
+                _RESPONSE_CACHE.set(CACHE_TARIFFS, cache_key, self._tariff_data)
             else:
                 _LOGGER.warning(f"[v{VERSION}] Failed to get tariff data from Eloverblik")
-                # Use cached data if available
-                if cache_key in _TARIFF_CACHE:
-                    cached_data, _ = _TARIFF_CACHE[cache_key]
-                    self._tariff_data = cached_data
+                if self._use_stale_tariffs():
                     _LOGGER.debug(f"[v{VERSION}] Using cached tariff data due to API failure")
                 
         except EloverblikAuthError as e:
             _LOGGER.warning(f"[v{VERSION}] Authentication error while fetching tariff data: {e}")
-            # Use cached data if available
-            if cache_key in _TARIFF_CACHE:
-                cached_data, _ = _TARIFF_CACHE[cache_key]
-                self._tariff_data = cached_data
+            self._use_stale_tariffs()
         except EloverblikAPIError as e:
             _LOGGER.warning(f"[v{VERSION}] API error while fetching tariff data: {e}")
-            # Use cached data if available
-            if cache_key in _TARIFF_CACHE:
-                cached_data, _ = _TARIFF_CACHE[cache_key]
-                self._tariff_data = cached_data
+            self._use_stale_tariffs()
         except Exception as e:
             _LOGGER.warning(f"[v{VERSION}] Unexpected exception while fetching tariff data: {e}", exc_info=True)
 
         _LOGGER.debug(f"[v{VERSION}] Done fetching tariff data from Eloverblik")
+
+    def _use_stale_tariffs(self) -> bool:
+        """Fall back to cached tariff data of any age.
+        
+        Returns:
+            True if cached tariff data was found
+        """
+        cached_data = _RESPONSE_CACHE.get(CACHE_TARIFFS, (self._metering_point,), allow_stale=True)
+        if cached_data is None:
+            return False
+        self._tariff_data = cached_data
+        return True
+
+
+class EloverblikCoordinator(DataUpdateCoordinator):
+    """Coordinates data updates for a single metering point.
+
+    All sensors for the metering point listen to this coordinator, so the
+    API is only queried once per interval instead of once per sensor.
+    """
+
+    def __init__(self, hass: HomeAssistant, client: HassEloverblik):
+        """Initialize the coordinator.
+
+        Args:
+            hass: Home Assistant instance
+            client: HassEloverblik client for the metering point
+        """
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN} {client.get_metering_point()}",
+            update_interval=MIN_TIME_BETWEEN_ENERGY_UPDATES,
+        )
+        self.client = client
+        self._revalidate_task: Optional[asyncio.Task] = None
+
+    async def _async_update_data(self) -> HassEloverblik:
+        """Fetch data for the metering point in a single executor job.
+        
+        Cached data served stale is refreshed in a background task, so the
+        update does not wait for it.
+        """
+        await self.hass.async_add_executor_job(self.client.update)
+        if self.client.needs_revalidation and (self._revalidate_task is None or self._revalidate_task.done()):
+            self._revalidate_task = self.hass.async_create_task(self._async_revalidate())
+        return self.client
+
+    async def _async_revalidate(self):
+        """Refresh stale data in the background and push it to the sensors."""
+        await self.hass.async_add_executor_job(self.client.revalidate)
+        self.async_update_listeners()
+
+    async def async_shutdown(self):
+        """Stop updating and wait for a running background refresh.
+        
+        The refresh runs in an executor job, which cannot be cancelled, so
+        the session it uses must stay open until it has finished.
+        """
+        # DataUpdateCoordinator.async_shutdown is missing in older Home Assistant versions
+        shutdown = getattr(super(), "async_shutdown", None)
+        if shutdown is not None:
+            await shutdown()
+        if self._revalidate_task is not None and not self._revalidate_task.done():
+            await asyncio.wait([self._revalidate_task])
@@ -1,11 +1,30 @@
 """Native Eloverblik API client."""
+import asyncio
+import hashlib
+import heapq
+import itertools
+import json
 import logging
+import random
+import threading
 import time
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional, Dict, Any, List, Tuple, Callable, Iterator, AsyncIterator, Awaitable, Hashable
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError, RequestException
 
+from .streaming import (
+    STREAM_CHUNK_SIZE,
+    ExportStreamParser,
+    TimeSeriesPoint,
+    TimeSeriesStreamParser,
+    iter_export_points,
+    iter_time_series_points,
+)
+
 _LOGGER = logging.getLogger(__name__)
 
 # Version for logging
@@ -27,6 +46,68 @@ API_BASE_URL = "https://api.eloverblik.dk/customerapi/api"
 # API version header
 API_VERSION_HEADER = "1.0"
 
+# Connection pool defaults for the shared HTTP session
+# All requests go to the same host, so a single pool is enough
+DEFAULT_POOL_CONNECTIONS = 1
+DEFAULT_POOL_MAXSIZE = 10
+
+# Maximum number of days per time series request (API limit)
+MAX_DAYS_PER_REQUEST = 730
+
+# Time series data is kept for the previous 5 years + current year
+HISTORY_YEARS = 5
+
+# Maximum number of metering points per request (API usage recommendation)
+MAX_METERING_POINTS_PER_REQUEST = 10
+
+# Maximum number of batch requests the async client runs at the same time
+MAX_CONCURRENT_BATCH_REQUESTS = 3
+
+# Resolution of the rows in the CSV time series export by aggregation.
+# For "Actual" the resolution is read from the rows.
+EXPORT_RESOLUTIONS = {"Quarter": "PT15M", "Hour": "PT1H", "Actual": None}
+
+# Request timeouts in seconds
+REQUEST_TIMEOUT = 30
+ISALIVE_TIMEOUT = 10
+
+# Request rate shared by all clients in the process. The API allows about
+# 120 requests per minute per IP; stay below it to leave some headroom
+DEFAULT_REQUESTS_PER_MINUTE = 100
+DEFAULT_REQUEST_BURST = 10
+
+# Request priorities for the scheduler; lower numbers are served first
+PRIORITY_TOKEN = 0
+PRIORITY_ENERGY = 1
+PRIORITY_TARIFFS = 2  # Tariffs and other rarely changing data
+PRIORITY_BACKFILL = 3
+
+# Backoff between retries in seconds: full jitter over an exponential base
+RETRY_BASE_DELAY = 1
+MAX_RETRY_DELAY = 60
+
+# How often async callers recheck their place in the request queue (seconds)
+SCHEDULER_POLL_INTERVAL = 0.05
+
+# Longest time a request waits for its turn in the scheduler (seconds).
+# Covers the longest pause (MAX_RETRY_DELAY) plus a short queue behind it.
+SCHEDULER_MAX_WAIT = 90
+
+# Circuit breaker: consecutive failed requests (503, timeouts, connection
+# errors) that open the circuit, and how long it stays open before an
+# isalive probe is allowed. The open time doubles for every failed probe.
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_OPEN_SECONDS = 60
+CIRCUIT_MAX_OPEN_SECONDS = 900
+
+# How often async callers check whether a shared in-flight call has finished (seconds)
+IN_FLIGHT_POLL_INTERVAL = 0.05
+
+# Circuit breaker states
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
 
 class EloverblikAPIError(Exception):
     """Base exception for Eloverblik API errors."""
@@ -38,82 +119,945 @@ class EloverblikAuthError(EloverblikAPIError):
     pass
 
 
-class EloverblikAPI:
-    """Native Eloverblik API client."""
+class EloverblikUnavailableError(EloverblikAPIError):
+    """Exception for requests refused while the circuit breaker is open."""
+    pass
 
-    def __init__(self, refresh_token: str):
-        """Initialize the Eloverblik API client.
+
+def earliest_time_series_date() -> datetime:
+    """Get the earliest date the API has time series data for.
+    
+    Returns:
+        January 1st, HISTORY_YEARS years before the current year (naive UTC)
+    """
+    return datetime(datetime.utcnow().year - HISTORY_YEARS, 1, 1)
+
+
+def plan_time_series_windows(date_from: datetime, date_to: datetime) -> List[Tuple[datetime, datetime]]:
+    """Split a date range into windows the time series endpoint accepts.
+    
+    Each window covers at most MAX_DAYS_PER_REQUEST days, never has
+    dateFrom equal to dateTo and never reaches today. The range is clamped
+    to the history the API keeps (previous 5 years + current year).
+    
+    Args:
+        date_from: Start date (inclusive)
+        date_to: End date (exclusive)
+        
+    Returns:
+        List of (date_from, date_to) windows in chronological order.
+        Empty if nothing in the range can be requested.
+    """
+    if date_from.tzinfo is not None:
+        date_from = date_from.replace(tzinfo=None)
+    if date_to.tzinfo is not None:
+        date_to = date_to.replace(tzinfo=None)
+    date_from = date_from.replace(hour=0, minute=0, second=0, microsecond=0)
+    date_to = date_to.replace(hour=0, minute=0, second=0, microsecond=0)
+    
+    today_utc = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    # dateTo must be before today (API error 30003)
+    date_to = min(date_to, today_utc - timedelta(days=1))
+    date_from = max(date_from, earliest_time_series_date())
+    
+    windows: List[Tuple[datetime, datetime]] = []
+    window_start = date_from
+    while window_start < date_to:
+        window_end = min(window_start + timedelta(days=MAX_DAYS_PER_REQUEST), date_to)
+        windows.append((window_start, window_end))
+        window_start = window_end
+    
+    return windows
+
+
+def _prepare_date_range(date_from: datetime, date_to: datetime) -> Tuple[str, str]:
+    """Adjust a date range so it is accepted by the API.
+    
+    Args:
+        date_from: Start date
+        date_to: End date
+        
+    Returns:
+        Tuple of (date_from, date_to) formatted as YYYY-MM-DD
+    """
+    # Convert to naive datetime if timezone-aware (API expects dates without timezone)
+    if date_from.tzinfo is not None:
+        date_from = date_from.replace(tzinfo=None)
+    if date_to.tzinfo is not None:
+        date_to = date_to.replace(tzinfo=None)
+    
+    # Ensure we're using date only (no time component)
+    date_from = date_from.replace(hour=0, minute=0, second=0, microsecond=0)
+    date_to = date_to.replace(hour=0, minute=0, second=0, microsecond=0)
+    
+    # Validate dates according to API specification:
+    # - FromDateIsGreaterThanToday = 30000: dateFrom cannot be >= today
+    # - ToDateIsGreaterThanToday = 30003: dateTo cannot be >= today
+    # - ToDateCanNotBeEqualToFromDate = 30002: dateTo cannot equal dateFrom
+    # - FromDateIsGreaterThanToDate = 30001: dateFrom cannot be > dateTo
+    # - Max period: 730 days
+    # - Data available: previous 5 years + current year
+    
+    today_utc = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    # API data is typically 1-3 days delayed, so we should request at least 1 day ago
+    max_date = today_utc - timedelta(days=1)
+    _LOGGER.debug(f"[v{VERSION}] Date validation - Today UTC: {today_utc.date()}, Max allowed: {max_date.date()}, From: {date_from.date()}, To: {date_to.date()}")
+    
+    # Adjust dates that are today or in the future (API error 30000, 30003)
+    if date_from >= today_utc:
+        _LOGGER.debug(f"[v{VERSION}] Date from ({date_from.date()}) is today or in the future (today is {today_utc.date()}). Using {max_date.date()} instead (API error 30000).")
+        date_from = max_date
+    elif date_from > max_date:
+        _LOGGER.debug(f"[v{VERSION}] Date from ({date_from.date()}) is today. Using {max_date.date()} instead (API error 30000).")
+        date_from = max_date
+        
+    if date_to >= today_utc:
+        _LOGGER.debug(f"[v{VERSION}] Date to ({date_to.date()}) is today or in the future (today is {today_utc.date()}). Using {max_date.date()} instead (API error 30003).")
+        date_to = max_date
+    elif date_to > max_date:
+        _LOGGER.debug(f"[v{VERSION}] Date to ({date_to.date()}) is today. Using {max_date.date()} instead (API error 30003).")
+        date_to = max_date
+    
+    # Ensure date_to is not before date_from (API error 30001)
+    if date_to < date_from:
+        _LOGGER.warning(f"[v{VERSION}] Date to ({date_to.date()}) is before date from ({date_from.date()}). Swapping dates (API error 30001).")
+        date_from, date_to = date_to, date_from
+    
+    # Ensure dateFrom != dateTo (API error 30002: ToDateCanNotBeEqualToFromDate)
+    if date_from == date_to:
+        # If they're equal, extend date_to by 1 day
+        date_to = date_from + timedelta(days=1)
+        # But ensure date_to is still not >= today
+        if date_to >= today_utc:
+            # If extending would make it today, go back one day from date_from instead
+            date_to = date_from
+            date_from = date_from - timedelta(days=1)
+            _LOGGER.warning(f"[v{VERSION}] Date from and to were equal ({date_to.date()}). Adjusted to {date_from.date()} to {date_to.date()} (API error 30002).")
+        else:
+            _LOGGER.warning(f"[v{VERSION}] Date from and to were equal ({date_from.date()}). Extended date_to to {date_to.date()} (API error 30002).")
+    
+    # Data is only available for the previous 5 years + current year
+    min_date = earliest_time_series_date()
+    if date_from < min_date:
+        _LOGGER.warning(f"[v{VERSION}] Date from ({date_from.date()}) is older than the available history. Using {min_date.date()} instead.")
+        date_from = min_date
+    
+    # A single request may cover at most MAX_DAYS_PER_REQUEST days.
+    # Longer ranges must be split with plan_time_series_windows().
+    if date_to - date_from > timedelta(days=MAX_DAYS_PER_REQUEST):
+        _LOGGER.warning(f"[v{VERSION}] Date range {date_from.date()} to {date_to.date()} is longer than {MAX_DAYS_PER_REQUEST} days. Truncating to {MAX_DAYS_PER_REQUEST} days.")
+        date_to = date_from + timedelta(days=MAX_DAYS_PER_REQUEST)
+    
+    date_from_str = date_from.strftime("%Y-%m-%d")
+    date_to_str = date_to.strftime("%Y-%m-%d")
+    
+    return date_from_str, date_to_str
+
+
+def _validate_metering_point(metering_point: str):
+    """Validate metering point ID format (should be 18 alphanumeric characters).
+    
+    Raises:
+        EloverblikAPIError: If the ID is malformed
+    """
+    if not metering_point or not isinstance(metering_point, str) or len(metering_point) != 18 or not metering_point.isalnum():
+        _LOGGER.error(f"[v{VERSION}] Invalid metering point ID format: {metering_point}. Expected 18 alphanumeric characters.")
+        raise EloverblikAPIError(f"Invalid metering point ID format: {metering_point}")
+
+
+def _metering_points_body(metering_points: List[str]) -> Dict[str, Any]:
+    """Build the request body used by the metering point endpoints."""
+    return {
+        "meteringPoints": {
+            "meteringPoint": list(metering_points)
+        }
+    }
+
+
+def _chunk_metering_points(metering_points: List[str]) -> List[List[str]]:
+    """Split metering point IDs into chunks of at most MAX_METERING_POINTS_PER_REQUEST."""
+    return [
+        metering_points[i:i + MAX_METERING_POINTS_PER_REQUEST]
+        for i in range(0, len(metering_points), MAX_METERING_POINTS_PER_REQUEST)
+    ]
+
+
+def _split_batch_response(response: Dict[str, Any], metering_points: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Split a multi metering point response into one response per metering point.
+    
+    Each result item is wrapped as {"result": [item]}, which is the same shape as
+    the response for a single metering point, so the existing parsers apply.
+    
+    Args:
+        response: Raw API response with a result item per metering point
+        metering_points: Metering point IDs in the order they were requested
+        
+    Returns:
+        Dictionary mapping metering point ID to its response
+    """
+    split: Dict[str, Dict[str, Any]] = {}
+    if not isinstance(response, dict):
+        return split
+    
+    for idx, item in enumerate(response.get("result") or []):
+        if not isinstance(item, dict):
+            continue
+        # The API sets "id" to the requested metering point ID
+        metering_point = item.get("id")
+        if not metering_point:
+            result = item.get("result")
+            if isinstance(result, dict):
+                metering_point = result.get("meteringPointId")
+        if not metering_point and idx < len(metering_points):
+            # Fall back to request order
+            metering_point = metering_points[idx]
+        if metering_point:
+            split[metering_point] = {"result": [item]}
+    
+    return split
+
+
+def create_session(
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE
+) -> requests.Session:
+    """Create a connection-pooled HTTP session for the Eloverblik API.
+    
+    Connections are kept alive and reused between calls, so only the first
+    request pays for the TCP and TLS handshake.
+    
+    Args:
+        pool_connections: Number of host pools to cache
+        pool_maxsize: Maximum number of connections kept per host
+        
+    Returns:
+        Configured requests session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds or as an HTTP date.
+    
+    Returns:
+        Seconds to wait, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _retry_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+    """Get the delay before retrying a failed request.
+    
+    Uses full jitter (a random delay between 0 and the exponential backoff),
+    so clients that failed together do not retry together. A Retry-After
+    from the API is honoured, with a little jitter on top.
+    
+    Args:
+        attempt: Zero-based number of the failed attempt
+        retry_after: Seconds the API asked to wait, if any
+        
+    Returns:
+        Seconds to wait
+    """
+    if retry_after is not None:
+        return retry_after + random.uniform(0, RETRY_BASE_DELAY)
+    return random.uniform(0, min(MAX_RETRY_DELAY, RETRY_BASE_DELAY * 2 ** (attempt + 1)))
+
+
+class RequestScheduler:
+    """Rate limiter and priority queue for the API requests of a process.
+    
+    Every request takes a token from a token bucket that refills at a fixed
+    rate. While requests are queued, the next token goes to the highest
+    priority (lowest number); requests of equal priority are served in
+    arrival order. A 429 pauses the bucket for all clients, so they back off
+    together instead of each retrying into the limit.
+    
+    The scheduler is safe to use from executor threads and asyncio tasks at
+    the same time.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float = DEFAULT_REQUESTS_PER_MINUTE,
+        burst: int = DEFAULT_REQUEST_BURST
+    ):
+        """Initialize the scheduler.
+        
+        Args:
+            requests_per_minute: Sustained request rate
+            burst: Number of requests that may be made back to back
+        """
+        self._changed = threading.Condition(threading.Lock())
+        self._queue: List[Tuple[int, int]] = []
+        self._sequence = itertools.count()
+        self._rate = requests_per_minute / 60
+        self._burst = max(1, burst)
+        self._tokens = float(self._burst)
+        self._updated = time.monotonic()
+
+    def configure(self, requests_per_minute: float, burst: int):
+        """Change the request rate.
+        
+        Args:
+            requests_per_minute: Sustained request rate
+            burst: Number of requests that may be made back to back
+        """
+        with self._changed:
+            self._refill(time.monotonic())
+            self._rate = requests_per_minute / 60
+            self._burst = max(1, burst)
+            self._tokens = min(self._tokens, self._burst)
+            self._changed.notify_all()
+
+    def pause(self, seconds: float):
+        """Hold back all requests, e.g. after the API answered 429.
+        
+        The bucket starts empty after the pause, so the queued requests
+        resume at the sustained rate instead of in one burst. The pause is
+        capped at MAX_RETRY_DELAY, so a long Retry-After from one response
+        cannot stall every client for its full length.
+        
+        Args:
+            seconds: How long to pause
+        """
+        with self._changed:
+            resume_at = time.monotonic() + min(seconds, MAX_RETRY_DELAY)
+            if resume_at > self._updated:
+                self._tokens = 0.0
+                self._updated = resume_at
+            self._changed.notify_all()
+
+    def acquire(self, priority: int = PRIORITY_ENERGY, timeout: float = SCHEDULER_MAX_WAIT):
+        """Wait until a request may be made (blocking).
+        
+        Args:
+            priority: Request priority, one of the PRIORITY_* constants
+            timeout: Longest time to wait, in seconds
+            
+        Raises:
+            EloverblikAPIError: If no request slot was free within the timeout
+        """
+        ticket = (priority, next(self._sequence))
+        deadline = time.monotonic() + timeout
+        with self._changed:
+            heapq.heappush(self._queue, ticket)
+            self._changed.notify_all()
+            try:
+                while True:
+                    wait = self._take(ticket)
+                    if wait == 0:
+                        return
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise EloverblikAPIError(f"No request slot free within {timeout:g} seconds")
+                    self._changed.wait(remaining if wait is None else min(wait, remaining))
+            finally:
+                self._discard(ticket)
+
+    async def async_acquire(self, priority: int = PRIORITY_ENERGY, timeout: float = SCHEDULER_MAX_WAIT):
+        """Wait until a request may be made (non-blocking).
+        
+        Args:
+            priority: Request priority, one of the PRIORITY_* constants
+            timeout: Longest time to wait, in seconds
+            
+        Raises:
+            EloverblikAPIError: If no request slot was free within the timeout
+        """
+        ticket = (priority, next(self._sequence))
+        deadline = time.monotonic() + timeout
+        with self._changed:
+            heapq.heappush(self._queue, ticket)
+            self._changed.notify_all()
+        try:
+            while True:
+                with self._changed:
+                    wait = self._take(ticket)
+                if wait == 0:
+                    return
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise EloverblikAPIError(f"No request slot free within {timeout:g} seconds")
+                await asyncio.sleep(min(SCHEDULER_POLL_INTERVAL if wait is None else wait, remaining))
+        finally:
+            with self._changed:
+                self._discard(ticket)
+
+    def _refill(self, now: float):
+        """Add the tokens earned since the last update. Call with the lock held."""
+        if now > self._updated:
+            self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+
+    def _take(self, ticket: Tuple[int, int]) -> Optional[float]:
+        """Take a token for a queued request. Call with the lock held.
+        
+        Returns:
+            0 if the request may be made, the seconds until the next token if
+            the request is first in line, or None if other requests go first
+        """
+        if self._queue[0] != ticket:
+            return None
+        now = time.monotonic()
+        self._refill(now)
+        if now < self._updated:
+            # Paused
+            return self._updated - now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            heapq.heappop(self._queue)
+            self._changed.notify_all()
+            return 0
+        return (1 - self._tokens) / self._rate
+
+    def _discard(self, ticket: Tuple[int, int]):
+        """Remove a request that stopped waiting. Call with the lock held."""
+        if ticket in self._queue:
+            self._queue.remove(ticket)
+            heapq.heapify(self._queue)
+            self._changed.notify_all()
+
+
+# Shared by all clients, so the rate limit holds across config entries
+_REQUEST_SCHEDULER = RequestScheduler()
+
+
+def get_request_scheduler() -> RequestScheduler:
+    """Get the request scheduler shared by all clients in the process."""
+    return _REQUEST_SCHEDULER
+
+
+class CircuitBreaker:
+    """Circuit breaker for the Eloverblik API, fed by real request outcomes.
+    
+    Closed: requests are made as usual. After CIRCUIT_FAILURE_THRESHOLD
+    consecutive failures the circuit opens and requests fail at once. When
+    the open time has passed, the circuit is half-open: a single caller
+    probes /isalive while the others keep failing fast. A successful probe
+    closes the circuit; a failed one opens it again for twice as long.
+    
+    The breaker is safe to use from executor threads and asyncio tasks at
+    the same time.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        open_seconds: float = CIRCUIT_OPEN_SECONDS,
+        max_open_seconds: float = CIRCUIT_MAX_OPEN_SECONDS
+    ):
+        """Initialize the circuit breaker.
+        
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            open_seconds: Time the circuit stays open before the first probe
+            max_open_seconds: Upper bound for the open time
+        """
+        self._lock = threading.Lock()
+        self._failure_threshold = max(1, failure_threshold)
+        self._open_seconds = open_seconds
+        self._max_open_seconds = max_open_seconds
+        self._state = CIRCUIT_CLOSED
+        self._failures = 0
+        self._current_open_seconds = open_seconds
+        self._opened_at = 0.0
+
+    @property
+    def state(self) -> str:
+        """Current state, one of the CIRCUIT_* constants."""
+        return self._state
+
+    def before_request(self) -> str:
+        """Check whether a request may be made.
+        
+        Returns:
+            CIRCUIT_CLOSED if the request may be made, CIRCUIT_OPEN if it must
+            fail fast, or CIRCUIT_HALF_OPEN if the caller must probe the
+            service and report the result with record_success() or
+            record_failure()
+        """
+        with self._lock:
+            if self._state == CIRCUIT_CLOSED:
+                return CIRCUIT_CLOSED
+            if self._state == CIRCUIT_OPEN and time.monotonic() >= self._opened_at + self._current_open_seconds:
+                self._state = CIRCUIT_HALF_OPEN
+                return CIRCUIT_HALF_OPEN
+            # Open, or another caller is probing
+            return CIRCUIT_OPEN
+
+    def record_success(self):
+        """Record a request or probe that reached a healthy service."""
+        with self._lock:
+            if self._state != CIRCUIT_CLOSED:
+                _LOGGER.info(f"[v{VERSION}] Eloverblik service is available again")
+            self._state = CIRCUIT_CLOSED
+            self._failures = 0
+            self._current_open_seconds = self._open_seconds
+
+    def record_failure(self):
+        """Record a failed request or probe."""
+        with self._lock:
+            if self._state == CIRCUIT_HALF_OPEN:
+                self._current_open_seconds = min(self._current_open_seconds * 2, self._max_open_seconds)
+                self._open("probe failed")
+            elif self._state == CIRCUIT_CLOSED:
+                self._failures += 1
+                if self._failures >= self._failure_threshold:
+                    self._open(f"{self._failures} consecutive failed requests")
+
+    def _open(self, reason: str):
+        """Open the circuit. Call with the lock held."""
+        self._state = CIRCUIT_OPEN
+        self._opened_at = time.monotonic()
+        _LOGGER.warning(f"[v{VERSION}] Eloverblik service unavailable ({reason}). Pausing requests for {self._current_open_seconds:.0f} seconds")
+
+
+# Shared by all clients, since they all talk to the same service
+_CIRCUIT_BREAKER = CircuitBreaker()
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    """Get the circuit breaker shared by all clients in the process."""
+    return _CIRCUIT_BREAKER
+
+
+class _InFlightCall:
+    """A call shared by the callers of a SingleFlight key."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+    def get(self) -> Any:
+        """Get the result of the finished call, or raise its exception."""
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class SingleFlight:
+    """Coalesces identical calls that are in flight at the same time.
+    
+    The first caller for a key makes the call. Callers arriving with the
+    same key while it runs wait for it and get the same result or
+    exception, so they all share one HTTP request. Results are shared
+    objects and must not be modified by the callers. Nothing is cached
+    once the call has finished.
+    
+    Safe to use from executor threads and asyncio tasks at the same time.
+    """
+
+    def __init__(self):
+        """Initialize the single-flight group."""
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _InFlightCall] = {}
+
+    def _join(self, key: Hashable) -> Tuple[_InFlightCall, bool]:
+        """Get the in-flight call for a key, starting one if there is none.
+        
+        Returns:
+            (call, True if the caller must make the call)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                return call, False
+            call = self._calls[key] = _InFlightCall()
+            return call, True
+
+    def _finish(self, key: Hashable, call: _InFlightCall):
+        """Publish the outcome of a call to the waiting callers."""
+        with self._lock:
+            del self._calls[key]
+        call.done.set()
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """Make a call, or wait for the identical call already in flight (blocking).
+        
+        Args:
+            key: Identifies identical calls
+            func: Makes the call
+            
+        Returns:
+            Result of the call
+        """
+        call, leader = self._join(key)
+        if not leader:
+            call.done.wait()
+            return call.get()
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            self._finish(key, call)
+        return call.result
+
+    async def async_do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Make a call, or wait for the identical call already in flight (non-blocking).
+        
+        Args:
+            key: Identifies identical calls
+            func: Returns the awaitable making the call
+            
+        Returns:
+            Result of the call
+        """
+        call, leader = self._join(key)
+        if not leader:
+            while not call.done.is_set():
+                await asyncio.sleep(IN_FLIGHT_POLL_INTERVAL)
+            return call.get()
+        try:
+            call.result = await func()
+        except asyncio.CancelledError:
+            # Only the leader was cancelled; the others get an API error
+            call.error = EloverblikAPIError("Shared request was cancelled")
+            raise
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            self._finish(key, call)
+        return call.result
+
+
+# Shared by all clients, so identical requests from different config
+# entries and reloads are coalesced too
+_IN_FLIGHT_REQUESTS = SingleFlight()
+
+
+def _request_key(token_manager: "EloverblikTokenManager", method: str, endpoint: str, data: Optional[Dict[str, Any]], params: Optional[Dict[str, Any]]) -> Hashable:
+    """Build the single-flight key of a request.
+    
+    The endpoint path holds the date range and aggregation, and the body
+    holds the metering points. The refresh token is part of the key, so
+    accounts never share responses.
+    """
+    return (
+        token_manager.refresh_token_fingerprint,
+        method,
+        endpoint,
+        json.dumps(data, sort_keys=True),
+        json.dumps(params, sort_keys=True),
+    )
+
+
+class EloverblikTokenManager:
+    """Access token provider shared by all clients of one refresh token.
+    
+    The token endpoint is the most heavily rate limited call in the API
+    (2 calls per minute), so all clients of a refresh token get their access
+    token from one manager. The manager is safe to use from executor threads
+    and asyncio tasks at the same time: concurrent callers wait for a single
+    in-flight refresh instead of each requesting a new token.
+    """
+
+    def __init__(
+        self,
+        refresh_token: str,
+        on_token_refreshed: Optional[Callable[[str, datetime], None]] = None,
+        scheduler: Optional[RequestScheduler] = None
+    ):
+        """Initialize the token manager.
         
         Args:
             refresh_token: Refresh token from eloverblik.dk portal
+            on_token_refreshed: Called with the new access token and its expiry
+                after every refresh. May be called from any thread.
+            scheduler: Request scheduler for the token requests. Defaults to
+                the scheduler shared by the process.
         """
         self._refresh_token = refresh_token
+        self._on_token_refreshed = on_token_refreshed
+        self._scheduler = scheduler if scheduler is not None else get_request_scheduler()
         self._access_token: Optional[str] = None
         self._token_expires_at: Optional[datetime] = None
+        # Guards the token state; only ever held briefly
+        self._state_lock = threading.Lock()
+        # Held while a refresh is in flight, by threads and tasks alike
+        self._refresh_lock = threading.Lock()
+        # Serializes tasks so only one of them waits for the refresh lock
+        self._async_lock: Optional[asyncio.Lock] = None
 
-    def _get_access_token(self) -> str:
-        """Get access token, refreshing if necessary.
+    def _get_valid_token(self) -> Optional[str]:
+        """Get the current access token if it is still valid."""
+        with self._state_lock:
+            access_token = self._access_token
+            expires_at = self._token_expires_at
+        if access_token and expires_at:
+            if datetime.now() < expires_at - timedelta(minutes=5):
+                return access_token
+        return None
+
+    def _set_token(self, access_token: str):
+        """Store a newly issued access token."""
+        with self._state_lock:
+            # Token is valid for 24 hours, set expiry to 23 hours to be safe
+            self._token_expires_at = datetime.now() + timedelta(hours=23)
+            self._access_token = access_token
+        _LOGGER.debug(f"[v{VERSION}] Obtained new access token, valid until {self._token_expires_at}")
+        if self._on_token_refreshed is not None:
+            try:
+                self._on_token_refreshed(access_token, self._token_expires_at)
+            except Exception as e:
+                _LOGGER.debug(f"[v{VERSION}] Token refresh callback failed: {e}")
+
+    @property
+    def refresh_token_fingerprint(self) -> str:
+        """Short fingerprint of the refresh token, used to match cached access tokens."""
+        return hashlib.sha256(self._refresh_token.encode()).hexdigest()[:16]
+
+    def restore_token(self, access_token: Any, expires_at: Any) -> bool:
+        """Restore a previously issued access token, e.g. from disk.
+        
+        The token is only used if it is well-formed and not about to expire;
+        otherwise the next caller refreshes it as usual.
+        
+        Args:
+            access_token: Cached access token
+            expires_at: Cached expiry as a POSIX timestamp
+            
+        Returns:
+            True if the token was restored, False if it was rejected
+        """
+        if not isinstance(access_token, str) or not access_token:
+            return False
+        try:
+            expires = datetime.fromtimestamp(float(expires_at))
+        except (TypeError, ValueError, OverflowError, OSError):
+            return False
+        # Never trust a cached expiry beyond the token's 24 hour lifetime
+        if expires > datetime.now() + timedelta(hours=24):
+            return False
+        if datetime.now() >= expires - timedelta(minutes=5):
+            return False
+        with self._state_lock:
+            self._access_token = access_token
+            self._token_expires_at = expires
+        return True
+
+    def invalidate(self, access_token: str):
+        """Invalidate an access token after the API rejected it.
+        
+        Only the rejected token is dropped. If another caller has already
+        replaced it, the new token is kept, so a burst of 401s from many
+        clients leads to a single refresh.
+        
+        Args:
+            access_token: The token that was rejected
+        """
+        with self._state_lock:
+            if self._access_token == access_token:
+                self._access_token = None
+                self._token_expires_at = None
+
+    def get_token(self, session: requests.Session) -> str:
+        """Get access token, refreshing if necessary (blocking).
         
+        Args:
+            session: HTTP session used for the token request
+            
         Returns:
             Access token string
             
         Raises:
             EloverblikAuthError: If token cannot be obtained
         """
-        # Check if we have a valid token
-        if self._access_token and self._token_expires_at:
-            if datetime.now() < self._token_expires_at - timedelta(minutes=5):
-                return self._access_token
+        access_token = self._get_valid_token()
+        if access_token:
+            return access_token
 
-        # Get new token
-        try:
-            response = requests.get(
-                f"{API_BASE_URL}/token",
-                headers={
-                    "Authorization": f"Bearer {self._refresh_token}",
-                    "api-version": API_VERSION_HEADER
-                },
-                timeout=30
-            )
-            response.raise_for_status()
-            
-            result = response.json()
-            if "result" in result:
-                self._access_token = result["result"]
-                # Token is valid for 24 hours, set expiry to 23 hours to be safe
-                self._token_expires_at = datetime.now() + timedelta(hours=23)
-                return self._access_token
-            else:
-                raise EloverblikAuthError("Invalid token response format")
+        with self._refresh_lock:
+            # Another caller may have refreshed while we waited
+            access_token = self._get_valid_token()
+            if access_token:
+                return access_token
+            
+            self._scheduler.acquire(PRIORITY_TOKEN)
+            try:
+                response = session.get(
+                    f"{API_BASE_URL}/token",
+                    headers={
+                        "Authorization": f"Bearer {self._refresh_token}",
+                        "api-version": API_VERSION_HEADER
+                    },
+                    timeout=REQUEST_TIMEOUT
+                )
+                response.raise_for_status()
                 
-        except HTTPError as e:
-            if e.response.status_code in (401, 403):
-                raise EloverblikAuthError("Invalid or expired refresh token") from e
-            raise EloverblikAPIError(f"Failed to get access token: {e}") from e
-        except RequestException as e:
-            raise EloverblikAPIError(f"Request error getting token: {e}") from e
+                result = response.json()
+                if "result" in result:
+                    self._set_token(result["result"])
+                    return result["result"]
+                else:
+                    raise EloverblikAuthError("Invalid token response format")
+                    
+            except HTTPError as e:
+                if e.response.status_code in (401, 403):
+                    raise EloverblikAuthError("Invalid or expired refresh token") from e
+                raise EloverblikAPIError(f"Failed to get access token: {e}") from e
+            except RequestException as e:
+                raise EloverblikAPIError(f"Request error getting token: {e}") from e
+
+    async def async_get_token(self, session: aiohttp.ClientSession) -> str:
+        """Get access token, refreshing if necessary (non-blocking).
+        
+        Args:
+            session: aiohttp session used for the token request
+            
+        Returns:
+            Access token string
+            
+        Raises:
+            EloverblikAuthError: If token cannot be obtained
+        """
+        access_token = self._get_valid_token()
+        if access_token:
+            return access_token
+
+        if self._async_lock is None:
+            self._async_lock = asyncio.Lock()
+
+        async with self._async_lock:
+            # Wait without blocking the event loop if a thread is refreshing
+            while not self._refresh_lock.acquire(blocking=False):
+                await asyncio.sleep(0.1)
+            try:
+                access_token = self._get_valid_token()
+                if access_token:
+                    return access_token
+                
+                await self._scheduler.async_acquire(PRIORITY_TOKEN)
+                try:
+                    async with session.get(
+                        f"{API_BASE_URL}/token",
+                        headers={
+                            "Authorization": f"Bearer {self._refresh_token}",
+                            "api-version": API_VERSION_HEADER
+                        },
+                        timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+                    ) as response:
+                        if response.status in (401, 403):
+                            raise EloverblikAuthError("Invalid or expired refresh token")
+                        response.raise_for_status()
+                        result = await response.json(content_type=None)
+
+                    if "result" in result:
+                        self._set_token(result["result"])
+                        return result["result"]
+                    else:
+                        raise EloverblikAuthError("Invalid token response format")
+
+                except aiohttp.ClientResponseError as e:
+                    raise EloverblikAPIError(f"Failed to get access token: {e}") from e
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    raise EloverblikAPIError(f"Request error getting token: {e}") from e
+            finally:
+                self._refresh_lock.release()
+
+
+class EloverblikAPI:
+    """Native Eloverblik API client."""
+
+    def __init__(
+        self,
+        refresh_token: str,
+        session: Optional[requests.Session] = None,
+        token_manager: Optional["EloverblikTokenManager"] = None,
+        scheduler: Optional[RequestScheduler] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None
+    ):
+        """Initialize the Eloverblik API client.
+        
+        Args:
+            refresh_token: Refresh token from eloverblik.dk portal
+            session: Shared HTTP session. If not given, the client creates
+                and owns its own session.
+            token_manager: Shared access token manager for the refresh token.
+                If not given, the client creates its own.
+            scheduler: Request scheduler. Defaults to the scheduler shared by
+                the process.
+            circuit_breaker: Circuit breaker. Defaults to the breaker shared
+                by the process.
+        """
+        self._scheduler = scheduler if scheduler is not None else get_request_scheduler()
+        self._circuit_breaker = circuit_breaker if circuit_breaker is not None else get_circuit_breaker()
+        self._token_manager = token_manager if token_manager is not None else EloverblikTokenManager(refresh_token, scheduler=self._scheduler)
+        self._owns_session = session is None
+        self._session = session if session is not None else create_session()
+
+    def close(self):
+        """Close the HTTP session if it is owned by this client.
+        
+        Shared sessions are closed by their owner.
+        """
+        if self._owns_session:
+            self._session.close()
+
+    def _get_access_token(self) -> str:
+        """Get access token from the shared token manager.
+        
+        Returns:
+            Access token string
+            
+        Raises:
+            EloverblikAuthError: If token cannot be obtained
+        """
+        return self._token_manager.get_token(self._session)
 
     def _make_request(
         self,
         method: str,
         endpoint: str,
         data: Optional[Dict[str, Any]] = None,
-        params: Optional[Dict[str, Any]] = None
+        params: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
+        priority: int = PRIORITY_ENERGY
     ) -> requests.Response:
         """Make an authenticated API request.
         
+        Every attempt waits for its turn in the request scheduler, and is
+        refused at once while the circuit breaker is open.
+        
         Args:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint path
             data: Request body data
             params: URL parameters
+            stream: If True, the body is not read; the caller must read it
+                and close the response
+            priority: Scheduler priority, one of the PRIORITY_* constants
             
         Returns:
             Response object
             
         Raises:
+            EloverblikUnavailableError: If the circuit breaker is open
             EloverblikAPIError: If request fails
         """
+        self._raise_if_unavailable()
         access_token = self._get_access_token()
         url = f"{API_BASE_URL}{endpoint}"
         
@@ -124,19 +1068,23 @@ class EloverblikAPI:
         }
         
         max_retries = 3
-        retry_delay = 1  # Start with 1 second
         
         for attempt in range(max_retries):
+            if attempt > 0:
+                self._raise_if_unavailable()
+            self._scheduler.acquire(priority)
             try:
-                response = requests.request(
+                response = self._session.request(
                     method=method,
                     url=url,
                     headers=headers,
                     json=data,
                     params=params,
-                    timeout=30  # 30 second timeout for API calls
+                    timeout=REQUEST_TIMEOUT,
+                    stream=stream
                 )
                 response.raise_for_status()
+                self._circuit_breaker.record_success()
                 return response
             except HTTPError as e:
                 status_code = e.response.status_code
@@ -144,7 +1092,7 @@ class EloverblikAPI:
                 # Handle 401 - token might be expired, try refreshing once
                 if status_code == 401:
                     if attempt == 0:  # Only retry once for 401
-                        self._access_token = None
+                        self._token_manager.invalidate(access_token)
                         access_token = self._get_access_token()
                         headers["Authorization"] = f"Bearer {access_token}"
                         continue
@@ -152,18 +1100,21 @@ class EloverblikAPI:
                 
                 # Handle 429 - Too Many Requests
                 elif status_code == 429:
-                    if attempt < max_retries - 1:
-                        wait_time = retry_delay * (2 ** attempt)  # Exponential backoff
-                        _LOGGER.warning(f"[v{VERSION}] Rate limited (429). Waiting {wait_time} seconds before retry {attempt + 1}/{max_retries}")
-                        time.sleep(wait_time)
+                    wait_time = _retry_delay(attempt, _parse_retry_after(e.response.headers.get("Retry-After")))
+                    # Hold back every client (at most MAX_RETRY_DELAY); the
+                    # retry waits in the scheduler
+                    self._scheduler.pause(wait_time)
+                    if attempt < max_retries - 1 and wait_time <= MAX_RETRY_DELAY:
+                        _LOGGER.warning(f"[v{VERSION}] Rate limited (429). Waiting {wait_time:.1f} seconds before retry {attempt + 1}/{max_retries}")
                         continue
                     raise EloverblikAPIError("Rate limit exceeded. Please try again later.") from e
                 
                 # Handle 503 - Service Unavailable
                 elif status_code == 503:
+                    self._circuit_breaker.record_failure()
                     if attempt < max_retries - 1:
-                        wait_time = retry_delay * (2 ** attempt)  # Exponential backoff
-                        _LOGGER.warning(f"[v{VERSION}] Service unavailable (503). Waiting {wait_time} seconds before retry {attempt + 1}/{max_retries}")
+                        wait_time = _retry_delay(attempt)
+                        _LOGGER.warning(f"[v{VERSION}] Service unavailable (503). Waiting {wait_time:.1f} seconds before retry {attempt + 1}/{max_retries}")
                         time.sleep(wait_time)
                         continue
                     raise EloverblikAPIError("Service is temporarily unavailable. Please try again later.") from e
@@ -188,9 +1139,10 @@ class EloverblikAPI:
                     raise EloverblikAPIError(f"API request failed with status {status_code}: {e}") from e
                 
             except RequestException as e:
+                self._circuit_breaker.record_failure()
                 if attempt < max_retries - 1:
-                    wait_time = retry_delay * (2 ** attempt)  # Exponential backoff
-                    _LOGGER.warning(f"[v{VERSION}] Request error: {e}. Retrying in {wait_time} seconds ({attempt + 1}/{max_retries})")
+                    wait_time = _retry_delay(attempt)
+                    _LOGGER.warning(f"[v{VERSION}] Request error: {e}. Retrying in {wait_time:.1f} seconds ({attempt + 1}/{max_retries})")
                     time.sleep(wait_time)
                     continue
                 raise EloverblikAPIError(f"Request error after {max_retries} attempts: {e}") from e
@@ -198,6 +1150,64 @@ class EloverblikAPI:
         # Should never reach here, but just in case
         raise EloverblikAPIError(f"Request failed after {max_retries} attempts")
 
+    def _request_json(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        priority: int = PRIORITY_ENERGY
+    ) -> Any:
+        """Make an API request and parse the JSON body.
+        
+        Identical requests in flight at the same time share one HTTP call and
+        its parsed body, see SingleFlight.
+        
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            data: Request body data
+            params: URL parameters
+            priority: Scheduler priority, one of the PRIORITY_* constants
+            
+        Returns:
+            Parsed JSON response body
+            
+        Raises:
+            EloverblikAPIError: If request fails
+        """
+        return _IN_FLIGHT_REQUESTS.do(
+            _request_key(self._token_manager, method, endpoint, data, params),
+            lambda: self._make_request(method, endpoint, data=data, params=params, priority=priority).json()
+        )
+
+    def is_available(self) -> bool:
+        """Check if requests to the API may be made, according to the circuit breaker.
+        
+        Only costs a round-trip when the circuit is half-open, in which case
+        this call probes /isalive and reports the result to the breaker.
+        
+        Returns:
+            True if requests may be made, False while the service is down
+        """
+        state = self._circuit_breaker.before_request()
+        if state == CIRCUIT_HALF_OPEN:
+            if self.check_isalive():
+                self._circuit_breaker.record_success()
+                return True
+            self._circuit_breaker.record_failure()
+            return False
+        return state == CIRCUIT_CLOSED
+
+    def _raise_if_unavailable(self):
+        """Fail fast while the circuit breaker is open.
+        
+        Raises:
+            EloverblikUnavailableError: If the service is unavailable
+        """
+        if not self.is_available():
+            raise EloverblikUnavailableError("Eloverblik service is unavailable")
+
     def check_isalive(self) -> bool:
         """Check if Eloverblik API service is available.
         
@@ -205,10 +1215,10 @@ class EloverblikAPI:
             True if service is available, False otherwise
         """
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{API_BASE_URL}/isalive",
                 headers={"api-version": API_VERSION_HEADER},
-                timeout=10
+                timeout=ISALIVE_TIMEOUT
             )
             if response.status_code == 200:
                 result = response.json()
@@ -243,101 +1253,145 @@ class EloverblikAPI:
         Returns:
             Parsed time series data or None if error
         """
-        # Convert to naive datetime if timezone-aware (API expects dates without timezone)
-        if date_from.tzinfo is not None:
-            date_from = date_from.replace(tzinfo=None)
-        if date_to.tzinfo is not None:
-            date_to = date_to.replace(tzinfo=None)
-        
-        # Ensure we're using date only (no time component)
-        date_from = date_from.replace(hour=0, minute=0, second=0, microsecond=0)
-        date_to = date_to.replace(hour=0, minute=0, second=0, microsecond=0)
-        
-        # Validate dates according to API specification:
-        # - FromDateIsGreaterThanToday = 30000: dateFrom cannot be >= today
-        # - ToDateIsGreaterThanToday = 30003: dateTo cannot be >= today
-        # - ToDateCanNotBeEqualToFromDate = 30002: dateTo cannot equal dateFrom
-        # - FromDateIsGreaterThanToDate = 30001: dateFrom cannot be > dateTo
-        # - Max period: 730 days
-        # - Data available: previous 5 years + current year
-        
-        today_utc = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-        # API data is typically 1-3 days delayed, so we should request at least 1 day ago
-        max_date = today_utc - timedelta(days=1)
-        _LOGGER.debug(f"[v{VERSION}] Date validation - Today UTC: {today_utc.date()}, Max allowed: {max_date.date()}, From: {date_from.date()}, To: {date_to.date()}")
-        
-        # Adjust dates that are today or in the future (API error 30000, 30003)
-        if date_from >= today_utc:
-            _LOGGER.warning(f"[v{VERSION}] Date from ({date_from.date()}) is today or in the future (today is {today_utc.date()}). Using {max_date.date()} instead (API error 30000).")
-            date_from = max_date
-        elif date_from > max_date:
-            _LOGGER.warning(f"[v{VERSION}] Date from ({date_from.date()}) is today. Using {max_date.date()} instead (API error 30000).")
-            date_from = max_date
-            
-        if date_to >= today_utc:
-            _LOGGER.warning(f"[v{VERSION}] Date to ({date_to.date()}) is today or in the future (today is {today_utc.date()}). Using {max_date.date()} instead (API error 30003).")
-            date_to = max_date
-        elif date_to > max_date:
-            _LOGGER.warning(f"[v{VERSION}] Date to ({date_to.date()}) is today. Using {max_date.date()} instead (API error 30003).")
-            date_to = max_date
-        
-        # Ensure date_to is not before date_from (API error 30001)
-        if date_to < date_from:
-            _LOGGER.warning(f"[v{VERSION}] Date to ({date_to.date()}) is before date from ({date_from.date()}). Swapping dates (API error 30001).")
-            date_from, date_to = date_to, date_from
-        
-        # Ensure dateFrom != dateTo (API error 30002: ToDateCanNotBeEqualToFromDate)
-        if date_from == date_to:
-            # If they're equal, extend date_to by 1 day
-            date_to = date_from + timedelta(days=1)
-            # But ensure date_to is still not >= today
-            if date_to >= today_utc:
-                # If extending would make it today, go back one day from date_from instead
-                date_from = date_from - timedelta(days=1)
-                _LOGGER.warning(f"[v{VERSION}] Date from and to were equal ({date_to.date()}). Adjusted to {date_from.date()} to {date_to.date()} (API error 30002).")
-            else:
-                _LOGGER.warning(f"[v{VERSION}] Date from and to were equal ({date_from.date()}). Extended date_to to {date_to.date()} (API error 30002).")
-        
-        # Additional safety: Ensure dates are not too far in the past (API may have limits)
-        # API should support at least 1 year, but we'll allow up to 2 years for safety
-        max_past_days = 730  # 2 years
-        min_date = today_utc - timedelta(days=max_past_days)
-        if date_from < min_date:
-            _LOGGER.warning(f"[v{VERSION}] Date from ({date_from.date()}) is too far in the past (more than {max_past_days} days). Using {min_date.date()} instead.")
-            date_from = min_date
-        
-        date_from_str = date_from.strftime("%Y-%m-%d")
-        date_to_str = date_to.strftime("%Y-%m-%d")
-        
-        _LOGGER.warning(f"[v{VERSION}] Requesting time series: {date_from_str} to {date_to_str} ({aggregation}) for metering point {metering_point}")
-        
-        # Validate metering point ID format (should be 18 alphanumeric characters)
-        if not metering_point or not isinstance(metering_point, str) or len(metering_point) != 18 or not metering_point.isalnum():
-            _LOGGER.error(f"[v{VERSION}] Invalid metering point ID format: {metering_point}. Expected 18 alphanumeric characters.")
-            raise EloverblikAPIError(f"Invalid metering point ID format: {metering_point}")
+        date_from_str, date_to_str = _prepare_date_range(date_from, date_to)
         
-        endpoint = f"/meterdata/gettimeseries/{date_from_str}/{date_to_str}/{aggregation}"
-        data = {
-            "meteringPoints": {
-                "meteringPoint": [metering_point]
-            }
-        }
+        _LOGGER.debug(f"[v{VERSION}] Requesting time series: {date_from_str} to {date_to_str} ({aggregation}) for metering point {metering_point}")
+        
+        _validate_metering_point(metering_point)
         
-        _LOGGER.debug(f"[v{VERSION}] API request endpoint: {endpoint}, data: {data}")
+        endpoint = f"/meterdata/gettimeseries/{date_from_str}/{date_to_str}/{aggregation}"
+        data = _metering_points_body([metering_point])
         
         try:
-            response = self._make_request("POST", endpoint, data=data)
-            response_json = response.json()
-            _LOGGER.warning(f"[v{VERSION}] API response received, keys: {list(response_json.keys()) if isinstance(response_json, dict) else 'not a dict'}")
-            if isinstance(response_json, dict) and "result" in response_json:
-                result_count = len(response_json.get("result", []))
-                _LOGGER.warning(f"[v{VERSION}] API response contains {result_count} result(s)")
+            response_json = self._request_json("POST", endpoint, data=data)
+            if _LOGGER.isEnabledFor(logging.DEBUG) and isinstance(response_json, dict):
+                _LOGGER.debug(f"[v{VERSION}] API response received with {len(response_json.get('result') or [])} result(s)")
             return response_json
         except EloverblikAPIError as e:
             _LOGGER.warning(f"[v{VERSION}] Failed to get time series: {e}")
             return None
 
-    def get_charges(self, metering_point: str) -> Optional[Dict[str, Any]]:
+    def stream_time_series(
+        self,
+        metering_point: str,
+        date_from: datetime,
+        date_to: datetime,
+        aggregation: str = "Hour"
+    ) -> Iterator[TimeSeriesPoint]:
+        """Stream time series data for a metering point.
+        
+        Unlike get_time_series(), the response body is read in chunks and
+        parsed incrementally, so the full JSON document is never held in
+        memory. The request is made when iteration starts.
+        
+        Args:
+            metering_point: Metering point ID
+            date_from: Start date
+            date_to: End date
+            aggregation: Aggregation level (Actual, Quarter, Hour, Day, Month, Year)
+            
+        Yields:
+            One TimeSeriesPoint per Point in the response
+            
+        Raises:
+            EloverblikAPIError: If the request fails or the body is invalid
+        """
+        date_from_str, date_to_str = _prepare_date_range(date_from, date_to)
+        _validate_metering_point(metering_point)
+        
+        endpoint = f"/meterdata/gettimeseries/{date_from_str}/{date_to_str}/{aggregation}"
+        _LOGGER.debug(f"[v{VERSION}] Streaming time series: {date_from_str} to {date_to_str} ({aggregation}) for metering point {metering_point}")
+        
+        response = self._make_request("POST", endpoint, data=_metering_points_body([metering_point]), stream=True, priority=PRIORITY_BACKFILL)
+        try:
+            yield from iter_time_series_points(response.iter_content(chunk_size=STREAM_CHUNK_SIZE))
+        except ValueError as e:
+            raise EloverblikAPIError(f"Invalid time series response: {e}") from e
+        except RequestException as e:
+            raise EloverblikAPIError(f"Error while reading time series response: {e}") from e
+        finally:
+            response.close()
+
+    def stream_time_series_range(
+        self,
+        metering_point: str,
+        date_from: datetime,
+        date_to: datetime,
+        aggregation: str = "Hour"
+    ) -> Iterator[TimeSeriesPoint]:
+        """Stream time series data for a range of any length.
+        
+        The range is split with plan_time_series_windows(), and the windows
+        are streamed one after another, so only one response body is in
+        flight and no window is ever held in memory as a whole. Windows that
+        fail are logged and left out, unless the failure means that no later
+        window can succeed either.
+        
+        Args:
+            metering_point: Metering point ID
+            date_from: Start date (inclusive)
+            date_to: End date (exclusive)
+            aggregation: Aggregation level (Actual, Quarter, Hour, Day, Month, Year)
+            
+        Yields:
+            One TimeSeriesPoint per Point, in chronological window order
+        """
+        for window_from, window_to in plan_time_series_windows(date_from, date_to):
+            try:
+                yield from self.stream_time_series(metering_point, window_from, window_to, aggregation)
+            except (EloverblikAuthError, EloverblikUnavailableError):
+                raise
+            except EloverblikAPIError as e:
+                _LOGGER.warning(f"[v{VERSION}] Failed to stream time series: {e}")
+
+    def stream_time_series_export(
+        self,
+        metering_points: List[str],
+        date_from: datetime,
+        date_to: datetime,
+        aggregation: str = "Hour"
+    ) -> Iterator[Tuple[str, TimeSeriesPoint]]:
+        """Stream time series data for several metering points from the CSV export.
+        
+        The flat CSV export is much smaller than the JSON market document,
+        which makes it the cheaper path for multi-year backfills. The range is
+        split with plan_time_series_windows(), and each window is requested
+        for up to MAX_METERING_POINTS_PER_REQUEST metering points at a time.
+        
+        Args:
+            metering_points: Metering point IDs
+            date_from: Start date (inclusive)
+            date_to: End date (exclusive)
+            aggregation: Aggregation level (Actual, Quarter or Hour)
+            
+        Yields:
+            (metering point ID, TimeSeriesPoint) per row
+            
+        Raises:
+            ValueError: If the aggregation is not supported by the export
+            EloverblikAPIError: If a request fails or the CSV is not recognized
+        """
+        if aggregation not in EXPORT_RESOLUTIONS:
+            raise ValueError(f"Aggregation {aggregation} is not supported by the time series export")
+        for metering_point in metering_points:
+            _validate_metering_point(metering_point)
+        
+        for window_from, window_to in plan_time_series_windows(date_from, date_to):
+            date_from_str, date_to_str = _prepare_date_range(window_from, window_to)
+            endpoint = f"/meterdata/timeseries/export/{date_from_str}/{date_to_str}/{aggregation}"
+            for chunk in _chunk_metering_points(metering_points):
+                _LOGGER.debug(f"[v{VERSION}] Exporting time series: {date_from_str} to {date_to_str} ({aggregation}) for {len(chunk)} metering point(s)")
+                response = self._make_request("POST", endpoint, data=_metering_points_body(chunk), stream=True, priority=PRIORITY_BACKFILL)
+                try:
+                    yield from iter_export_points(response.iter_lines(chunk_size=STREAM_CHUNK_SIZE), EXPORT_RESOLUTIONS[aggregation])
+                except ValueError as e:
+                    raise EloverblikAPIError(f"Invalid time series export: {e}") from e
+                except RequestException as e:
+                    raise EloverblikAPIError(f"Error while reading time series export: {e}") from e
+                finally:
+                    response.close()
+
+    def get_charges(self, metering_point: str) -> Optional[Dict[str, Any]]:
         """Get charges (tariffs, subscriptions, fees) for a metering point.
         
         Args:
@@ -346,21 +1400,13 @@ class EloverblikAPI:
         Returns:
             Charges data or None if error
         """
-        # Validate metering point ID format (should be 18 alphanumeric characters)
-        if not metering_point or not isinstance(metering_point, str) or len(metering_point) != 18 or not metering_point.isalnum():
-            _LOGGER.error(f"[v{VERSION}] Invalid metering point ID format: {metering_point}. Expected 18 alphanumeric characters.")
-            raise EloverblikAPIError(f"Invalid metering point ID format: {metering_point}")
+        _validate_metering_point(metering_point)
         
         endpoint = "/meteringpoints/meteringpoint/getcharges"
-        data = {
-            "meteringPoints": {
-                "meteringPoint": [metering_point]
-            }
-        }
+        data = _metering_points_body([metering_point])
         
         try:
-            response = self._make_request("POST", endpoint, data=data)
-            return response.json()
+            return self._request_json("POST", endpoint, data=data, priority=PRIORITY_TARIFFS)
         except EloverblikAPIError as e:
             _LOGGER.warning(f"[v{VERSION}] Failed to get charges: {e}")
             return None
@@ -379,8 +1425,7 @@ class EloverblikAPI:
         params = {"includeAll": str(include_all).lower()}
         
         try:
-            response = self._make_request("GET", endpoint, params=params)
-            result = response.json()
+            result = self._request_json("GET", endpoint, params=params, priority=PRIORITY_TARIFFS)
             
             # Parse response structure: {"result": [{"meteringPointId": "...", ...}, ...]}
             if "result" in result and isinstance(result["result"], list):
@@ -399,22 +1444,662 @@ class EloverblikAPI:
         Returns:
             Metering point details or None if error
         """
-        # Validate metering point ID format (should be 18 alphanumeric characters)
-        if not metering_point or not isinstance(metering_point, str) or len(metering_point) != 18 or not metering_point.isalnum():
-            _LOGGER.error(f"[v{VERSION}] Invalid metering point ID format: {metering_point}. Expected 18 alphanumeric characters.")
-            raise EloverblikAPIError(f"Invalid metering point ID format: {metering_point}")
+        _validate_metering_point(metering_point)
         
         endpoint = "/meteringpoints/meteringpoint/getdetails"
-        data = {
-            "meteringPoints": {
-                "meteringPoint": [metering_point]
-            }
+        data = _metering_points_body([metering_point])
+        
+        try:
+            return self._request_json("POST", endpoint, data=data, priority=PRIORITY_TARIFFS)
+        except EloverblikAPIError as e:
+            _LOGGER.warning(f"[v{VERSION}] Failed to get metering point details: {e}")
+            return None
+
+    def _post_batch(
+        self,
+        endpoint: str,
+        metering_points: List[str],
+        description: str,
+        priority: int = PRIORITY_ENERGY
+    ) -> Dict[str, Dict[str, Any]]:
+        """POST a metering point list to an endpoint in chunks and split the results.
+        
+        Args:
+            endpoint: API endpoint path
+            metering_points: Metering point IDs
+            description: Name of the data, used in log messages
+            priority: Scheduler priority, one of the PRIORITY_* constants
+            
+        Returns:
+            Dictionary mapping metering point ID to its response. Metering points
+            in a failed chunk are left out.
+        """
+        for metering_point in metering_points:
+            _validate_metering_point(metering_point)
+        
+        results: Dict[str, Dict[str, Any]] = {}
+        for chunk in _chunk_metering_points(list(metering_points)):
+            try:
+                response = self._request_json("POST", endpoint, data=_metering_points_body(chunk), priority=priority)
+                results.update(_split_batch_response(response, chunk))
+            except EloverblikAPIError as e:
+                _LOGGER.warning(f"[v{VERSION}] Failed to get {description} for {len(chunk)} metering point(s): {e}")
+        return results
+
+    def get_time_series_batch(
+        self,
+        metering_points: List[str],
+        date_from: datetime,
+        date_to: datetime,
+        aggregation: str = "Hour"
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get time series data for several metering points.
+        
+        Sends up to MAX_METERING_POINTS_PER_REQUEST metering points per request.
+        
+        Args:
+            metering_points: Metering point IDs
+            date_from: Start date
+            date_to: End date
+            aggregation: Aggregation level (Actual, Quarter, Hour, Day, Month, Year)
+            
+        Returns:
+            Dictionary mapping metering point ID to its time series response
+        """
+        date_from_str, date_to_str = _prepare_date_range(date_from, date_to)
+        endpoint = f"/meterdata/gettimeseries/{date_from_str}/{date_to_str}/{aggregation}"
+        return self._post_batch(endpoint, metering_points, "time series")
+
+    def get_charges_batch(self, metering_points: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get charges for several metering points.
+        
+        Args:
+            metering_points: Metering point IDs
+            
+        Returns:
+            Dictionary mapping metering point ID to its charges response
+        """
+        return self._post_batch("/meteringpoints/meteringpoint/getcharges", metering_points, "charges", PRIORITY_TARIFFS)
+
+    def get_metering_point_details_batch(self, metering_points: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get details for several metering points.
+        
+        Args:
+            metering_points: Metering point IDs
+            
+        Returns:
+            Dictionary mapping metering point ID to its details response
+        """
+        return self._post_batch("/meteringpoints/meteringpoint/getdetails", metering_points, "metering point details", PRIORITY_TARIFFS)
+
+
+class EloverblikAsyncAPI:
+    """Native asyncio Eloverblik API client.
+    
+    Mirrors EloverblikAPI method for method, but uses aiohttp and
+    non-blocking backoff, so it can run directly in the event loop without
+    occupying executor threads.
+    """
+
+    def __init__(
+        self,
+        refresh_token: str,
+        session: Optional[aiohttp.ClientSession] = None,
+        token_manager: Optional["EloverblikTokenManager"] = None,
+        scheduler: Optional[RequestScheduler] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None
+    ):
+        """Initialize the async Eloverblik API client.
+        
+        Args:
+            refresh_token: Refresh token from eloverblik.dk portal
+            session: Shared aiohttp session (e.g. Home Assistant's). If not
+                given, the client creates and owns its own session.
+            token_manager: Shared access token manager for the refresh token.
+                If not given, the client creates its own.
+            scheduler: Request scheduler. Defaults to the scheduler shared by
+                the process.
+            circuit_breaker: Circuit breaker. Defaults to the breaker shared
+                by the process.
+        """
+        self._scheduler = scheduler if scheduler is not None else get_request_scheduler()
+        self._circuit_breaker = circuit_breaker if circuit_breaker is not None else get_circuit_breaker()
+        self._token_manager = token_manager if token_manager is not None else EloverblikTokenManager(refresh_token, scheduler=self._scheduler)
+        self._owns_session = session is None
+        self._session = session
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the aiohttp session, creating an owned one if necessary."""
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+        return self._session
+
+    async def close(self):
+        """Close the HTTP session if it is owned by this client."""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _get_access_token(self) -> str:
+        """Get access token from the shared token manager.
+        
+        Returns:
+            Access token string
+            
+        Raises:
+            EloverblikAuthError: If token cannot be obtained
+        """
+        return await self._token_manager.async_get_token(self._get_session())
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
+        priority: int = PRIORITY_ENERGY
+    ) -> Any:
+        """Make an authenticated API request.
+        
+        Every attempt waits for its turn in the request scheduler, and is
+        refused at once while the circuit breaker is open.
+        
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            data: Request body data
+            params: URL parameters
+            stream: If True, the body is not read; the open response is
+                returned and the caller must read and release it
+            priority: Scheduler priority, one of the PRIORITY_* constants
+            
+        Returns:
+            Parsed JSON response body, or the open response if stream is True
+            
+        Raises:
+            EloverblikUnavailableError: If the circuit breaker is open
+            EloverblikAPIError: If request fails
+        """
+        await self._raise_if_unavailable()
+        access_token = await self._get_access_token()
+        url = f"{API_BASE_URL}{endpoint}"
+        
+        headers = {
+            "Authorization": f"Bearer {access_token}",
+            "api-version": API_VERSION_HEADER,
+            "Content-Type": "application/json"
         }
         
+        max_retries = 3
+        
+        for attempt in range(max_retries):
+            if attempt > 0:
+                await self._raise_if_unavailable()
+            await self._scheduler.async_acquire(priority)
+            try:
+                response = await self._get_session().request(
+                    method,
+                    url,
+                    headers=headers,
+                    json=data,
+                    params=params,
+                    # A streamed body may take longer than REQUEST_TIMEOUT in
+                    # total, so only limit the time between reads
+                    timeout=aiohttp.ClientTimeout(total=None, sock_connect=REQUEST_TIMEOUT, sock_read=REQUEST_TIMEOUT) if stream
+                    else aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+                )
+                status_code = response.status
+                if status_code < 400:
+                    self._circuit_breaker.record_success()
+                    if stream:
+                        return response
+                    async with response:
+                        return await response.json(content_type=None)
+                async with response:
+                    error_body = await response.text()
+                retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self._circuit_breaker.record_failure()
+                if attempt < max_retries - 1:
+                    wait_time = _retry_delay(attempt)
+                    _LOGGER.warning(f"[v{VERSION}] Request error: {e}. Retrying in {wait_time:.1f} seconds ({attempt + 1}/{max_retries})")
+                    await asyncio.sleep(wait_time)
+                    continue
+                raise EloverblikAPIError(f"Request error after {max_retries} attempts: {e}") from e
+
+            # Handle 401 - token might be expired, try refreshing once
+            if status_code == 401:
+                if attempt == 0:  # Only retry once for 401
+                    self._token_manager.invalidate(access_token)
+                    access_token = await self._get_access_token()
+                    headers["Authorization"] = f"Bearer {access_token}"
+                    continue
+                raise EloverblikAuthError("Authentication failed")
+
+            # Handle 429 - Too Many Requests
+            if status_code == 429:
+                wait_time = _retry_delay(attempt, retry_after)
+                # Hold back every client (at most MAX_RETRY_DELAY); the
+                # retry waits in the scheduler
+                self._scheduler.pause(wait_time)
+                if attempt < max_retries - 1 and wait_time <= MAX_RETRY_DELAY:
+                    _LOGGER.warning(f"[v{VERSION}] Rate limited (429). Waiting {wait_time:.1f} seconds before retry {attempt + 1}/{max_retries}")
+                    continue
+                raise EloverblikAPIError("Rate limit exceeded. Please try again later.")
+
+            # Handle 503 - Service Unavailable
+            if status_code == 503:
+                self._circuit_breaker.record_failure()
+                if attempt < max_retries - 1:
+                    wait_time = _retry_delay(attempt)
+                    _LOGGER.warning(f"[v{VERSION}] Service unavailable (503). Waiting {wait_time:.1f} seconds before retry {attempt + 1}/{max_retries}")
+                    await asyncio.sleep(wait_time)
+                    continue
+                raise EloverblikAPIError("Service is temporarily unavailable. Please try again later.")
+
+            # Other HTTP errors - try to get more details from response
+            error_detail = error_body
+            try:
+                error_json = json.loads(error_body)
+                if isinstance(error_json, dict):
+                    error_code = error_json.get('errorCode', 'N/A')
+                    error_text = error_json.get('errorText', 'N/A')
+                    detail = error_json.get('detail', 'N/A')
+                    error_detail = f"ErrorCode: {error_code}, ErrorText: {error_text}, Detail: {detail}"
+            except ValueError:
+                pass
+            raise EloverblikAPIError(f"API request failed with status {status_code}: {error_detail}")
+
+        # Should never reach here, but just in case
+        raise EloverblikAPIError(f"Request failed after {max_retries} attempts")
+
+    async def _request_json(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        priority: int = PRIORITY_ENERGY
+    ) -> Any:
+        """Make an API request and parse the JSON body.
+        
+        Identical requests in flight at the same time share one HTTP call and
+        its parsed body, see SingleFlight.
+        
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            data: Request body data
+            params: URL parameters
+            priority: Scheduler priority, one of the PRIORITY_* constants
+            
+        Returns:
+            Parsed JSON response body
+            
+        Raises:
+            EloverblikAPIError: If request fails
+        """
+        return await _IN_FLIGHT_REQUESTS.async_do(
+            _request_key(self._token_manager, method, endpoint, data, params),
+            lambda: self._make_request(method, endpoint, data=data, params=params, priority=priority)
+        )
+
+    async def is_available(self) -> bool:
+        """Check if requests to the API may be made, according to the circuit breaker.
+        
+        Only costs a round-trip when the circuit is half-open, in which case
+        this call probes /isalive and reports the result to the breaker.
+        
+        Returns:
+            True if requests may be made, False while the service is down
+        """
+        state = self._circuit_breaker.before_request()
+        if state == CIRCUIT_HALF_OPEN:
+            if await self.check_isalive():
+                self._circuit_breaker.record_success()
+                return True
+            self._circuit_breaker.record_failure()
+            return False
+        return state == CIRCUIT_CLOSED
+
+    async def _raise_if_unavailable(self):
+        """Fail fast while the circuit breaker is open.
+        
+        Raises:
+            EloverblikUnavailableError: If the service is unavailable
+        """
+        if not await self.is_available():
+            raise EloverblikUnavailableError("Eloverblik service is unavailable")
+
+    async def check_isalive(self) -> bool:
+        """Check if Eloverblik API service is available.
+        
+        Returns:
+            True if service is available, False otherwise
+        """
+        try:
+            async with self._get_session().get(
+                f"{API_BASE_URL}/isalive",
+                headers={"api-version": API_VERSION_HEADER},
+                timeout=aiohttp.ClientTimeout(total=ISALIVE_TIMEOUT)
+            ) as response:
+                if response.status == 200:
+                    result = await response.json(content_type=None)
+                    return result if isinstance(result, bool) else True
+                elif response.status == 503:
+                    # Service is overloaded or down
+                    _LOGGER.warning(f"[v{VERSION}] Eloverblik service is unavailable (503). Service may be overloaded or down.")
+                    return False
+                return False
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            _LOGGER.debug(f"IsAlive check failed: {e}")
+            return False
+        except Exception as e:
+            _LOGGER.debug(f"IsAlive check failed: {e}")
+            return False
+
+    async def get_time_series(
+        self,
+        metering_point: str,
+        date_from: datetime,
+        date_to: datetime,
+        aggregation: str = "Hour"
+    ) -> Optional[Dict[str, Any]]:
+        """Get time series data for a metering point.
+        
+        Args:
+            metering_point: Metering point ID
+            date_from: Start date
+            date_to: End date
+            aggregation: Aggregation level (Actual, Quarter, Hour, Day, Month, Year)
+            
+        Returns:
+            Parsed time series data or None if error
+        """
+        date_from_str, date_to_str = _prepare_date_range(date_from, date_to)
+        _validate_metering_point(metering_point)
+        
+        endpoint = f"/meterdata/gettimeseries/{date_from_str}/{date_to_str}/{aggregation}"
+        data = _metering_points_body([metering_point])
+        
+        try:
+            return await self._request_json("POST", endpoint, data=data)
+        except EloverblikAPIError as e:
+            _LOGGER.warning(f"[v{VERSION}] Failed to get time series: {e}")
+            return None
+
+    async def stream_time_series(
+        self,
+        metering_point: str,
+        date_from: datetime,
+        date_to: datetime,
+        aggregation: str = "Hour"
+    ) -> AsyncIterator[TimeSeriesPoint]:
+        """Stream time series data for a metering point.
+        
+        Unlike get_time_series(), the response body is read in chunks and
+        parsed incrementally, so the full JSON document is never held in
+        memory. The request is made when iteration starts.
+        
+        Args:
+            metering_point: Metering point ID
+            date_from: Start date
+            date_to: End date
+            aggregation: Aggregation level (Actual, Quarter, Hour, Day, Month, Year)
+            
+        Yields:
+            One TimeSeriesPoint per Point in the response
+            
+        Raises:
+            EloverblikAPIError: If the request fails or the body is invalid
+        """
+        date_from_str, date_to_str = _prepare_date_range(date_from, date_to)
+        _validate_metering_point(metering_point)
+        
+        endpoint = f"/meterdata/gettimeseries/{date_from_str}/{date_to_str}/{aggregation}"
+        _LOGGER.debug(f"[v{VERSION}] Streaming time series: {date_from_str} to {date_to_str} ({aggregation}) for metering point {metering_point}")
+        
+        response = await self._make_request("POST", endpoint, data=_metering_points_body([metering_point]), stream=True, priority=PRIORITY_BACKFILL)
+        parser = TimeSeriesStreamParser()
+        try:
+            async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                for point in parser.feed(chunk):
+                    yield point
+            for point in parser.close():
+                yield point
+        except ValueError as e:
+            raise EloverblikAPIError(f"Invalid time series response: {e}") from e
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise EloverblikAPIError(f"Error while reading time series response: {e}") from e
+        finally:
+            response.release()
+
+    async def stream_time_series_range(
+        self,
+        metering_point: str,
+        date_from: datetime,
+        date_to: datetime,
+        aggregation: str = "Hour"
+    ) -> AsyncIterator[TimeSeriesPoint]:
+        """Stream time series data for a range of any length.
+        
+        The range is split with plan_time_series_windows(), and the windows
+        are streamed one after another, so only one response body is in
+        flight and no window is ever held in memory as a whole. Windows that
+        fail are logged and left out, unless the failure means that no later
+        window can succeed either.
+        
+        Args:
+            metering_point: Metering point ID
+            date_from: Start date (inclusive)
+            date_to: End date (exclusive)
+            aggregation: Aggregation level (Actual, Quarter, Hour, Day, Month, Year)
+            
+        Yields:
+            One TimeSeriesPoint per Point, in chronological window order
+        """
+        for window_from, window_to in plan_time_series_windows(date_from, date_to):
+            try:
+                async for point in self.stream_time_series(metering_point, window_from, window_to, aggregation):
+                    yield point
+            except (EloverblikAuthError, EloverblikUnavailableError):
+                raise
+            except EloverblikAPIError as e:
+                _LOGGER.warning(f"[v{VERSION}] Failed to stream time series: {e}")
+
+    async def stream_time_series_export(
+        self,
+        metering_points: List[str],
+        date_from: datetime,
+        date_to: datetime,
+        aggregation: str = "Hour"
+    ) -> AsyncIterator[Tuple[str, TimeSeriesPoint]]:
+        """Stream time series data for several metering points from the CSV export.
+        
+        The flat CSV export is much smaller than the JSON market document,
+        which makes it the cheaper path for multi-year backfills. The range is
+        split with plan_time_series_windows(), and each window is requested
+        for up to MAX_METERING_POINTS_PER_REQUEST metering points at a time.
+        
+        Args:
+            metering_points: Metering point IDs
+            date_from: Start date (inclusive)
+            date_to: End date (exclusive)
+            aggregation: Aggregation level (Actual, Quarter or Hour)
+            
+        Yields:
+            (metering point ID, TimeSeriesPoint) per row
+            
+        Raises:
+            ValueError: If the aggregation is not supported by the export
+            EloverblikAPIError: If a request fails or the CSV is not recognized
+        """
+        if aggregation not in EXPORT_RESOLUTIONS:
+            raise ValueError(f"Aggregation {aggregation} is not supported by the time series export")
+        for metering_point in metering_points:
+            _validate_metering_point(metering_point)
+        
+        for window_from, window_to in plan_time_series_windows(date_from, date_to):
+            date_from_str, date_to_str = _prepare_date_range(window_from, window_to)
+            endpoint = f"/meterdata/timeseries/export/{date_from_str}/{date_to_str}/{aggregation}"
+            for chunk in _chunk_metering_points(metering_points):
+                _LOGGER.debug(f"[v{VERSION}] Exporting time series: {date_from_str} to {date_to_str} ({aggregation}) for {len(chunk)} metering point(s)")
+                response = await self._make_request("POST", endpoint, data=_metering_points_body(chunk), stream=True, priority=PRIORITY_BACKFILL)
+                parser = ExportStreamParser(EXPORT_RESOLUTIONS[aggregation])
+                try:
+                    async for line in response.content:
+                        for row in parser.feed(line):
+                            yield row
+                except ValueError as e:
+                    raise EloverblikAPIError(f"Invalid time series export: {e}") from e
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    raise EloverblikAPIError(f"Error while reading time series export: {e}") from e
+                finally:
+                    response.release()
+
+    async def get_charges(self, metering_point: str) -> Optional[Dict[str, Any]]:
+        """Get charges (tariffs, subscriptions, fees) for a metering point.
+        
+        Args:
+            metering_point: Metering point ID
+            
+        Returns:
+            Charges data or None if error
+        """
+        _validate_metering_point(metering_point)
+        
+        endpoint = "/meteringpoints/meteringpoint/getcharges"
+        data = _metering_points_body([metering_point])
+        
+        try:
+            return await self._request_json("POST", endpoint, data=data, priority=PRIORITY_TARIFFS)
+        except EloverblikAPIError as e:
+            _LOGGER.warning(f"[v{VERSION}] Failed to get charges: {e}")
+            return None
+
+    async def get_metering_points(self, include_all: bool = False) -> Optional[List[Dict[str, Any]]]:
+        """Get list of metering points for the authenticated user.
+        
+        Args:
+            include_all: If True, includes non-linked metering points registered to CPR/CVR
+            
+        Returns:
+            List of metering point dictionaries or None if error
+        """
+        endpoint = "/meteringpoints/meteringpoints"
+        params = {"includeAll": str(include_all).lower()}
+        
         try:
-            response = self._make_request("POST", endpoint, data=data)
-            return response.json()
+            result = await self._request_json("GET", endpoint, params=params, priority=PRIORITY_TARIFFS)
+            
+            # Parse response structure: {"result": [{"meteringPointId": "...", ...}, ...]}
+            if "result" in result and isinstance(result["result"], list):
+                return result["result"]
+            return []
+        except EloverblikAPIError as e:
+            _LOGGER.warning(f"[v{VERSION}] Failed to get metering points: {e}")
+            return None
+
+    async def get_metering_point_details(self, metering_point: str) -> Optional[Dict[str, Any]]:
+        """Get detailed information about a metering point.
+        
+        Args:
+            metering_point: Metering point ID
+            
+        Returns:
+            Metering point details or None if error
+        """
+        _validate_metering_point(metering_point)
+        
+        endpoint = "/meteringpoints/meteringpoint/getdetails"
+        data = _metering_points_body([metering_point])
+        
+        try:
+            return await self._request_json("POST", endpoint, data=data, priority=PRIORITY_TARIFFS)
         except EloverblikAPIError as e:
             _LOGGER.warning(f"[v{VERSION}] Failed to get metering point details: {e}")
             return None
 
+    async def _post_batch(
+        self,
+        endpoint: str,
+        metering_points: List[str],
+        description: str,
+        priority: int = PRIORITY_ENERGY
+    ) -> Dict[str, Dict[str, Any]]:
+        """POST a metering point list to an endpoint in chunks and split the results.
+        
+        Args:
+            endpoint: API endpoint path
+            metering_points: Metering point IDs
+            description: Name of the data, used in log messages
+            priority: Scheduler priority, one of the PRIORITY_* constants
+            
+        Returns:
+            Dictionary mapping metering point ID to its response. Metering points
+            in a failed chunk are left out.
+        """
+        for metering_point in metering_points:
+            _validate_metering_point(metering_point)
+        
+        results: Dict[str, Dict[str, Any]] = {}
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_BATCH_REQUESTS)
+
+        async def _fetch_chunk(chunk: List[str]):
+            async with semaphore:
+                try:
+                    response = await self._request_json("POST", endpoint, data=_metering_points_body(chunk), priority=priority)
+                    results.update(_split_batch_response(response, chunk))
+                except EloverblikAPIError as e:
+                    _LOGGER.warning(f"[v{VERSION}] Failed to get {description} for {len(chunk)} metering point(s): {e}")
+
+        # Chunks are fetched concurrently, bounded by MAX_CONCURRENT_BATCH_REQUESTS
+        await asyncio.gather(*(_fetch_chunk(chunk) for chunk in _chunk_metering_points(list(metering_points))))
+        return results
+
+    async def get_time_series_batch(
+        self,
+        metering_points: List[str],
+        date_from: datetime,
+        date_to: datetime,
+        aggregation: str = "Hour"
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get time series data for several metering points.
+        
+        Sends up to MAX_METERING_POINTS_PER_REQUEST metering points per request.
+        
+        Args:
+            metering_points: Metering point IDs
+            date_from: Start date
+            date_to: End date
+            aggregation: Aggregation level (Actual, Quarter, Hour, Day, Month, Year)
+            
+        Returns:
+            Dictionary mapping metering point ID to its time series response
+        """
+        date_from_str, date_to_str = _prepare_date_range(date_from, date_to)
+        endpoint = f"/meterdata/gettimeseries/{date_from_str}/{date_to_str}/{aggregation}"
+        return await self._post_batch(endpoint, metering_points, "time series")
+
+    async def get_charges_batch(self, metering_points: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get charges for several metering points.
+        
+        Args:
+            metering_points: Metering point IDs
+            
+        Returns:
+            Dictionary mapping metering point ID to its charges response
+        """
+        return await self._post_batch("/meteringpoints/meteringpoint/getcharges", metering_points, "charges", PRIORITY_TARIFFS)
+
+    async def get_metering_point_details_batch(self, metering_points: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get details for several metering points.
+        
+        Args:
+            metering_points: Metering point IDs
+            
+        Returns:
+            Dictionary mapping metering point ID to its details response
+        """
+        return await self._post_batch("/meteringpoints/meteringpoint/getdetails", metering_points, "metering point details", PRIORITY_TARIFFS)
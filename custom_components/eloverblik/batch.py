@@ -0,0 +1,97 @@
+"""Batched requests shared by the metering points of a config entry."""
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+import json
+import logging
+import os
+import threading
+import time
+
+from .api_client import EloverblikAPI
+
+_LOGGER = logging.getLogger(__name__)
+
+# Version for logging
+try:
+    manifest_path = os.path.join(os.path.dirname(__file__), 'manifest.json')
+    with open(manifest_path) as f:
+        VERSION = json.load(f).get('version', 'unknown')
+except Exception:
+    VERSION = 'unknown'
+
+# Batched responses are shared by the metering points of a config entry for
+# this long, so coordinators updating at about the same time share a request
+BATCH_RESPONSE_MAX_AGE = timedelta(minutes=10)
+
+
+class EntryBatchFetcher:
+    """Fetches day data and charges for all metering points of a config entry at once.
+    
+    Each metering point has its own coordinator, and they update
+    independently. The first client that needs a day range or charges
+    fetches them for every metering point of the entry in batched requests.
+    Each request carries up to MAX_METERING_POINTS_PER_REQUEST metering
+    points. Clients asking within BATCH_RESPONSE_MAX_AGE get their part of
+    that response, so N metering points cost about N / limit round-trips
+    per cycle instead of N.
+    """
+
+    def __init__(self, api: EloverblikAPI):
+        """Initialize the batch fetcher.
+        
+        Args:
+            api: API client used for the batched requests
+        """
+        self._api = api
+        self._metering_points: List[str] = []
+        self._lock = threading.Lock()
+        # request key: (monotonic time, {metering point: response or None})
+        self._responses: Dict[tuple, Tuple[float, Dict[str, Optional[Dict[str, Any]]]]] = {}
+
+    def add_metering_point(self, metering_point: str):
+        """Include a metering point in the batched requests."""
+        if metering_point not in self._metering_points:
+            self._metering_points.append(metering_point)
+
+    def get_time_series(self, metering_point: str, date_from: datetime, date_to: datetime, aggregation: str) -> Optional[Dict[str, Any]]:
+        """Get a metering point's time series response from a batched request.
+        
+        Returns:
+            Response in the shape of a single metering point response, or
+            None if the batch did not return the metering point
+        """
+        return self._get(
+            ("timeseries", date_from, date_to, aggregation),
+            metering_point,
+            lambda metering_points: self._api.get_time_series_batch(metering_points, date_from, date_to, aggregation)
+        )
+
+    def get_charges(self, metering_point: str) -> Optional[Dict[str, Any]]:
+        """Get a metering point's charges response from a batched request.
+        
+        Returns:
+            Response in the shape of a single metering point response, or
+            None if the batch did not return the metering point
+        """
+        return self._get(("charges",), metering_point, self._api.get_charges_batch)
+
+    def _get(self, key: tuple, metering_point: str, fetch) -> Optional[Dict[str, Any]]:
+        """Get a response from a recent batch, fetching a new batch if there is none."""
+        with self._lock:
+            fetched = self._responses.get(key)
+            max_age = BATCH_RESPONSE_MAX_AGE.total_seconds()
+            if fetched is None or time.monotonic() - fetched[0] >= max_age or metering_point not in fetched[1]:
+                metering_points = list(self._metering_points)
+                if metering_point not in metering_points:
+                    metering_points.append(metering_point)
+                _LOGGER.debug(f"[v{VERSION}] Fetching {key[0]} for {len(metering_points)} metering point(s) in batches")
+                results = fetch(metering_points)
+                fetched = (time.monotonic(), {point: results.get(point) for point in metering_points})
+                # Old batches are never asked for again
+                now = time.monotonic()
+                self._responses = {
+                    other_key: other for other_key, other in self._responses.items()
+                    if now - other[0] < max_age
+                }
+                self._responses[key] = fetched
+            return fetched[1][metering_point]
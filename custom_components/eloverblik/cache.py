@@ -0,0 +1,223 @@
+"""Bounded in-memory cache for data received from Eloverblik."""
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Any, Dict, Hashable, NamedTuple, Optional, Set, Tuple
+import json
+import logging
+import os
+import threading
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+# Version for logging
+try:
+    manifest_path = os.path.join(os.path.dirname(__file__), 'manifest.json')
+    with open(manifest_path) as f:
+        VERSION = json.load(f).get('version', 'unknown')
+except Exception:
+    VERSION = 'unknown'
+
+
+class CachePolicy(NamedTuple):
+    """Freshness and size bound for one kind of cached data.
+
+    Values are fresh for ttl. For stale_while_revalidate after that, they
+    may still be served while the caller refreshes them in the background.
+    max_entries is the bound per metering point added to the cache.
+    """
+    ttl: timedelta
+    max_entries: int
+    stale_while_revalidate: timedelta = timedelta(0)
+
+
+class CacheStats(NamedTuple):
+    """Counters for one kind of cached data."""
+    hits: int
+    stale_hits: int
+    misses: int
+    evictions: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups answered with fresh data."""
+        lookups = self.hits + self.stale_hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResponseCache:
+    """LRU cache with a TTL and a size bound per kind of data.
+
+    Keys are tuples whose first item is the metering point ID, so all data
+    of a metering point can be dropped at once with invalidate(). Each kind
+    is evicted least recently used first when it grows past max_entries for
+    every metering point added with add_metering_point(), so metering points
+    sharing the cache do not evict each other's data.
+
+    Expired entries are kept until they are evicted, because callers fall
+    back to stale data when the API fails (get with allow_stale=True).
+
+    The cache is safe to use from several executor threads.
+    """
+
+    def __init__(self, policies: Dict[str, CachePolicy]):
+        """Initialize the cache.
+
+        Args:
+            policies: Policy per kind of data. Only these kinds can be stored.
+        """
+        self._lock = threading.Lock()
+        self._policies = dict(policies)
+        # kind: {key: (value, stored_at)} in least recently used order
+        self._entries: Dict[str, "OrderedDict[Hashable, Tuple[Any, float]]"] = {
+            kind: OrderedDict() for kind in self._policies
+        }
+        self._counters: Dict[str, Dict[str, int]] = {
+            kind: dict.fromkeys(CacheStats._fields, 0) for kind in self._policies
+        }
+        self._metering_points: Set[str] = set()
+
+    def add_metering_point(self, metering_point: str):
+        """Make room for the data of a metering point.
+
+        Args:
+            metering_point: Metering point ID
+        """
+        with self._lock:
+            self._metering_points.add(metering_point)
+
+    def remove_metering_point(self, metering_point: str) -> int:
+        """Drop the data of a metering point and the room made for it.
+
+        Args:
+            metering_point: Metering point ID
+
+        Returns:
+            Number of entries dropped
+        """
+        with self._lock:
+            self._metering_points.discard(metering_point)
+        return self.invalidate(metering_point)
+
+    def _max_entries(self, kind: str) -> int:
+        """Size bound of a kind for the metering points added to the cache."""
+        return self._policies[kind].max_entries * max(1, len(self._metering_points))
+
+    def get(self, kind: str, key: Tuple, allow_stale: bool = False) -> Optional[Any]:
+        """Get a cached value.
+
+        Args:
+            kind: Kind of data
+            key: Cache key; the first item is the metering point ID
+            allow_stale: Also return values older than the TTL
+
+        Returns:
+            Cached value, or None if there is none (or it is stale and
+            allow_stale is False)
+        """
+        with self._lock:
+            entries = self._entries[kind]
+            counters = self._counters[kind]
+            entry = entries.get(key)
+            if entry is None:
+                counters["misses"] += 1
+                return None
+            value, stored_at = entry
+            if time.monotonic() - stored_at < self._policies[kind].ttl.total_seconds():
+                counters["hits"] += 1
+            elif allow_stale:
+                counters["stale_hits"] += 1
+            else:
+                counters["misses"] += 1
+                return None
+            entries.move_to_end(key)
+            return value
+
+    def get_revalidating(self, kind: str, key: Tuple) -> Tuple[Optional[Any], bool]:
+        """Get a cached value for stale-while-revalidate serving.
+
+        Args:
+            kind: Kind of data
+            key: Cache key; the first item is the metering point ID
+
+        Returns:
+            (value, revalidate). The value is None if there is none or it is
+            older than the stale-while-revalidate window. revalidate is True
+            if the value is missing or past its TTL, in which case the caller
+            should refresh it.
+        """
+        with self._lock:
+            entry = self._entries[kind].get(key)
+            counters = self._counters[kind]
+            if entry is None:
+                counters["misses"] += 1
+                return None, True
+            value, stored_at = entry
+            policy = self._policies[kind]
+            age = time.monotonic() - stored_at
+            if age < policy.ttl.total_seconds():
+                counters["hits"] += 1
+                revalidate = False
+            elif age < (policy.ttl + policy.stale_while_revalidate).total_seconds():
+                counters["stale_hits"] += 1
+                revalidate = True
+            else:
+                counters["misses"] += 1
+                return None, True
+            self._entries[kind].move_to_end(key)
+            return value, revalidate
+
+    def set(self, kind: str, key: Tuple, value: Any):
+        """Store a value, evicting the least recently used values of the kind if needed.
+
+        Args:
+            kind: Kind of data
+            key: Cache key; the first item is the metering point ID
+            value: Value to store
+        """
+        with self._lock:
+            entries = self._entries[kind]
+            entries[key] = (value, time.monotonic())
+            entries.move_to_end(key)
+            max_entries = self._max_entries(kind)
+            while len(entries) > max_entries:
+                entries.popitem(last=False)
+                self._counters[kind]["evictions"] += 1
+
+    def invalidate(self, metering_point: str) -> int:
+        """Drop all cached data of a metering point.
+
+        Args:
+            metering_point: Metering point ID
+
+        Returns:
+            Number of entries dropped
+        """
+        dropped = 0
+        with self._lock:
+            for entries in self._entries.values():
+                for key in [key for key in entries if key[0] == metering_point]:
+                    del entries[key]
+                    dropped += 1
+        return dropped
+
+    def clear(self):
+        """Drop all cached data."""
+        with self._lock:
+            for entries in self._entries.values():
+                entries.clear()
+
+    def stats(self) -> Dict[str, CacheStats]:
+        """Get the counters per kind of data."""
+        with self._lock:
+            return {kind: CacheStats(**counters) for kind, counters in self._counters.items()}
+
+    def log_stats(self):
+        """Log the hit rate per kind of data at debug level."""
+        if not _LOGGER.isEnabledFor(logging.DEBUG):
+            return
+        for kind, stats in self.stats().items():
+            _LOGGER.debug(
+                f"[v{VERSION}] Cache {kind}: {stats.hit_rate:.0%} hit rate "
+                f"({stats.hits} hits, {stats.stale_hits} stale, {stats.misses} misses, {stats.evictions} evictions)"
+            )
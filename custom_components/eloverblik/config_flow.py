@@ -6,9 +6,10 @@ import voluptuous as vol
 
 from homeassistant import config_entries, core, exceptions
 from homeassistant.data_entry_flow import AbortFlow
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import DOMAIN  # pylint:disable=unused-import
-from .api_client import EloverblikAPI, EloverblikAuthError, EloverblikAPIError
+from .api_client import EloverblikAsyncAPI, EloverblikAuthError, EloverblikAPIError
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -109,11 +110,9 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     if not validate_refresh_token(refresh_token):
                         errors["base"] = "invalid_auth"
                     else:
-                        api = EloverblikAPI(refresh_token)
+                        api = EloverblikAsyncAPI(refresh_token, async_get_clientsession(self.hass))
                         # Get all metering points
-                        metering_points = await self.hass.async_add_executor_job(
-                            api.get_metering_points, False
-                        )
+                        metering_points = await api.get_metering_points(False)
                         
                         if metering_points is None:
                             errors["base"] = "cannot_connect"
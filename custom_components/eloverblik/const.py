@@ -2,3 +2,8 @@
 
 DOMAIN = "eloverblik"
 CURRENCY_KRONER_PER_KILO_WATT_HOUR = "kr/kWh"
+CURRENCY_KRONER = "DKK"
+
+# Aggregation used for metering data. "Actual" returns each meter's own
+# resolution (PT15M or PT1H), which is read from the response
+TIME_SERIES_AGGREGATION = "Actual"
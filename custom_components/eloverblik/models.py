@@ -1,6 +1,11 @@
 """Data models for Eloverblik API responses."""
-from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from array import array
+from bisect import bisect_right
+from datetime import datetime, timedelta, timezone
+from itertools import cycle, islice
+from operator import mul
+from typing import Optional, List, Dict, Any, Iterable, Iterator, NamedTuple, Tuple, Union
+from zoneinfo import ZoneInfo
 import logging
 import json
 import os
@@ -15,9 +20,103 @@ try:
 except Exception:
     VERSION = 'unknown'
 
+# Time zone the API uses for calendar days and months
+API_TIME_ZONE = ZoneInfo("Europe/Copenhagen")
+
+# Fixed-length resolutions; other resolutions (e.g. P1M) vary in length
+RESOLUTION_STEPS = {
+    "PT15M": timedelta(minutes=15),
+    "PT1H": timedelta(hours=1),
+    "P1D": timedelta(days=1),
+}
+
+
+class TimeSeriesPeriod(NamedTuple):
+    """A single Period from a time series response.
+    
+    Values are placed by position, so index 0 is position 1. Positions
+    without a quantity are None.
+    """
+
+    start: datetime
+    end: datetime
+    resolution: Optional[str]
+    values: List[Optional[float]]
+
+    @property
+    def local_date(self):
+        """Calendar day (Danish time) the period belongs to."""
+        return self.start.astimezone(API_TIME_ZONE).date()
+
+    @property
+    def is_complete(self) -> bool:
+        """True if every position in the period has a quantity."""
+        return bool(self.values) and all(value is not None for value in self.values)
+
+
+def parse_api_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO 8601 datetime from the API (handles both Z and +00:00)."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (ValueError, AttributeError):
+        return None
+
+
+def iter_periods(data: Dict[str, Any]) -> Iterator[TimeSeriesPeriod]:
+    """Iterate over all Periods in a time series response.
+    
+    Args:
+        data: Parsed JSON data from API response
+        
+    Yields:
+        One TimeSeriesPeriod per Period with a valid time interval
+    """
+    for response_item in data.get("result") or []:
+        if not isinstance(response_item, dict) or not response_item.get("success", True):
+            continue
+        market_doc = response_item.get("MyEnergyData_MarketDocument") or response_item.get("MyEnergyDataMarketDocument")
+        if not isinstance(market_doc, dict):
+            continue
+        for time_series in market_doc.get("TimeSeries") or []:
+            for period in time_series.get("Period") or []:
+                time_interval = period.get("timeInterval") or {}
+                start = parse_api_datetime(time_interval.get("start"))
+                end = parse_api_datetime(time_interval.get("end"))
+                if start is None or end is None:
+                    continue
+                
+                points = period.get("Point") or []
+                values: List[Optional[float]] = [None] * len(points)
+                for point in points:
+                    quantity = point.get("out_Quantity.quantity")
+                    if quantity is None:
+                        quantity_obj = point.get("out_Quantity", {})
+                        quantity = quantity_obj.get("quantity") if isinstance(quantity_obj, dict) else None
+                    try:
+                        index = int(point.get("position")) - 1
+                        value = float(quantity) if quantity is not None else None
+                    except (ValueError, TypeError):
+                        continue
+                    if index < 0:
+                        continue
+                    if index >= len(values):
+                        values.extend([None] * (index + 1 - len(values)))
+                    values[index] = value
+                
+                yield TimeSeriesPeriod(start, end, period.get("resolution"), values)
+
 
 class TimeSeries:
-    """Represents a time series of metering data."""
+    """Represents a time series of metering data.
+    
+    Values are kept in a typed array('d') in position order, starting at
+    `start` with one value per `resolution` step. `data_date` is the end of
+    the series.
+    """
+
+    __slots__ = ("_metering_data", "data_date", "start", "resolution")
 
     def __init__(self, data: Dict[str, Any]):
         """Initialize TimeSeries from API response data.
@@ -25,8 +124,10 @@ class TimeSeries:
         Args:
             data: Parsed JSON data from API response
         """
-        self._metering_data: Optional[List[float]] = None
+        self._metering_data: Optional[array] = None
         self.data_date: Optional[datetime] = None
+        self.start: Optional[datetime] = None
+        self.resolution: Optional[str] = None
         self._parse_data(data)
 
     def _parse_data(self, data: Dict[str, Any]):
@@ -91,66 +192,199 @@ class TimeSeries:
                 
                 if time_series_list:
                     _LOGGER.debug(f"[v{VERSION}] Found {len(time_series_list)} TimeSeries in market document")
-                    # Combine all periods into one time series
-                    all_points = []
-                    latest_end = None
+                    # Collect the points of every period, then fill them into
+                    # one series by position relative to the series start
+                    periods_data = []
+                    
+                    # Checked once: per-item debug messages are only formatted
+                    # when debug logging is enabled
+                    debug = _LOGGER.isEnabledFor(logging.DEBUG)
                     
                     for idx, time_series in enumerate(time_series_list):
-                        _LOGGER.debug(f"[v{VERSION}] Processing TimeSeries {idx + 1}, keys: {list(time_series.keys()) if isinstance(time_series, dict) else 'not a dict'}")
                         periods = time_series.get("Period", [])
-                        _LOGGER.debug(f"[v{VERSION}] Found {len(periods)} Period(s) in TimeSeries {idx + 1}")
+                        if debug:
+                            _LOGGER.debug(f"[v{VERSION}] Found {len(periods)} Period(s) in TimeSeries {idx + 1}")
                         
-                        for period_idx, period in enumerate(periods):
-                            _LOGGER.debug(f"[v{VERSION}] Processing Period {period_idx + 1}, keys: {list(period.keys()) if isinstance(period, dict) else 'not a dict'}")
+                        for period in periods:
                             points = period.get("Point", [])
-                            _LOGGER.debug(f"[v{VERSION}] Found {len(points)} Point(s) in Period {period_idx + 1}")
                             
                             # Extract time interval
-                            time_interval = period.get("timeInterval", {})
-                            if time_interval:
-                                end_str = time_interval.get("end")
-                                if end_str:
-                                    try:
-                                        # Parse ISO 8601 datetime (handle both Z and +00:00)
-                                        end_date = end_str.replace("Z", "+00:00")
-                                        parsed_date = datetime.fromisoformat(end_date)
-                                        if latest_end is None or parsed_date > latest_end:
-                                            latest_end = parsed_date
-                                    except (ValueError, AttributeError) as e:
-                                        _LOGGER.debug(f"Could not parse date: {end_str} - {e}")
+                            time_interval = period.get("timeInterval") or {}
+                            period_start = parse_api_datetime(time_interval.get("start"))
+                            period_end = parse_api_datetime(time_interval.get("end"))
+                            if period_end is None and debug:
+                                _LOGGER.debug(f"Could not parse date: {time_interval.get('end')}")
                             
-                            # Extract metering data from points
-                            for point_idx, point in enumerate(points):
-                                position = point.get("position")
+                            # Extract metering data from points as (index, quantity)
+                            period_points = []
+                            append = period_points.append
+                            for point in points:
                                 # API returns out_Quantity.quantity as a flat key (not nested structure)
                                 # Try both formats for compatibility
                                 quantity = point.get("out_Quantity.quantity")
                                 if quantity is None:
                                     # Fallback: try nested structure if flat key doesn't exist
-                                    quantity_obj = point.get("out_Quantity", {})
-                                    quantity = quantity_obj.get("quantity") if isinstance(quantity_obj, dict) else None
-                                _LOGGER.debug(f"[v{VERSION}] Point {point_idx + 1} - position: {position}, quantity: {quantity}")
-                                
-                                if quantity is not None:
-                                    try:
-                                        all_points.append((int(position), float(quantity)))
-                                    except (ValueError, TypeError):
-                                        pass
+                                    quantity_obj = point.get("out_Quantity")
+                                    if not isinstance(quantity_obj, dict):
+                                        continue
+                                    quantity = quantity_obj.get("quantity")
+                                    if quantity is None:
+                                        continue
+                                try:
+                                    append((int(point["position"]) - 1, float(quantity)))
+                                except (KeyError, ValueError, TypeError):
+                                    pass
+                            
+                            periods_data.append((period_start, period_end, period.get("resolution"), period_points))
                     
-                    # Sort by position and extract values
-                    if all_points:
-                        all_points.sort(key=lambda x: x[0])
-                        self._metering_data = [qty for _, qty in all_points]
-                        self.data_date = latest_end
+                    self._fill_positions(periods_data)
                     
         except (KeyError, IndexError, TypeError, AttributeError) as e:
             _LOGGER.warning(f"Error parsing time series data: {e}", exc_info=True)
 
+    def _fill_positions(self, periods_data: List[tuple]):
+        """Fill the points of all periods into one typed array.
+        
+        For fixed resolutions every point is written at its offset from the
+        series start, so periods are placed correctly regardless of order and
+        missing points stay 0.0. Variable-length resolutions (months) and
+        periods without a start are concatenated in period order.
+        
+        Args:
+            periods_data: List of (start, end, resolution, [(index, quantity), ...])
+        """
+        if not any(points for _, _, _, points in periods_data):
+            return
+        
+        ends = [end for _, end, _, _ in periods_data if end is not None]
+        self.data_date = max(ends) if ends else None
+        self.resolution = next((resolution for _, _, resolution, _ in periods_data if resolution), None)
+        step = RESOLUTION_STEPS.get(self.resolution)
+        
+        uniform = all(start is not None and resolution == self.resolution for start, _, resolution, _ in periods_data)
+        if step is not None and self.data_date is not None and uniform:
+            self.start = min(start for start, _, _, _ in periods_data)
+            length = int((self.data_date - self.start) / step)
+            values = array("d", [0.0]) * length
+            for start, _, _, points in periods_data:
+                offset = int((start - self.start) / step)
+                for index, quantity in points:
+                    position = offset + index
+                    if 0 <= position < length:
+                        values[position] = quantity
+        else:
+            starts = [start for start, _, _, _ in periods_data if start is not None]
+            self.start = min(starts) if starts else None
+            values = array("d")
+            for _, _, _, points in sorted(periods_data, key=lambda p: p[0] or datetime.min.replace(tzinfo=timezone.utc)):
+                block = array("d", [0.0]) * (max(index for index, _ in points) + 1 if points else 0)
+                for index, quantity in points:
+                    if index >= 0:
+                        block[index] = quantity
+                values.extend(block)
+        
+        self._metering_data = values
+
+    @classmethod
+    def from_values(
+        cls,
+        values: Iterable[float],
+        data_date: Optional[datetime],
+        start: Optional[datetime] = None,
+        resolution: Optional[str] = None
+    ) -> "TimeSeries":
+        """Create a TimeSeries directly from values.
+        
+        Args:
+            values: Metering values in position order
+            data_date: End of the time series
+            start: Start of the time series
+            resolution: Resolution of the values (e.g. PT1H)
+            
+        Returns:
+            TimeSeries with the given values
+        """
+        time_series = cls({})
+        metering_data = array("d", values)
+        time_series._metering_data = metering_data if metering_data else None
+        time_series.data_date = data_date
+        time_series.start = start
+        time_series.resolution = resolution
+        return time_series
+
+    @classmethod
+    def from_points(cls, points: Iterable[Any]) -> "TimeSeries":
+        """Create a TimeSeries from streamed points.
+        
+        Args:
+            points: TimeSeriesPoint records, e.g. from iter_time_series_points()
+            
+        Returns:
+            TimeSeries with the points placed by position
+        """
+        periods: Dict[datetime, tuple] = {}
+        for point in points:
+            period = periods.get(point.period_start)
+            if period is None:
+                period = periods[point.period_start] = (point.period_start, point.period_end, point.resolution, [])
+            if point.quantity is not None:
+                period[3].append((point.position - 1, point.quantity))
+        time_series = cls({})
+        time_series._fill_positions(list(periods.values()))
+        return time_series
+
+    @classmethod
+    def from_period(cls, period: TimeSeriesPeriod) -> "TimeSeries":
+        """Create a TimeSeries from a single period.
+        
+        Missing positions are filled with 0.0.
+        """
+        return cls.from_values(
+            (value if value is not None else 0.0 for value in period.values),
+            period.end,
+            period.start,
+            period.resolution,
+        )
+
+    @property
+    def points_per_hour(self) -> int:
+        """Number of values per hour (4 for PT15M, otherwise 1)."""
+        step = RESOLUTION_STEPS.get(self.resolution)
+        if step is None or step >= timedelta(hours=1):
+            return 1
+        return int(timedelta(hours=1) / step)
+
+    def iter_hourly_values(self) -> Iterator[Tuple[datetime, float]]:
+        """Iterate over the values summed per hour.
+        
+        Quarter-hour values are added up to whole hours, as Home Assistant
+        statistics are hourly.
+        
+        Yields:
+            (start of the hour, energy in kWh) in chronological order
+        """
+        values = self._metering_data
+        if values is None:
+            return
+        points = self.points_per_hour
+        start = self.start
+        if start is None and self.data_date is not None:
+            start = self.data_date - timedelta(hours=len(values) // points)
+        if start is None:
+            return
+        hour = timedelta(hours=1)
+        if points == 1:
+            for index, value in enumerate(values):
+                yield start + index * hour, value
+        else:
+            for index in range(0, len(values), points):
+                yield start + (index // points) * hour, sum(values[index:index + points])
+
     def get_metering_data(self, hour: int) -> float:
-        """Get metering data for a specific hour (1-indexed).
+        """Get metering data for a specific position (1-indexed).
         
         Args:
-            hour: Hour number (1-24 for daily, 1-96 for quarter-hourly, etc.)
+            hour: Position number (1-24 for hourly, 1-96 for quarter-hourly, etc.)
             
         Returns:
             Energy consumption in kWh
@@ -175,8 +409,37 @@ class TimeSeries:
         return sum(self._metering_data)
 
 
+class ChargeVersion(NamedTuple):
+    """One version of a charge from getcharges.
+    
+    Prices are a tuple with one price per slot of the day (24 hourly or 96
+    quarter-hour slots) for tariffs, or a single fixed price. Only tariffs
+    are priced per kWh; subscriptions and fees are fixed amounts.
+    """
+
+    name: str
+    valid_from: Optional[datetime]
+    valid_to: Optional[datetime]
+    prices: Union[Tuple[float, ...], float]
+    per_kwh: bool
+
+
 class ChargesData:
-    """Represents charges (tariffs, subscriptions, fees) for a metering point."""
+    """Represents charges (tariffs, subscriptions, fees) for a metering point.
+    
+    Every charge version keeps its validity range, and the versions are
+    folded into a timeline: a sorted list of segment starts (searched with
+    bisect) and, per segment, the summed price of all charges valid in it
+    for every slot of the day (24 hourly or 96 quarter-hour slots). The
+    earliest known version of each charge is assumed to apply to all time
+    before it, as getcharges does not return older versions.
+    
+    Each segment also has the sum of the tariffs alone, which is the price
+    per kWh used for costs. Subscriptions and fees are fixed amounts and
+    never multiplied with consumption.
+    
+    `charges` holds the prices valid now, keyed by charge name.
+    """
 
     def __init__(self, data: Dict[str, Any]):
         """Initialize ChargesData from API response.
@@ -185,7 +448,12 @@ class ChargesData:
             data: Parsed JSON data from API response
         """
         self.charges: Dict[str, Any] = {}
+        self.versions: List[ChargeVersion] = []
+        self._segment_starts: List[datetime] = []
+        self._segments: List[Tuple[array, array]] = []
+        self._kwh_segments: List[Tuple[array, array]] = []
         self._parse_data(data)
+        self._build_timeline()
 
     def _parse_data(self, data: Dict[str, Any]):
         """Parse charges data from API response."""
@@ -201,22 +469,30 @@ class ChargesData:
                     prices = tariff.get("prices", [])
                     
                     if prices:
-                        # Create hourly price array
-                        hourly_prices = [0.0] * 24
+                        # Create price array, one slot per hour or per
+                        # quarter hour for tariffs with 15 minute prices
+                        slots = {}
                         for price_entry in prices:
                             position = price_entry.get("position")
                             price = price_entry.get("price", 0.0)
                             if position:
                                 try:
-                                    hour = int(position) - 1
-                                    if 0 <= hour < 24:
-                                        hourly_prices[hour] = float(price)
+                                    slots[int(position) - 1] = float(price)
                                 except (ValueError, TypeError):
                                     pass
-                        self.charges[name] = hourly_prices
+                        if tariff.get("periodType") == "DAY" and len(slots) == 1:
+                            # One price for the whole day
+                            slot_prices = [next(iter(slots.values()))] * 24
+                        else:
+                            slot_count = 96 if any(slot >= 24 for slot in slots) else 24
+                            slot_prices = [0.0] * slot_count
+                            for slot, price in slots.items():
+                                if 0 <= slot < slot_count:
+                                    slot_prices[slot] = price
+                        self.versions.append(_charge_version(tariff, name, slot_prices, True))
                     else:
                         # Fixed price tariff
-                        self.charges[name] = 0.0
+                        self.versions.append(_charge_version(tariff, name, 0.0, True))
                 
                 # Parse subscriptions and fees (fixed prices)
                 for charge_type in ["subscriptions", "fees"]:
@@ -224,11 +500,255 @@ class ChargesData:
                     for item in items:
                         name = item.get("name", "unknown")
                         price = item.get("price", 0.0)
-                        self.charges[name] = float(price)
+                        self.versions.append(_charge_version(item, name, float(price), False))
                         
         except (KeyError, TypeError, ValueError) as e:
             _LOGGER.warning(f"Error parsing charges data: {e}")
 
+    def merge_history(self, previous: "ChargesData"):
+        """Keep the versions of previously fetched charges that are no longer returned.
+        
+        getcharges only returns current and future versions, so versions that
+        have expired since the previous fetch are kept to price older data.
+        
+        Args:
+            previous: Charges from an earlier fetch
+        """
+        known = {(version.name, version.valid_from) for version in self.versions}
+        added = [version for version in previous.versions if (version.name, version.valid_from) not in known]
+        if added:
+            self.versions.extend(added)
+            self._build_timeline()
+
+    def _build_timeline(self):
+        """Fold the charge versions into the segment index."""
+        # The earliest version of each charge also covers all time before it
+        earliest: Dict[str, ChargeVersion] = {}
+        for version in self.versions:
+            current = earliest.get(version.name)
+            if current is None or _sort_time(version.valid_from) < _sort_time(current.valid_from):
+                earliest[version.name] = version
+        effective = [
+            (None if version is earliest[version.name] else version.valid_from, version)
+            for version in self.versions
+        ]
+        
+        boundaries = sorted({
+            time_point
+            for valid_from, version in effective
+            for time_point in (valid_from, version.valid_to)
+            if time_point is not None
+        })
+        
+        segments: List[Tuple[array, array]] = []
+        kwh_segments: List[Tuple[array, array]] = []
+        for index in range(len(boundaries) + 1):
+            segment_start = boundaries[index - 1] if index > 0 else None
+            segment_end = boundaries[index] if index < len(boundaries) else None
+            # Per charge, the latest version valid in the whole segment
+            active: Dict[str, Tuple[Optional[datetime], ChargeVersion]] = {}
+            for valid_from, version in effective:
+                if valid_from is not None and (segment_start is None or valid_from > segment_start):
+                    continue
+                if version.valid_to is not None and (segment_end is None or version.valid_to < segment_end):
+                    continue
+                current = active.get(version.name)
+                if current is None or _sort_time(valid_from) >= _sort_time(current[0]):
+                    active[version.name] = (valid_from, version)
+            active_versions = [version for _, version in active.values()]
+            segments.append(_sum_prices(active_versions))
+            kwh_segments.append(_sum_prices([version for version in active_versions if version.per_kwh]))
+        
+        self._segment_starts = boundaries
+        self._segments = segments
+        self._kwh_segments = kwh_segments
+        
+        # Prices valid now, by charge name
+        now = datetime.now(timezone.utc)
+        charges: Dict[str, Any] = {}
+        for valid_from, version in sorted(effective, key=lambda item: _sort_time(item[0])):
+            if (valid_from is None or valid_from <= now) and (version.valid_to is None or version.valid_to > now):
+                charges[version.name] = version.prices
+        self.charges = charges
+
+    def _segment_at(self, when: Optional[datetime] = None, per_kwh: bool = False) -> Tuple[array, array]:
+        """Get the (slot sums, hourly sums) valid at a point in time (default now).
+        
+        Args:
+            when: Point in time
+            per_kwh: Sum the tariffs only, leaving out subscriptions and fees
+        """
+        if when is None:
+            when = datetime.now(timezone.utc)
+        segments = self._kwh_segments if per_kwh else self._segments
+        return segments[bisect_right(self._segment_starts, when)]
+
+    @property
+    def slots_per_day(self) -> int:
+        """Number of price slots per day (24 or 96) of the prices valid now."""
+        return len(self._segment_at()[0])
+
+    @property
+    def price_sums(self) -> array:
+        """Summed price of all charges valid now, per slot of the day."""
+        return self._segment_at()[0]
+
+    def get_price_sum_hour(self, hour: int) -> float:
+        """Get the summed price valid now for an hour (1-24).
+        
+        Quarter-hour prices count with the mean of the hour's four prices.
+        """
+        return self._segment_at()[1][hour - 1]
+
+    def get_price_sum_at(self, when: datetime) -> float:
+        """Get the summed price at a point in time.
+        
+        Args:
+            when: Point in time; naive datetimes are Danish local time
+        """
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=API_TIME_ZONE)
+        slot_sums, _ = self._segment_at(when)
+        local = when.astimezone(API_TIME_ZONE)
+        if len(slot_sums) == 96:
+            return slot_sums[local.hour * 4 + local.minute // 15]
+        return slot_sums[local.hour]
+
+    def get_hour_kwh_price_at(self, when: datetime) -> float:
+        """Get the price per kWh for the hour a point in time falls in.
+        
+        This is the sum of the tariffs; subscriptions and fees are not
+        included. Quarter-hour prices count with the mean of the hour's four
+        prices.
+        
+        Args:
+            when: Point in time; naive datetimes are Danish local time
+        """
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=API_TIME_ZONE)
+        _, hourly_sums = self._segment_at(when, per_kwh=True)
+        return hourly_sums[when.astimezone(API_TIME_ZONE).hour]
+
+    def cost(self, time_series: "TimeSeries") -> float:
+        """Calculate the cost of a consumption series.
+        
+        Each value is multiplied by the price per kWh (the summed tariffs)
+        valid at its time, for its slot of the day (Danish time). The series is split at the
+        timeline's segment boundaries, so a multi-year history is priced in
+        one pass. Hourly consumption uses the hourly mean of quarter-hour
+        prices; quarter-hour consumption uses the quarter-hour prices, or
+        the hourly price repeated four times.
+        
+        Args:
+            time_series: Hourly or quarter-hourly consumption
+            
+        Returns:
+            Cost in the currency of the charges
+        """
+        values = time_series._metering_data
+        if not values:
+            return 0.0
+        points_per_hour = time_series.points_per_hour
+        start = time_series.start
+        if start is None:
+            # Without a start, price the values from midnight with today's prices
+            return _cost_piece(self._segment_at(per_kwh=True), values, None, points_per_hour)
+        
+        step = timedelta(hours=1) / points_per_hour
+        total = 0.0
+        index = 0
+        while index < len(values):
+            point_time = start + step * index
+            segment = bisect_right(self._segment_starts, point_time)
+            end_index = len(values)
+            if segment < len(self._segment_starts):
+                end_index = min(end_index, -((start - self._segment_starts[segment]) // step))
+            total += _cost_piece(self._kwh_segments[segment], values[index:end_index], point_time, points_per_hour)
+            index = end_index
+        return total
+
+
+def _charge_version(item: Dict[str, Any], name: str, prices: Union[List[float], float], per_kwh: bool) -> ChargeVersion:
+    """Create a ChargeVersion with the validity range of a getcharges item."""
+    return ChargeVersion(
+        name,
+        _parse_charge_date(item.get("validFromDate")),
+        _parse_charge_date(item.get("validToDate")),
+        tuple(prices) if isinstance(prices, list) else prices,
+        per_kwh,
+    )
+
+
+def _parse_charge_date(value: Optional[str]) -> Optional[datetime]:
+    """Parse a charge validity date; dates without an offset are Danish local time."""
+    parsed = parse_api_datetime(value)
+    if parsed is not None and parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=API_TIME_ZONE)
+    return parsed
+
+
+def _sort_time(value: Optional[datetime]) -> datetime:
+    """Sort key for optional validity dates; None sorts first."""
+    return value if value is not None else datetime.min.replace(tzinfo=timezone.utc)
+
+
+def _sum_prices(versions: List[ChargeVersion]) -> Tuple[array, array]:
+    """Sum charge versions into per-slot and per-hour price vectors."""
+    slot_count = 96 if any(isinstance(version.prices, tuple) and len(version.prices) == 96 for version in versions) else 24
+    slot_sums = array("d", [0.0]) * slot_count
+    for version in versions:
+        prices = version.prices
+        if isinstance(prices, tuple):
+            if len(prices) not in (24, 96):
+                _LOGGER.warning(f"[v{VERSION}] Unexpected length of tariff array for {version.name} ({len(prices)}), expected 24 or 96 entries.")
+                continue
+            repeat = slot_count // len(prices)
+            for slot in range(slot_count):
+                slot_sums[slot] += prices[slot // repeat]
+        else:
+            fixed = float(prices)
+            for slot in range(slot_count):
+                slot_sums[slot] += fixed
+    
+    per_hour = slot_count // 24
+    hourly_sums = array("d", (
+        sum(slot_sums[hour * per_hour:(hour + 1) * per_hour]) / per_hour for hour in range(24)
+    ))
+    return slot_sums, hourly_sums
+
+
+def _cost_piece(segment: Tuple[array, array], values: array, start: Optional[datetime], points_per_hour: int) -> float:
+    """Price consecutive values that all fall in one timeline segment."""
+    slot_sums, hourly_sums = segment
+    if points_per_hour == 4:
+        prices = slot_sums if len(slot_sums) == 96 else array("d", (price for price in slot_sums for _ in range(4)))
+    else:
+        prices = hourly_sums
+    
+    if start is None:
+        start_slot = 0
+    else:
+        step = timedelta(hours=1) / points_per_hour
+        local_start = start.astimezone(API_TIME_ZONE)
+        local_end = (start + step * len(values)).astimezone(API_TIME_ZONE)
+        if local_start.utcoffset() != local_end.utcoffset():
+            # The values cross a daylight saving time change; look up the
+            # slot of every value from its local time
+            return sum(
+                value * prices[_slot_of(start + step * index, points_per_hour)]
+                for index, value in enumerate(values)
+            )
+        start_slot = _slot_of(start, points_per_hour)
+    
+    slot_prices = islice(cycle(prices), start_slot, start_slot + len(values))
+    return sum(map(mul, values, slot_prices))
+
+
+def _slot_of(when: datetime, points_per_hour: int) -> int:
+    """Get the slot of the day (Danish time) a UTC time falls in."""
+    local = when.astimezone(API_TIME_ZONE)
+    return local.hour * points_per_hour + local.minute * points_per_hour // 60
+
 
 class DayData:
     """Represents daily energy consumption data."""
@@ -237,7 +757,7 @@ class DayData:
         """Initialize DayData from TimeSeries.
         
         Args:
-            time_series: TimeSeries object with hourly data
+            time_series: TimeSeries object with hourly or quarter-hourly data
         """
         self._time_series = time_series
 
@@ -249,13 +769,22 @@ class DayData:
     def get_metering_data(self, hour: int) -> float:
         """Get metering data for a specific hour (1-24).
         
+        Quarter-hour values are summed for the hour.
+        
         Args:
             hour: Hour number (1-24)
             
         Returns:
             Energy consumption in kWh for that hour
+            
+        Raises:
+            IndexError: If hour is out of range
         """
-        return self._time_series.get_metering_data(hour)
+        points = self._time_series.points_per_hour
+        if points == 1:
+            return self._time_series.get_metering_data(hour)
+        first = (hour - 1) * points + 1
+        return sum(self._time_series.get_metering_data(position) for position in range(first, first + points))
 
     def get_total_metering_data(self) -> float:
         """Get total daily energy consumption.
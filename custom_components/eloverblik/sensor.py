@@ -1,5 +1,5 @@
 """Platform for Eloverblik sensor integration."""
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 import logging
 import pytz
@@ -9,27 +9,37 @@ from homeassistant.const import UnitOfEnergy
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.statistics import (
     DOMAIN as RECORDER_DOMAIN,
+    async_add_external_statistics,
     async_import_statistics,
     get_last_statistics,
+    statistics_during_period,
 )
 from homeassistant.components.recorder.models import (
     StatisticData,
     StatisticMetaData
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import async_track_time_change
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
     SensorStateClass,
 )
 from homeassistant.util import Throttle
-from .__init__ import HassEloverblik, MIN_TIME_BETWEEN_STATISTICS_UPDATES
-from .const import DOMAIN, CURRENCY_KRONER_PER_KILO_WATT_HOUR
-from .models import TimeSeries
+from homeassistant.util import dt as dt_util
+from .__init__ import HassEloverblik, EloverblikCoordinator, MIN_TIME_BETWEEN_STATISTICS_UPDATES
+from .const import DOMAIN, CURRENCY_KRONER, CURRENCY_KRONER_PER_KILO_WATT_HOUR
+from .api_client import earliest_time_series_date
+from .models import ChargesData, TimeSeries
 
 _LOGGER = logging.getLogger(__name__)
 
+# How often the recorded statistics are scanned for missing hours
+STATISTICS_GAP_SCAN_INTERVAL = timedelta(days=1)
+
 # Version for logging
 try:
     manifest_path = os.path.join(os.path.dirname(__file__), 'manifest.json')
@@ -40,51 +50,52 @@ except Exception:
 
 async def async_setup_entry(hass: HomeAssistant, config: ConfigEntry, async_add_entities):
     """Set up the sensor platform."""
-    eloverblik_clients = hass.data[DOMAIN][config.entry_id]
-    
-    # Support legacy single client format
-    if not isinstance(eloverblik_clients, dict):
-        eloverblik_clients = {eloverblik_clients.get_metering_point(): eloverblik_clients}
+    entry_data = hass.data[DOMAIN][config.entry_id]
+    eloverblik_clients = entry_data["clients"]
+    coordinators = entry_data["coordinators"]
 
     sensors = []
     
     # Create sensors for each metering point
     for metering_point, eloverblik in eloverblik_clients.items():
+        coordinator = coordinators[metering_point]
         # Add metering point suffix to sensor names if multiple points
         suffix = f" {metering_point}" if len(eloverblik_clients) > 1 else ""
         
-        sensors.append(EloverblikEnergy(f"Eloverblik Energy Total{suffix}", 'total', eloverblik))
-        sensors.append(EloverblikEnergy(f"Eloverblik Energy Total (Year){suffix}", 'year_total', eloverblik))
+        sensors.append(EloverblikEnergy(f"Eloverblik Energy Total{suffix}", 'total', coordinator))
+        sensors.append(EloverblikEnergy(f"Eloverblik Energy Total (Year){suffix}", 'year_total', coordinator))
         # Meter reading sensor removed - endpoint is deprecated
         for hour in range(1, 25):
-            sensors.append(EloverblikEnergy(f"Eloverblik Energy {hour-1}-{hour}{suffix}", 'hour', eloverblik, hour))
-        sensors.append(EloverblikTariff(f"Eloverblik Tariff Sum{suffix}", eloverblik))
+            sensors.append(EloverblikEnergy(f"Eloverblik Energy {hour-1}-{hour}{suffix}", 'hour', coordinator, hour))
+        sensors.append(EloverblikTariff(f"Eloverblik Tariff Sum{suffix}", coordinator))
         sensors.append(EloverblikStatistic(eloverblik, suffix))
 
     async_add_entities(sensors)
 
-class EloverblikEnergy(SensorEntity):
+class EloverblikEnergy(CoordinatorEntity, SensorEntity):
     """Representation of an energy sensor for Eloverblik.
     
     Can represent hourly energy consumption, daily total, or yearly total.
+    State is pushed by the metering point's coordinator; the sensor never polls.
     """
 
     _attr_device_class = SensorDeviceClass.ENERGY
     _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
     _attr_state_class = SensorStateClass.TOTAL
 
-    def __init__(self, name: str, sensor_type: str, client: HassEloverblik, hour: int = None):
+    def __init__(self, name: str, sensor_type: str, coordinator: EloverblikCoordinator, hour: int = None):
         """Initialize the energy sensor.
         
         Args:
             name: Name of the sensor
             sensor_type: Type of sensor ('hour', 'total', or 'year_total')
-            client: HassEloverblik client instance
+            coordinator: Coordinator for the sensor's metering point
             hour: Hour number (1-24) if sensor_type is 'hour'
         """
+        super().__init__(coordinator)
         self._attr_name = name
         self._data_date = None
-        self._data = client
+        self._data = coordinator.client
         self._hour = hour
         self._sensor_type = sensor_type
 
@@ -97,6 +108,8 @@ class EloverblikEnergy(SensorEntity):
         else:
             raise ValueError(f"Unexpected sensor_type: {sensor_type}.")
 
+        self._update_from_client()
+
     @property
     def extra_state_attributes(self):
         """Return state attributes."""
@@ -111,12 +124,14 @@ class EloverblikEnergy(SensorEntity):
         
         return attributes
 
-    async def async_update(self):
-        """Fetch new state data for the sensor.
-        This is the only method that should fetch new data for Home Assistant.
-        """
-        await self.hass.async_add_executor_job(self._data.update_energy)
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update the state when the coordinator has fetched new data."""
+        self._update_from_client()
+        super()._handle_coordinator_update()
 
+    def _update_from_client(self):
+        """Read the current values from the client."""
         self._data_date = self._data.get_data_date()
 
         if self._sensor_type == 'hour':
@@ -128,27 +143,31 @@ class EloverblikEnergy(SensorEntity):
         else:
             raise ValueError(f"Unexpected sensor_type: {self._sensor_type}.")
 
-class EloverblikTariff(SensorEntity):
+class EloverblikTariff(CoordinatorEntity, SensorEntity):
     """Representation of a tariff sensor.
     
     Shows the current electricity tariff (price per kWh) including all charges.
+    Tariffs are fetched by the coordinator; the state is re-evaluated every
+    quarter hour so it follows the current hourly or quarter-hour price.
     """
 
     _attr_device_class = SensorDeviceClass.MONETARY
     _attr_native_unit_of_measurement = CURRENCY_KRONER_PER_KILO_WATT_HOUR
     # No state_class for monetary sensors - they are instantaneous values
 
-    def __init__(self, name: str, client: HassEloverblik):
+    def __init__(self, name: str, coordinator: EloverblikCoordinator):
         """Initialize the tariff sensor.
         
         Args:
             name: Name of the sensor
-            client: HassEloverblik client instance
+            coordinator: Coordinator for the sensor's metering point
         """
+        super().__init__(coordinator)
         self._attr_name = name
-        self._data = client
+        self._data = coordinator.client
         self._data_hourly_tariff_sums = [0] * 24
         self._attr_unique_id = f"{self._data.get_metering_point()}-tariff-sum"
+        self._update_from_client()
 
     @property
     def extra_state_attributes(self):
@@ -158,14 +177,33 @@ class EloverblikTariff(SensorEntity):
         }
         return attributes
 
-    async def async_update(self):
-        """Fetch new state data for the sensor.
-        This is the only method that should fetch new data for Home Assistant.
-        """
-        await self.hass.async_add_executor_job(self._data.update_tariffs)
+    async def async_added_to_hass(self) -> None:
+        """Register the quarter-hourly state refresh when added to Home Assistant."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_track_time_change(self.hass, self._async_quarter_changed, minute=(0, 15, 30, 45), second=0)
+        )
+
+    @callback
+    def _async_quarter_changed(self, now: datetime) -> None:
+        """Switch to the new period's tariff without fetching anything."""
+        # Hourly tariffs only change on the hour
+        if now.minute != 0 and not self._data.has_quarter_hour_tariffs():
+            return
+        self._update_from_client()
+        self.async_write_ha_state()
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update the state when the coordinator has fetched new data."""
+        self._update_from_client()
+        super()._handle_coordinator_update()
+
+    def _update_from_client(self):
+        """Read the current tariff sums from the client."""
         self._data_hourly_tariff_sums = [self._data.get_tariff_sum_hour(h) for h in range(1, 25)]
-        self._attr_native_value = self._data_hourly_tariff_sums[datetime.now().hour]
+        # Aware time, converted to Danish time like the charge timeline
+        self._attr_native_value = self._data.get_tariff_sum_at(dt_util.now())
 
 
 class EloverblikStatistic(SensorEntity):
@@ -175,6 +213,10 @@ class EloverblikStatistic(SensorEntity):
     This sensor provides cumulative energy consumption data that can be used
     in Home Assistant's Energy Dashboard and for creating energy consumption curves.
     The data is automatically imported into long-term statistics for historical tracking.
+    
+    A companion external statistic (eloverblik:<metering point>_cost) holds the
+    cumulative cost of the energy, priced with the tariff sum valid in each hour,
+    so the Energy Dashboard can use it as the cost source.
     """
 
     _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
@@ -186,10 +228,19 @@ class EloverblikStatistic(SensorEntity):
         self._attr_unique_id = f"{hass_eloverblik.get_metering_point()}-statistic"
         self._hass_eloverblik = hass_eloverblik
         self._last_total: Optional[float] = None
+        self._cost_name = f"Eloverblik Energy Cost{suffix}"
+        self._cost_statistic_id = f"{DOMAIN}:{hass_eloverblik.get_metering_point().lower()}_cost"
+        self._last_gap_scan: Optional[datetime] = None
+        # Gaps already refilled once; gaps the API can't fill are not retried
+        self._refilled_gaps: set[float] = set()
 
     async def async_will_remove_from_hass(self) -> None:
         """Cleanup callback to remove statistics when deleting entity"""
-        await get_instance(self.hass).async_clear_statistics([self.entity_id])
+        # Reloads and unloads remove the entity from hass too, but keep its
+        # registry entry; only a deleted entity loses its history
+        if er.async_get(self.hass).async_get(self.entity_id) is not None:
+            return
+        await get_instance(self.hass).async_clear_statistics([self.entity_id, self._cost_statistic_id])
 
     @Throttle(MIN_TIME_BETWEEN_STATISTICS_UPDATES)  # Update every 6 hours
     async def _async_update_statistics(self):
@@ -225,15 +276,44 @@ class EloverblikStatistic(SensorEntity):
     async def _update_data(self, last_stat: StatisticData):
         """Update statistics data from Eloverblik.
         
-        Fetches data from the last recorded point up to now (minus 2 days delay).
+        Fetches data from the last recorded point up to now (minus 2 days
+        delay), plus the hours missing inside the recorded range once per
+        STATISTICS_GAP_SCAN_INTERVAL.
         """
-        if last_stat is None:
-            # If no previous data, import from start of last year
-            from_date = datetime(datetime.today().year - 1, 1, 1)
+        # Cost can only be computed once tariffs are known; until then the
+        # cost statistic falls behind and catches up on a later run
+        charges = self._hass_eloverblik.get_tariff_data()
+        last_cost_stat = await self._get_last_stat(self.hass, self._cost_statistic_id) if charges is not None else None
+
+        # The initial import covers years of data; the CSV export is the
+        # cheaper bulk path for it
+        initial_import = last_stat is None
+        if last_stat is None or (charges is not None and last_cost_stat is None):
+            # If no previous data, import all history the API keeps
+            from_date = earliest_time_series_date()
         else:
             # Start from the hour after the last recorded statistic
             # Add 1 hour to avoid duplicates
-            from_date = pytz.utc.localize(datetime.utcfromtimestamp(last_stat["start"])) + timedelta(hours=1)
+            last_start = last_stat["start"]
+            if charges is not None:
+                last_start = min(last_start, last_cost_stat["start"])
+            from_date = pytz.utc.localize(datetime.utcfromtimestamp(last_start)) + timedelta(hours=1)
+
+        # Refill hours that are missing inside the recorded range, e.g. days
+        # the grid operator delivered late. Only the missing ranges are
+        # fetched; the statistics are then re-imported from the first
+        # missing hour, which corrects the running sums.
+        gaps: list[tuple[datetime, datetime]] = []
+        if last_stat is not None and self._gap_scan_due():
+            statistic_ids = [self.entity_id] + ([self._cost_statistic_id] if last_cost_stat is not None else [])
+            gaps = await self._find_statistics_gaps(statistic_ids)
+            if gaps:
+                _LOGGER.info(f"[v{VERSION}] {len(gaps)} missing statistics range(s) from {gaps[0][0]} for {self.entity_id}; refilling")
+                self._refilled_gaps.update(gap_from.timestamp() for gap_from, _ in gaps)
+                anchors = await self._get_statistics_before(gaps[0][0], statistic_ids)
+                last_stat = anchors.get(self.entity_id)
+                if last_cost_stat is not None:
+                    last_cost_stat = anchors.get(self._cost_statistic_id)
 
         # Data is typically 1-3 days delayed, so only fetch up to 2 days ago
         # Convert to naive datetime for API call (API expects dates, not datetimes with timezone)
@@ -244,49 +324,96 @@ class EloverblikStatistic(SensorEntity):
         to_date = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=2)
         
         # Don't fetch if from_date is too recent
-        if from_date >= to_date:
+        if from_date >= to_date and not gaps:
             _LOGGER.debug(f"[v{VERSION}] No new data available yet (data is delayed by 1-3 days)")
             return
 
-        _LOGGER.debug(f"[v{VERSION}] Fetching hourly data from {from_date} to {to_date}")
-        
-        data = await self.hass.async_add_executor_job(
-            self._hass_eloverblik.get_hourly_data,
-            from_date,
-            to_date)
-
-        if data is not None and len(data) > 0:
-            await self._insert_statistics(data, last_stat)
-            _LOGGER.info(f"[v{VERSION}] Imported {len(data)} time series periods to statistics")
+        # Statistics hours are UTC, while the store fetches whole Danish
+        # days, which can end up to a day after the UTC date
+        fetch_ranges = [
+            (gap_from.replace(tzinfo=None), (gap_to + timedelta(days=2)).replace(tzinfo=None))
+            for gap_from, gap_to in gaps
+        ]
+        if from_date < to_date:
+            fetch_ranges.append((from_date, to_date))
+        for fetch_from, fetch_to in fetch_ranges:
+            _LOGGER.debug(f"[v{VERSION}] Fetching hourly data from {fetch_from} to {fetch_to}")
+            fetched = await self.hass.async_add_executor_job(
+                self._hass_eloverblik.fetch_hourly_data,
+                fetch_from,
+                fetch_to,
+                initial_import)
+            if not fetched:
+                _LOGGER.debug(f"[v{VERSION}] No data was returned from Eloverblik")
+                return
+
+        if gaps:
+            # Re-import from the first missing hour with corrected sums
+            from_date = gaps[0][0].replace(tzinfo=None)
+
+        # Import one month at a time, so memory use and the size of each
+        # recorder job stay bounded however much history there is. The
+        # running sums are carried from one batch to the next.
+        batches = _month_batches(from_date, to_date)
+        imported_periods = 0
+        for batch_number, (batch_from, batch_to) in enumerate(batches, start=1):
+            data = await self.hass.async_add_executor_job(
+                self._hass_eloverblik.get_hourly_data,
+                batch_from,
+                batch_to)
+            if not data:
+                continue
+            last_stat, last_cost_stat = await self._insert_statistics(data, last_stat, charges, last_cost_stat)
+            imported_periods += len(data)
+            if len(batches) > 1:
+                _LOGGER.info(f"[v{VERSION}] Statistics import for {self._hass_eloverblik.get_metering_point()}: {batch_to.date()} done ({batch_number}/{len(batches)} months)")
+                # Let the recorder commit this batch before queueing the next
+                await get_instance(self.hass).async_block_till_done()
+
+        if imported_periods:
+            _LOGGER.info(f"[v{VERSION}] Imported {imported_periods} time series periods to statistics")
         else:
             _LOGGER.debug(f"[v{VERSION}] No data was returned from Eloverblik")
 
     async def _insert_statistics(
         self,
         data: dict[datetime, TimeSeries],
-        last_stat: StatisticData):
+        last_stat: StatisticData,
+        charges: Optional[ChargesData] = None,
+        last_cost_stat: Optional[StatisticData] = None) -> tuple[Optional[StatisticData], Optional[StatisticData]]:
+        """Import the energy (and cost) statistics for a batch of time series.
+        
+        Returns:
+            The last energy and cost statistic after the batch, to continue
+            the running sums in the next batch
+        """
 
         statistics : list[StatisticData] = []
+        cost_statistics : list[StatisticData] = []
 
         if last_stat is not None:
             total = last_stat["sum"]
+            last_start = datetime.fromtimestamp(last_stat["start"], tz=timezone.utc)
         else:
             total = 0
+            last_start = None
+
+        if last_cost_stat is not None:
+            cost_total = last_cost_stat["sum"]
+            last_cost_start = datetime.fromtimestamp(last_cost_stat["start"], tz=timezone.utc)
+        else:
+            cost_total = 0
+            last_cost_start = None
 
         # Sort time series to ensure correct insertion
         sorted_time_series = sorted(data.values(), key = lambda timeseries : timeseries.data_date)
 
         for time_series in sorted_time_series:
-            if time_series._metering_data is not None:
-                number_of_hours = len(time_series._metering_data)
-
-                # data_date returned is end of the time series
-                date = time_series.data_date - timedelta(hours=number_of_hours)
-
-                for hour in range(0, number_of_hours):
-                    start = date + timedelta(hours=hour)
-
-                    total += time_series.get_metering_data(hour+1)
+            # Statistics are hourly; quarter-hour values are summed per hour
+            for start, value in time_series.iter_hourly_values():
+                # Hours already in the statistics would be counted twice
+                if last_start is None or start > last_start:
+                    total += value
 
                     statistics.append(
                         StatisticData(
@@ -294,6 +421,17 @@ class EloverblikStatistic(SensorEntity):
                             sum=total
                         ))
 
+                # Cost is priced in the same pass with the hour's price per kWh;
+                # subscriptions and fees are fixed amounts, not per kWh
+                if charges is not None and (last_cost_start is None or start > last_cost_start):
+                    cost_total += value * charges.get_hour_kwh_price_at(start)
+
+                    cost_statistics.append(
+                        StatisticData(
+                            start=start,
+                            sum=cost_total
+                        ))
+
         metadata = StatisticMetaData(
             name=self._attr_name,
             source=RECORDER_DOMAIN,
@@ -317,12 +455,159 @@ class EloverblikStatistic(SensorEntity):
                 self._last_total = statistics[-1]["sum"]
                 self._attr_native_value = self._last_total
 
-    async def _get_last_stat(self, hass: HomeAssistant) -> StatisticData:
+        if len(cost_statistics) > 0:
+            # External statistics can't share the entity's import call, so
+            # the cost series is added right after it
+            cost_metadata = StatisticMetaData(
+                name=self._cost_name,
+                source=DOMAIN,
+                statistic_id=self._cost_statistic_id,
+                unit_of_measurement=CURRENCY_KRONER,
+                has_mean=False,
+                has_sum=True,
+            )
+            try:
+                async_add_external_statistics(self.hass, cost_metadata, cost_statistics, mean_type=None)
+            except TypeError:
+                # Older Home Assistant versions don't support mean_type parameter
+                async_add_external_statistics(self.hass, cost_metadata, cost_statistics)
+
+        if statistics:
+            last_stat = {"start": statistics[-1]["start"].timestamp(), "sum": total}
+        if cost_statistics:
+            last_cost_stat = {"start": cost_statistics[-1]["start"].timestamp(), "sum": cost_total}
+        return last_stat, last_cost_stat
+
+    def _gap_scan_due(self) -> bool:
+        """True if the statistics should be scanned for missing hours."""
+        now = datetime.now(timezone.utc)
+        if self._last_gap_scan is not None and now - self._last_gap_scan < STATISTICS_GAP_SCAN_INTERVAL:
+            return False
+        self._last_gap_scan = now
+        return True
+
+    async def _find_statistics_gaps(self, statistic_ids: list[str]) -> list[tuple[datetime, datetime]]:
+        """Find the hours missing inside the recorded statistics.
+        
+        The recorded range is read one month at a time, so the scan never
+        holds more than a month of rows. Missing hours of all statistics
+        are indexed as coalesced ranges.
+        
+        Args:
+            statistic_ids: Statistics to scan
+            
+        Returns:
+            Coalesced (first missing hour, next present hour) ranges in
+            chronological order, leaving out ranges refilled before
+        """
+        missing: list[tuple[float, float]] = []
+        previous_starts: dict[str, float] = {}
+        scan_from = earliest_time_series_date().replace(tzinfo=timezone.utc)
+        for page_from, page_to in _month_batches(scan_from, datetime.now(timezone.utc)):
+            rows_by_id = await get_instance(self.hass).async_add_executor_job(
+                statistics_during_period,
+                self.hass,
+                page_from,
+                page_to,
+                set(statistic_ids),
+                "hour",
+                None,
+                {"sum"},
+            )
+            for statistic_id in statistic_ids:
+                ranges, previous_starts[statistic_id] = _missing_hour_ranges(
+                    rows_by_id.get(statistic_id, []), previous_starts.get(statistic_id)
+                )
+                missing.extend(ranges)
+
+        return [
+            (datetime.fromtimestamp(missing_from, tz=timezone.utc), datetime.fromtimestamp(missing_to, tz=timezone.utc))
+            for missing_from, missing_to in _coalesce_ranges(missing)
+            if missing_from not in self._refilled_gaps
+        ]
+
+    async def _get_statistics_before(self, start: datetime, statistic_ids: list[str]) -> dict[str, StatisticData]:
+        """Get the statistic of the hour before a missing range, to continue its running sum.
+        
+        Every statistic either has the hour before the first missing range,
+        or has no statistics before it at all.
+        
+        Returns:
+            {statistic_id: statistic of the previous hour} for the statistics
+            that have one
+        """
+        rows_by_id = await get_instance(self.hass).async_add_executor_job(
+            statistics_during_period,
+            self.hass,
+            start - timedelta(hours=1),
+            start,
+            set(statistic_ids),
+            "hour",
+            None,
+            {"sum"},
+        )
+        return {
+            statistic_id: {"start": _row_start(rows[-1]), "sum": rows[-1]["sum"]}
+            for statistic_id, rows in rows_by_id.items()
+            if rows
+        }
+
+    async def _get_last_stat(self, hass: HomeAssistant, statistic_id: Optional[str] = None) -> StatisticData:
+        statistic_id = statistic_id or self.entity_id
         last_stats = await get_instance(hass).async_add_executor_job(
-            get_last_statistics, hass, 1, self.entity_id, True, {"sum"}
+            get_last_statistics, hass, 1, statistic_id, True, {"sum"}
         )
 
-        if self.entity_id in last_stats and len(last_stats[self.entity_id]) > 0:
-            return last_stats[self.entity_id][0]
+        if statistic_id in last_stats and len(last_stats[statistic_id]) > 0:
+            return last_stats[statistic_id][0]
         else:
             return None
+
+
+def _month_batches(from_date: datetime, to_date: datetime) -> list[tuple[datetime, datetime]]:
+    """Split a date range into batches that end on month boundaries."""
+    batches = []
+    batch_from = from_date
+    while batch_from < to_date:
+        next_month = (batch_from.replace(day=1, hour=0, minute=0, second=0, microsecond=0) + timedelta(days=32)).replace(day=1)
+        batch_to = min(next_month, to_date)
+        batches.append((batch_from, batch_to))
+        batch_from = batch_to
+    return batches
+
+
+def _row_start(row) -> float:
+    """Get the start of a statistics row as a timestamp."""
+    start = row["start"]
+    return start.timestamp() if isinstance(start, datetime) else start
+
+
+def _missing_hour_ranges(rows: list, previous: Optional[float] = None) -> tuple[list[tuple[float, float]], Optional[float]]:
+    """Find the missing hours in a page of sorted statistics rows.
+    
+    Args:
+        rows: Rows of one page
+        previous: Start of the last row of the previous page, if any
+    
+    Returns:
+        Coalesced (first missing hour, next present hour) timestamp ranges,
+        and the start of the last row seen, to pass with the next page
+    """
+    ranges = []
+    for row in rows:
+        start = _row_start(row)
+        if previous is not None and start - previous > 3600:
+            ranges.append((previous + 3600, start))
+        previous = start
+    return ranges, previous
+
+
+def _coalesce_ranges(ranges: list[tuple[float, float]]) -> list[tuple[float, float]]:
+    """Merge overlapping and adjacent ranges into sorted, disjoint ranges."""
+    merged: list[tuple[float, float]] = []
+    for range_from, range_to in sorted(ranges):
+        if merged and range_from <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], range_to))
+        else:
+            merged.append((range_from, range_to))
+    return merged
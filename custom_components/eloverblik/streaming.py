@@ -0,0 +1,464 @@
+"""Streaming parser for Eloverblik time series responses.
+
+A multi-year hourly response is several MB of JSON. Parsing it with
+response.json() keeps the whole document in memory, and building a
+TimeSeries from it keeps it a second time. The parser in this module reads
+the body in chunks and only keeps the Period that is currently being read,
+yielding one record per Point as soon as its Period is complete.
+
+The CSV time series export is parsed line by line into the same records.
+
+The surrounding document is tokenized in Python, but each Period is decoded
+in one go with the C accelerated json decoder, so throughput stays close to
+json.loads.
+"""
+from datetime import datetime, time, timedelta, timezone
+from typing import Optional, List, Dict, Any, Iterable, Iterator, NamedTuple, Tuple, Union
+import codecs
+import csv
+import logging
+import json
+import os
+import re
+
+from .models import API_TIME_ZONE, RESOLUTION_STEPS, TimeSeriesPeriod, parse_api_datetime
+
+_LOGGER = logging.getLogger(__name__)
+
+# Version for logging
+try:
+    manifest_path = os.path.join(os.path.dirname(__file__), 'manifest.json')
+    with open(manifest_path) as f:
+        VERSION = json.load(f).get('version', 'unknown')
+except Exception:
+    VERSION = 'unknown'
+
+# Size of the chunks read from the response body
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# A single token or Period longer than this means the body is not valid JSON
+MAX_TOKEN_LENGTH = 1024 * 1024
+
+# One JSON token: punctuation, string, number or literal
+_TOKEN_RE = re.compile(
+    r'[ \t\r\n]*(?:'
+    r'([{}\[\]:,])'
+    r'|"((?:[^"\\]|\\.)*)"'
+    r'|(-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?)'
+    r'|(true|false|null))'
+)
+_LITERALS = {"true": True, "false": False, "null": None}
+_DECODER = json.JSONDecoder()
+
+# Marker for array levels in the parser path
+_ITEM = object()
+
+# Header names of the CSV export columns, normalized (lower case, "_" as " ")
+_EXPORT_COLUMNS = {
+    "metering_point": ("målepunkt id", "målepunkt", "metering point id", "meteringpointid"),
+    "start": ("fra dato", "fra", "from date", "from"),
+    "end": ("til dato", "til", "to date", "to"),
+    "quantity": ("mængde", "quantity"),
+    "quality": ("kvalitet", "quality"),
+}
+
+# Date formats used in the CSV export, in Danish local time
+_EXPORT_DATE_FORMATS = ("%d-%m-%Y %H:%M:%S", "%d-%m-%Y %H:%M", "%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S")
+
+
+class TimeSeriesPoint(NamedTuple):
+    """A single Point from a time series response.
+
+    The position is 1-based as in the API. Quantity is None if the point has
+    no quantity.
+    """
+
+    period_start: datetime
+    period_end: datetime
+    resolution: Optional[str]
+    position: int
+    quantity: Optional[float]
+    quality: Optional[str]
+
+
+class TimeSeriesStreamParser:
+    """Incremental parser for gettimeseries response bodies.
+
+    Feed the body chunk by chunk with feed() and finish with close(). Both
+    return the points of the Periods that were completed by that call.
+    """
+
+    def __init__(self):
+        """Initialize the parser."""
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._path: List[Any] = []
+        self._expect_key = False
+        self._item: Optional[Dict[str, Any]] = None
+        self._output: List[TimeSeriesPoint] = []
+
+    def feed(self, chunk: Union[bytes, str]) -> List[TimeSeriesPoint]:
+        """Parse the next chunk of the body.
+
+        Args:
+            chunk: Next part of the response body
+
+        Returns:
+            Points of the Periods completed by this chunk
+
+        Raises:
+            ValueError: If the body is not valid JSON
+        """
+        if isinstance(chunk, bytes):
+            chunk = self._decoder.decode(chunk)
+        self._buffer += chunk
+        self._tokenize(final=False)
+        return self._take_output()
+
+    def close(self) -> List[TimeSeriesPoint]:
+        """Finish parsing the body.
+
+        Returns:
+            Points of the Periods completed by the end of the body
+
+        Raises:
+            ValueError: If the body is truncated or not valid JSON
+        """
+        self._buffer += self._decoder.decode(b"", final=True)
+        self._tokenize(final=True)
+        if self._buffer.strip() or self._path:
+            raise ValueError("Time series response is truncated or not valid JSON")
+        return self._take_output()
+
+    def _take_output(self) -> List[TimeSeriesPoint]:
+        """Return and clear the points parsed so far."""
+        output = self._output
+        self._output = []
+        return output
+
+    def _tokenize(self, final: bool):
+        """Handle all complete tokens in the buffer."""
+        buffer = self._buffer
+        length = len(buffer)
+        pos = 0
+        while True:
+            match = _TOKEN_RE.match(buffer, pos)
+            if match is None:
+                break
+            # A number at the end of the buffer may continue in the next chunk
+            if match.group(3) is not None and match.end() == length and not final:
+                break
+            punctuation, string, number, literal = match.groups()
+            if punctuation == "{" and self._path[-2:] == ["Period", _ITEM]:
+                # Decode the whole Period at once; wait for more data if it
+                # is not complete yet
+                try:
+                    period, end = _DECODER.raw_decode(buffer, match.end() - 1)
+                except ValueError:
+                    if final:
+                        raise
+                    break
+                self._emit_period(period)
+                pos = end
+                continue
+            pos = match.end()
+
+            if punctuation is not None:
+                self._handle_punctuation(punctuation)
+            elif string is not None:
+                if "\\" in string:
+                    string = json.loads(f'"{string}"')
+                if self._expect_key:
+                    self._path[-1] = string
+                    self._expect_key = False
+                else:
+                    self._handle_value(string)
+            elif number is not None:
+                self._handle_value(number)
+            else:
+                self._handle_value(_LITERALS[literal])
+
+        self._buffer = buffer[pos:]
+        if len(self._buffer) > MAX_TOKEN_LENGTH:
+            raise ValueError("Time series response is not valid JSON")
+
+    def _handle_punctuation(self, punctuation: str):
+        """Handle structural characters."""
+        if punctuation == "{":
+            self._start_map()
+            self._path.append(None)
+            self._expect_key = True
+        elif punctuation == "}":
+            if not self._path or self._path[-1] is _ITEM:
+                raise ValueError("Time series response is not valid JSON")
+            self._path.pop()
+            self._end_map()
+            self._expect_key = False
+        elif punctuation == "[":
+            self._path.append(_ITEM)
+        elif punctuation == "]":
+            if not self._path or self._path[-1] is not _ITEM:
+                raise ValueError("Time series response is not valid JSON")
+            self._path.pop()
+        elif punctuation == ",":
+            if self._path and self._path[-1] is not _ITEM:
+                self._expect_key = True
+
+    def _start_map(self):
+        """Track the result item, which carries the error status."""
+        if self._path == ["result", _ITEM]:
+            self._item = {}
+
+    def _end_map(self):
+        """Finish the object that was just closed."""
+        if self._item is not None and self._path == ["result", _ITEM]:
+            if self._item.get("success", True) is False:
+                _LOGGER.warning(f"[v{VERSION}] API returned error: {self._item.get('errorCode')} - {self._item.get('errorText', 'Unknown error')}")
+            self._item = None
+
+    def _handle_value(self, value: Any):
+        """Store scalar values of the result item."""
+        if self._item is not None and len(self._path) == 3:
+            self._item[self._path[-1]] = value
+
+    def _emit_period(self, period: Any):
+        """Convert the points of a decoded Period into records."""
+        if not isinstance(period, dict):
+            return
+        time_interval = period.get("timeInterval") or {}
+        start = parse_api_datetime(time_interval.get("start"))
+        end = parse_api_datetime(time_interval.get("end"))
+        if start is None or end is None:
+            return
+        resolution = period.get("resolution")
+        append = self._output.append
+        for point in period.get("Point") or []:
+            quantity = point.get("out_Quantity.quantity")
+            quality = point.get("out_Quantity.quality")
+            if quantity is None:
+                # Nested form of the flat out_Quantity.* keys
+                quantity_obj = point.get("out_Quantity")
+                if isinstance(quantity_obj, dict):
+                    quantity = quantity_obj.get("quantity")
+                    quality = quantity_obj.get("quality")
+            try:
+                position = int(point.get("position"))
+                quantity = float(quantity) if quantity is not None else None
+            except (ValueError, TypeError):
+                continue
+            append(TimeSeriesPoint(start, end, resolution, position, quantity, quality))
+
+
+def iter_time_series_points(chunks: Iterable[Union[bytes, str]]) -> Iterator[TimeSeriesPoint]:
+    """Parse a gettimeseries response body chunk by chunk.
+
+    Args:
+        chunks: Parts of the response body, e.g. response.iter_content()
+
+    Yields:
+        One TimeSeriesPoint per Point, in response order
+
+    Raises:
+        ValueError: If the body is truncated or not valid JSON. Points of
+            Periods completed before the error have already been yielded.
+    """
+    parser = TimeSeriesStreamParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+def iter_point_periods(points: Iterable[TimeSeriesPoint]) -> Iterator[TimeSeriesPeriod]:
+    """Group consecutive points of the same Period into TimeSeriesPeriods.
+
+    Values are placed by position like iter_periods(), with None for
+    positions that have no quantity.
+
+    Args:
+        points: Points in response order
+
+    Yields:
+        One TimeSeriesPeriod per Period
+    """
+    current: Optional[TimeSeriesPoint] = None
+    values: List[Optional[float]] = []
+    for point in points:
+        if current is None or (point.period_start, point.period_end) != (current.period_start, current.period_end):
+            if current is not None:
+                yield TimeSeriesPeriod(current.period_start, current.period_end, current.resolution, values)
+            # Size fixed resolutions by the period length, so a period with
+            # missing trailing points is not taken as complete
+            step = RESOLUTION_STEPS.get(point.resolution)
+            values = [None] * int((point.period_end - point.period_start) / step) if step else []
+        current = point
+        index = point.position - 1
+        if index < 0:
+            continue
+        if index >= len(values):
+            values.extend([None] * (index + 1 - len(values)))
+        values[index] = point.quantity
+    if current is not None:
+        yield TimeSeriesPeriod(current.period_start, current.period_end, current.resolution, values)
+
+
+def _decode_lines(lines: Iterable[Union[bytes, str]]) -> Iterator[str]:
+    """Decode CSV lines, accepting UTF-8 (with or without BOM) and cp1252."""
+    for line in lines:
+        if isinstance(line, bytes):
+            try:
+                line = line.decode("utf-8")
+            except UnicodeDecodeError:
+                line = line.decode("cp1252")
+        yield line.lstrip("\ufeff")
+
+
+def _parse_export_datetime(value: str, fold: int = 0) -> Optional[datetime]:
+    """Parse a date from the CSV export and convert it to UTC.
+
+    Dates without an offset are Danish local time; fold selects the second
+    occurrence of the repeated hour when daylight saving time ends.
+    """
+    value = value.strip()
+    parsed = parse_api_datetime(value) if "T" in value else None
+    if parsed is not None and parsed.tzinfo is not None:
+        return parsed.astimezone(timezone.utc)
+    for date_format in _EXPORT_DATE_FORMATS:
+        try:
+            parsed = datetime.strptime(value, date_format)
+        except ValueError:
+            continue
+        return parsed.replace(tzinfo=API_TIME_ZONE, fold=fold).astimezone(timezone.utc)
+    return None
+
+
+class ExportStreamParser:
+    """Incremental parser for the time series CSV export.
+
+    Feed the body line by line with feed(). Each row is turned into a point
+    of the calendar day (Danish time) it belongs to, so the records match
+    those of iter_time_series_points() for daily periods.
+    """
+
+    def __init__(self, resolution: Optional[str]):
+        """Initialize the parser.
+
+        Args:
+            resolution: Resolution of the export rows (PT15M or PT1H). If None,
+                it is read from the first row of each metering point.
+
+        Raises:
+            ValueError: If the resolution is not supported
+        """
+        if resolution is not None and resolution not in RESOLUTION_STEPS:
+            raise ValueError(f"Unsupported export resolution: {resolution}")
+        self._resolution = resolution
+        self._delimiter: Optional[str] = None
+        self._columns: Dict[str, int] = {}
+        self._width = 0
+        self._last_start: Dict[str, datetime] = {}
+        self._resolutions: Dict[str, str] = {}
+        self._day_bounds: Dict[Any, Tuple[datetime, datetime]] = {}
+
+    def feed(self, line: Union[bytes, str]) -> List[Tuple[str, TimeSeriesPoint]]:
+        """Parse the next line of the body.
+
+        Args:
+            line: Next line of the CSV body
+
+        Returns:
+            (metering point ID, TimeSeriesPoint) for the row, if it has one
+
+        Raises:
+            ValueError: If the header is not recognized
+        """
+        line = next(_decode_lines([line]))
+        if not line.strip():
+            return []
+        if self._delimiter is None:
+            self._read_header(line)
+            return []
+        row = next(csv.reader([line], delimiter=self._delimiter))
+        point = self._parse_row(row)
+        return [point] if point is not None else []
+
+    def _read_header(self, header: str):
+        """Find the columns in the header line."""
+        delimiter = ";" if ";" in header else ","
+        names = [name.strip().lower().replace("_", " ") for name in next(csv.reader([header], delimiter=delimiter))]
+        for column, aliases in _EXPORT_COLUMNS.items():
+            for alias in aliases:
+                if alias in names:
+                    self._columns[column] = names.index(alias)
+                    break
+        required = {"metering_point", "start", "quantity"} if self._resolution else {"metering_point", "start", "end", "quantity"}
+        if not required <= self._columns.keys():
+            raise ValueError(f"Unrecognized time series export header: {header.strip()}")
+        self._delimiter = delimiter
+        self._width = max(self._columns.values()) + 1
+
+    def _parse_row(self, row: List[str]) -> Optional[Tuple[str, TimeSeriesPoint]]:
+        """Turn a data row into a point, or None if it is not usable."""
+        columns = self._columns
+        if len(row) < self._width:
+            return None
+        metering_point = row[columns["metering_point"]].strip()
+        start = _parse_export_datetime(row[columns["start"]])
+        if start is None:
+            return None
+        # The repeated hour when daylight saving time ends parses to the same
+        # local time twice; the second row is the later occurrence
+        previous = self._last_start.get(metering_point)
+        if previous is not None and start <= previous:
+            start = _parse_export_datetime(row[columns["start"]], fold=1)
+        self._last_start[metering_point] = start
+
+        row_resolution = self._resolution or self._resolutions.get(metering_point)
+        if row_resolution is None:
+            end = _parse_export_datetime(row[columns["end"]])
+            row_resolution = next((name for name, step in RESOLUTION_STEPS.items() if end is not None and end - start == step), None)
+            if row_resolution is None:
+                return None
+            self._resolutions[metering_point] = row_resolution
+        step = RESOLUTION_STEPS[row_resolution]
+
+        quantity = row[columns["quantity"]].strip().replace(",", ".")
+        try:
+            quantity = float(quantity) if quantity else None
+        except ValueError:
+            return None
+
+        day = start.astimezone(API_TIME_ZONE).date()
+        bounds = self._day_bounds.get(day)
+        if bounds is None:
+            bounds = self._day_bounds[day] = (
+                datetime.combine(day, time(), tzinfo=API_TIME_ZONE).astimezone(timezone.utc),
+                datetime.combine(day + timedelta(days=1), time(), tzinfo=API_TIME_ZONE).astimezone(timezone.utc),
+            )
+        quality_column = columns.get("quality")
+        return metering_point, TimeSeriesPoint(
+            bounds[0],
+            bounds[1],
+            row_resolution,
+            int((start - bounds[0]) / step) + 1,
+            quantity,
+            row[quality_column].strip() if quality_column is not None else None,
+        )
+
+
+def iter_export_points(lines: Iterable[Union[bytes, str]], resolution: Optional[str]) -> Iterator[Tuple[str, TimeSeriesPoint]]:
+    """Parse a time series CSV export line by line.
+
+    Args:
+        lines: Lines of the CSV body, e.g. response.iter_lines()
+        resolution: Resolution of the export rows (PT15M or PT1H). If None,
+            it is read from the first row of each metering point.
+
+    Yields:
+        (metering point ID, TimeSeriesPoint) per row, in file order
+
+    Raises:
+        ValueError: If the header is not recognized
+    """
+    parser = ExportStreamParser(resolution)
+    for line in lines:
+        yield from parser.feed(line)
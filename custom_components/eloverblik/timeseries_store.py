@@ -0,0 +1,424 @@
+"""Persistent local store for time series data already received from Eloverblik."""
+from array import array
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional, List, Dict, Iterable, Set, Tuple
+import base64
+import logging
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+
+from .models import API_TIME_ZONE, TimeSeriesPeriod
+
+_LOGGER = logging.getLogger(__name__)
+
+# Version for logging
+try:
+    manifest_path = os.path.join(os.path.dirname(__file__), 'manifest.json')
+    with open(manifest_path) as f:
+        VERSION = json.load(f).get('version', 'unknown')
+except Exception:
+    VERSION = 'unknown'
+
+# Bump when the file layout changes; files with another version are discarded
+STORE_VERSION = 2
+
+# Version 1 kept every day in the index file; it is migrated on load
+LEGACY_STORE_VERSION = 1
+
+# Stored day: (start_timestamp, end_timestamp, resolution, values)
+DayEntry = Tuple[int, int, str, array]
+
+
+class TimeSeriesStore:
+    """Store of the hourly and monthly values received for one metering point.
+
+    Hourly periods are indexed by their calendar day (Danish time), monthly
+    values by their month, so fetch paths can look up which days or months
+    are already known and only request the gaps. Only complete periods are
+    stored; days with missing points are fetched again later.
+
+    The index file (JSON) holds the monthly values and a bitmask per month
+    of the days that are stored:
+    {
+      "version": 2,
+      "days": {"YYYY-MM": bitmask},
+      "months": {"YYYY-MM": value},
+      "final_months": ["YYYY-MM", ...]
+    }
+
+    The hourly values live in one file per month in a directory next to it,
+    with the values packed as little-endian doubles:
+    {"YYYY-MM-DD": [start_timestamp, end_timestamp, resolution, "base64"]}
+
+    Only months with new days are written on save. Month files are read on
+    demand and are only kept in memory until their changes are saved, so
+    the hourly history is not held for the lifetime of the store.
+
+    The store is loaded lazily and is safe to use from several executor threads.
+    """
+
+    def __init__(self, path: Optional[str]):
+        """Initialize the store.
+
+        Args:
+            path: Path to the index file backing the store. If None, the
+                store only lives in memory.
+        """
+        self._path = path
+        self._lock = threading.RLock()
+        self._day_masks: Optional[Dict[str, int]] = None
+        # Month files read for changes, kept until they are saved
+        self._chunks: Dict[str, Dict[str, DayEntry]] = {}
+        self._dirty_chunks: Set[str] = set()
+        self._months: Dict[str, float] = {}
+        self._final_months: Set[str] = set()
+        self._dirty = False
+
+    @property
+    def path(self) -> Optional[str]:
+        """Path to the index file backing the store."""
+        return self._path
+
+    @property
+    def _chunk_dir(self) -> str:
+        """Directory holding the month files."""
+        return f"{os.path.splitext(self._path)[0]}.days"
+
+    def _chunk_path(self, month: str) -> str:
+        """Path to the file holding the days of a month."""
+        return os.path.join(self._chunk_dir, f"{month}.json")
+
+    def _ensure_loaded(self):
+        """Load the index from disk on first use."""
+        if self._day_masks is not None:
+            return
+        self._day_masks = {}
+        self._months = {}
+        self._final_months = set()
+        if self._path is None:
+            return
+        data = _read_json(self._path)
+        if data is None:
+            return
+
+        if not isinstance(data, dict) or data.get("version") not in (STORE_VERSION, LEGACY_STORE_VERSION):
+            _LOGGER.debug(f"[v{VERSION}] Discarding time series store {self._path} with unknown version")
+            return
+        if isinstance(data.get("months"), dict):
+            self._months = data["months"]
+        if isinstance(data.get("final_months"), list):
+            self._final_months = set(data["final_months"])
+        if not isinstance(data.get("days"), dict):
+            return
+        if data["version"] == LEGACY_STORE_VERSION:
+            self._migrate_legacy_days(data["days"])
+        else:
+            self._day_masks = {month: mask for month, mask in data["days"].items() if isinstance(mask, int)}
+        _LOGGER.debug(f"[v{VERSION}] Loaded index of {len(self._day_masks)} month(s) of days and {len(self._months)} month(s) from {self._path}")
+
+    def _migrate_legacy_days(self, days: Dict[str, list]):
+        """Move the days of a version 1 store into month files on the next save."""
+        for key, (start, end, resolution, values) in days.items():
+            self._set_day(key, (start, end, resolution, array("d", values)))
+        self._dirty = True
+        _LOGGER.debug(f"[v{VERSION}] Migrating {len(days)} day(s) in {self._path} to month files")
+
+    def _read_chunk(self, month: str) -> Dict[str, DayEntry]:
+        """Get the days of a month, reading them from disk if they are not in memory."""
+        chunk = self._chunks.get(month)
+        if chunk is not None:
+            return chunk
+        chunk = {}
+        if self._path is None or not self._day_masks.get(month):
+            return chunk
+        data = _read_json(self._chunk_path(month))
+        if not isinstance(data, dict):
+            # Forget the days, so they are fetched again
+            self._day_masks.pop(month, None)
+            self._dirty = True
+            return chunk
+        for key, (start, end, resolution, packed) in data.items():
+            chunk[key] = (start, end, resolution, _unpack_values(packed))
+        return chunk
+
+    def _set_day(self, key: str, entry: DayEntry):
+        """Store a day, keeping its month in memory until it is saved."""
+        month = key[:7]
+        if month not in self._chunks:
+            self._chunks[month] = self._read_chunk(month)
+        self._chunks[month][key] = entry
+        self._dirty_chunks.add(month)
+        self._day_masks[month] = self._day_masks.get(month, 0) | 1 << (int(key[8:10]) - 1)
+
+    def _has_day(self, day: date) -> bool:
+        """True if the day is stored."""
+        return bool(self._day_masks.get(f"{day.year:04d}-{day.month:02d}", 0) >> (day.day - 1) & 1)
+
+    def save(self):
+        """Write the changed months and the index to disk.
+
+        Files are replaced atomically, so a crash never leaves a partial
+        file. The months written are dropped from memory afterwards.
+        """
+        with self._lock:
+            if self._path is None or self._day_masks is None:
+                return
+            for month in sorted(self._dirty_chunks):
+                chunk = self._chunks[month]
+                data = {
+                    key: [start, end, resolution, _pack_values(values)]
+                    for key, (start, end, resolution, values) in sorted(chunk.items())
+                }
+                if not _write_json(self._chunk_path(month), data):
+                    return
+                self._dirty_chunks.discard(month)
+                del self._chunks[month]
+            if not self._dirty:
+                return
+            data = {
+                "version": STORE_VERSION,
+                "days": self._day_masks,
+                "months": self._months,
+                "final_months": sorted(self._final_months),
+            }
+            if _write_json(self._path, data):
+                self._dirty = False
+
+    def remove(self):
+        """Delete the store files."""
+        with self._lock:
+            if self._path is not None:
+                shutil.rmtree(self._chunk_dir, ignore_errors=True)
+                try:
+                    os.remove(self._path)
+                except FileNotFoundError:
+                    pass
+            self._day_masks = None
+            self._chunks = {}
+            self._dirty_chunks = set()
+            self._months = {}
+            self._final_months = set()
+            self._dirty = False
+
+    def add_day_periods(self, periods: Iterable[TimeSeriesPeriod]) -> int:
+        """Add periods from an hourly (or quarter-hourly) time series response.
+
+        Each complete period is stored under its calendar day. Incomplete
+        periods are ignored, so they are fetched again later. The months
+        changed stay in memory until save() is called.
+
+        Args:
+            periods: Periods to add
+
+        Returns:
+            Number of days added or changed
+        """
+        changed = 0
+        with self._lock:
+            self._ensure_loaded()
+            for period in periods:
+                if not period.is_complete:
+                    continue
+                key = period.local_date.isoformat()
+                entry = (
+                    int(period.start.timestamp()),
+                    int(period.end.timestamp()),
+                    period.resolution or "PT1H",
+                    array("d", period.values),
+                )
+                if self._read_chunk(key[:7]).get(key) != entry:
+                    self._set_day(key, entry)
+                    changed += 1
+            if changed:
+                self._dirty = True
+        return changed
+
+    def add_month_periods(self, periods: Iterable[TimeSeriesPeriod], finalize_before: Optional[date] = None) -> int:
+        """Add periods from a monthly time series response.
+
+        Each point is stored under its month, counted from the period's first month.
+
+        Args:
+            periods: Periods to add
+            finalize_before: Months that ended before this day are marked as
+                final and will not be requested again
+
+        Returns:
+            Number of months added or changed
+        """
+        changed = 0
+        with self._lock:
+            self._ensure_loaded()
+            for period in periods:
+                local_start = period.start.astimezone(API_TIME_ZONE)
+                first_month = local_start.year * 12 + local_start.month - 1
+                for offset, value in enumerate(period.values):
+                    if value is None:
+                        continue
+                    month = first_month + offset
+                    key = f"{month // 12:04d}-{month % 12 + 1:02d}"
+                    if self._months.get(key) != value:
+                        self._months[key] = value
+                        changed += 1
+                    next_month = month + 1
+                    month_end = date(next_month // 12, next_month % 12 + 1, 1)
+                    if finalize_before is not None and month_end < finalize_before and key not in self._final_months:
+                        self._final_months.add(key)
+                        changed += 1
+            if changed:
+                self._dirty = True
+        return changed
+
+    def get_final_months(self) -> Set[str]:
+        """Get the months ("YYYY-MM") whose values are final."""
+        with self._lock:
+            self._ensure_loaded()
+            return set(self._final_months)
+
+    def get_day(self, day: date) -> Optional[TimeSeriesPeriod]:
+        """Get the stored period for a calendar day.
+
+        Args:
+            day: Calendar day (Danish time)
+
+        Returns:
+            The stored period, or None if the day is not stored
+        """
+        with self._lock:
+            self._ensure_loaded()
+            if not self._has_day(day):
+                return None
+            entry = self._read_chunk(day.isoformat()[:7]).get(day.isoformat())
+        return _period_from_entry(entry) if entry else None
+
+    def get_days(self, date_from: date, date_to: date) -> List[TimeSeriesPeriod]:
+        """Get all stored periods in a range of calendar days.
+
+        Each month file is read once and not kept in memory afterwards.
+
+        Args:
+            date_from: First day (inclusive)
+            date_to: Last day (exclusive)
+
+        Returns:
+            Stored periods in chronological order
+        """
+        periods = []
+        chunk_month: Optional[str] = None
+        chunk: Dict[str, DayEntry] = {}
+        day = date_from
+        with self._lock:
+            self._ensure_loaded()
+            while day < date_to:
+                if self._has_day(day):
+                    key = day.isoformat()
+                    if key[:7] != chunk_month:
+                        chunk_month = key[:7]
+                        chunk = self._read_chunk(chunk_month)
+                    entry = chunk.get(key)
+                    if entry:
+                        periods.append(_period_from_entry(entry))
+                day += timedelta(days=1)
+        return periods
+
+    def missing_day_ranges(self, date_from: date, date_to: date) -> List[Tuple[date, date]]:
+        """Find the days in a range that are not stored yet.
+
+        Adjacent missing days are coalesced into one range, so each range can
+        be fetched with a single request. Only the index is consulted.
+
+        Args:
+            date_from: First day (inclusive)
+            date_to: Last day (exclusive)
+
+        Returns:
+            List of (first missing day, day after last missing day) ranges
+        """
+        ranges: List[Tuple[date, date]] = []
+        gap_start: Optional[date] = None
+        day = date_from
+        with self._lock:
+            self._ensure_loaded()
+            while day < date_to:
+                if self._has_day(day):
+                    if gap_start is not None:
+                        ranges.append((gap_start, day))
+                        gap_start = None
+                elif gap_start is None:
+                    gap_start = day
+                day += timedelta(days=1)
+        if gap_start is not None:
+            ranges.append((gap_start, date_to))
+        return ranges
+
+    def get_months(self) -> Dict[str, float]:
+        """Get all stored monthly values keyed by "YYYY-MM"."""
+        with self._lock:
+            self._ensure_loaded()
+            return dict(self._months)
+
+
+def _pack_values(values: array) -> str:
+    """Pack day values as base64 of little-endian doubles."""
+    if sys.byteorder == "big":
+        values = array("d", values)
+        values.byteswap()
+    return base64.b64encode(values.tobytes()).decode("ascii")
+
+
+def _unpack_values(packed: str) -> array:
+    """Unpack day values written by _pack_values()."""
+    values = array("d", base64.b64decode(packed))
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def _read_json(path: str):
+    """Read a JSON file, or return None if it is missing or unreadable."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        _LOGGER.warning(f"[v{VERSION}] Could not read time series store {path}: {e}. Its data will be fetched again.")
+        return None
+
+
+def _write_json(path: str, data) -> bool:
+    """Replace a JSON file atomically.
+
+    Returns:
+        True if the file was written
+    """
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".eloverblik_", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        _LOGGER.warning(f"[v{VERSION}] Could not write time series store {path}: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return False
+    return True
+
+
+def _period_from_entry(entry: DayEntry) -> TimeSeriesPeriod:
+    """Convert a stored day entry back into a TimeSeriesPeriod."""
+    start, end, resolution, values = entry
+    return TimeSeriesPeriod(
+        datetime.fromtimestamp(start, tz=timezone.utc),
+        datetime.fromtimestamp(end, tz=timezone.utc),
+        resolution,
+        values.tolist(),
+    )
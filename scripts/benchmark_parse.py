@@ -0,0 +1,112 @@
+"""Benchmark the time series parsers.
+
+Builds a synthetic gettimeseries response (two years of hourly data by
+default) and reports the parse throughput in points per second for:
+
+- json.loads + TimeSeries (the dict based parser)
+- iter_periods (used to fill the time series store)
+- the streaming parser (iter_time_series_points)
+
+The integration modules are loaded straight from custom_components, so
+Home Assistant does not need to be installed.
+
+Usage:
+    python scripts/benchmark_parse.py [--days 730] [--repeat 5] [--debug]
+"""
+import argparse
+import importlib
+import json
+import logging
+import os
+import sys
+import time
+import types
+from datetime import datetime, timedelta, timezone
+
+COMPONENT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "custom_components", "eloverblik")
+
+
+def load_modules():
+    """Import models and streaming without running the integration __init__."""
+    package = types.ModuleType("eloverblik")
+    package.__path__ = [COMPONENT_DIR]
+    sys.modules["eloverblik"] = package
+    return importlib.import_module("eloverblik.models"), importlib.import_module("eloverblik.streaming")
+
+
+def build_response(days: int) -> bytes:
+    """Build a gettimeseries response body with one hourly Period per day."""
+    start = datetime(2023, 1, 1, 23, tzinfo=timezone.utc)
+    periods = []
+    for day in range(days):
+        period_start = start + timedelta(days=day)
+        periods.append({
+            "resolution": "PT1H",
+            "timeInterval": {
+                "start": period_start.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "end": (period_start + timedelta(days=1)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            },
+            "Point": [
+                {
+                    "position": str(hour + 1),
+                    "out_Quantity.quantity": f"{(day * 24 + hour) % 997 / 1000:.3f}",
+                    "out_Quantity.quality": "A04",
+                }
+                for hour in range(24)
+            ],
+        })
+    data = {
+        "result": [{
+            "MyEnergyData_MarketDocument": {
+                "mRID": "benchmark",
+                "TimeSeries": [{"mRID": "571313100000000000", "Period": periods}],
+            },
+            "success": True,
+            "errorCode": 10000,
+            "errorText": "No error",
+            "id": "571313100000000000",
+        }]
+    }
+    return json.dumps(data).encode()
+
+
+def measure(name: str, func, points: int, repeat: int):
+    """Run func repeat times and print the best throughput."""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"{name:<32} {best * 1000:9.1f} ms {points / best:14,.0f} points/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=730, help="Days of hourly data in the response")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per parser; the best run is reported")
+    parser.add_argument("--debug", action="store_true", help="Enable debug logging (to a null handler)")
+    args = parser.parse_args()
+
+    logging.basicConfig(handlers=[logging.NullHandler()], level=logging.DEBUG if args.debug else logging.WARNING)
+
+    models, streaming = load_modules()
+    body = build_response(args.days)
+    points = args.days * 24
+    chunk_size = streaming.STREAM_CHUNK_SIZE
+
+    print(f"{args.days} days, {points:,} points, {len(body) / 1024 / 1024:.1f} MB body")
+    measure("json.loads + TimeSeries", lambda: models.TimeSeries(json.loads(body)), points, args.repeat)
+    measure("json.loads + iter_periods", lambda: list(models.iter_periods(json.loads(body))), points, args.repeat)
+    measure(
+        "streaming parser",
+        lambda: models.TimeSeries.from_points(
+            streaming.iter_time_series_points(body[i:i + chunk_size] for i in range(0, len(body), chunk_size))
+        ),
+        points,
+        args.repeat,
+    )
+
+
+if __name__ == "__main__":
+    main()
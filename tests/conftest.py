@@ -0,0 +1,37 @@
+"""Test setup.
+
+The integration's __init__ module needs Home Assistant, so the package is
+registered without running it. The API client, cache and store modules
+only need their own dependencies.
+"""
+import os
+import sys
+import types
+
+import pytest
+
+PACKAGE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "custom_components", "eloverblik")
+
+if "eloverblik" not in sys.modules:
+    package = types.ModuleType("eloverblik")
+    package.__path__ = [PACKAGE_DIR]
+    sys.modules["eloverblik"] = package
+
+
+class FakeClock:
+    """Stand-in for the time module with a monotonic clock moved by hand."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Clock to patch in as the time module of the module under test."""
+    return FakeClock()
@@ -0,0 +1,133 @@
+"""Tests for batched requests across the metering points of a config entry."""
+from datetime import datetime
+
+import pytest
+
+from eloverblik import batch
+from eloverblik.api_client import _split_batch_response
+from eloverblik.batch import BATCH_RESPONSE_MAX_AGE, EntryBatchFetcher
+
+MP1 = "571313100000000001"
+MP2 = "571313100000000002"
+MP3 = "571313100000000003"
+
+DATE_FROM = datetime(2024, 3, 1)
+DATE_TO = datetime(2024, 3, 2)
+
+
+class FakeBatchAPI:
+    """Records batched calls and answers for every requested metering point."""
+
+    def __init__(self, missing=()):
+        self.calls = []
+        self.missing = set(missing)
+
+    def _answer(self, kind, metering_points):
+        self.calls.append((kind, list(metering_points)))
+        return {
+            point: {"result": [{"id": point, "kind": kind, "call": len(self.calls)}]}
+            for point in metering_points if point not in self.missing
+        }
+
+    def get_time_series_batch(self, metering_points, date_from, date_to, aggregation):
+        return self._answer(("timeseries", date_from, date_to, aggregation), metering_points)
+
+    def get_charges_batch(self, metering_points):
+        return self._answer("charges", metering_points)
+
+
+@pytest.fixture
+def fetcher_api(monkeypatch, clock):
+    monkeypatch.setattr(batch, "time", clock)
+    api = FakeBatchAPI(missing={MP3})
+    fetcher = EntryBatchFetcher(api)
+    for point in (MP1, MP2, MP3):
+        fetcher.add_metering_point(point)
+    return fetcher, api
+
+
+def test_split_batch_response_by_id():
+    response = {"result": [{"id": MP2, "success": True}, {"id": MP1, "success": True}]}
+
+    split = _split_batch_response(response, [MP1, MP2])
+
+    assert split == {
+        MP1: {"result": [{"id": MP1, "success": True}]},
+        MP2: {"result": [{"id": MP2, "success": True}]},
+    }
+
+
+def test_split_batch_response_falls_back_to_metering_point_id_and_order():
+    response = {"result": [
+        {"result": {"meteringPointId": MP2}},
+        {"success": False},
+        "not an item",
+    ]}
+
+    split = _split_batch_response(response, [MP1, MP3])
+
+    assert split == {
+        MP2: {"result": [{"result": {"meteringPointId": MP2}}]},
+        MP3: {"result": [{"success": False}]},
+    }
+
+
+def test_split_batch_response_ignores_malformed_responses():
+    assert _split_batch_response(None, [MP1]) == {}
+    assert _split_batch_response({"result": None}, [MP1]) == {}
+
+
+def test_one_batch_serves_every_metering_point(fetcher_api):
+    fetcher, api = fetcher_api
+
+    first = fetcher.get_time_series(MP1, DATE_FROM, DATE_TO, "Hour")
+    second = fetcher.get_time_series(MP2, DATE_FROM, DATE_TO, "Hour")
+
+    assert len(api.calls) == 1
+    assert api.calls[0][1] == [MP1, MP2, MP3]
+    assert first["result"][0]["id"] == MP1
+    assert second["result"][0]["id"] == MP2
+
+
+def test_metering_point_missing_from_batch_gets_none(fetcher_api):
+    fetcher, api = fetcher_api
+
+    assert fetcher.get_charges(MP3) is None
+    assert fetcher.get_charges(MP1) is not None
+    assert len(api.calls) == 1
+
+
+def test_requests_are_batched_per_kind_and_range(fetcher_api):
+    fetcher, api = fetcher_api
+
+    fetcher.get_time_series(MP1, DATE_FROM, DATE_TO, "Hour")
+    fetcher.get_time_series(MP1, DATE_FROM, DATE_TO, "Day")
+    fetcher.get_charges(MP1)
+    fetcher.get_charges(MP2)
+
+    assert [kind for kind, _ in api.calls] == [
+        ("timeseries", DATE_FROM, DATE_TO, "Hour"),
+        ("timeseries", DATE_FROM, DATE_TO, "Day"),
+        "charges",
+    ]
+
+
+def test_batch_is_fetched_again_after_max_age(fetcher_api, clock):
+    fetcher, api = fetcher_api
+
+    fetcher.get_charges(MP1)
+    clock.advance(BATCH_RESPONSE_MAX_AGE.total_seconds() - 1)
+    assert fetcher.get_charges(MP2)["result"][0]["call"] == 1
+
+    clock.advance(1)
+    assert fetcher.get_charges(MP2)["result"][0]["call"] == 2
+    assert len(api.calls) == 2
+
+
+def test_unknown_metering_point_is_added_to_the_batch(fetcher_api):
+    fetcher, api = fetcher_api
+    fetcher.get_charges(MP1)
+
+    other = "571313100000000004"
+    assert fetcher.get_charges(other)["result"][0]["id"] == other
+    assert api.calls[-1][1] == [MP1, MP2, MP3, other]
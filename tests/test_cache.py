@@ -0,0 +1,98 @@
+"""Tests for the response cache."""
+from datetime import timedelta
+
+import pytest
+
+from eloverblik import cache
+from eloverblik.cache import CachePolicy, CacheStats, ResponseCache
+
+
+@pytest.fixture
+def response_cache(monkeypatch, clock) -> ResponseCache:
+    monkeypatch.setattr(cache, "time", clock)
+    return ResponseCache({
+        "small": CachePolicy(ttl=timedelta(seconds=10), max_entries=2),
+        "revalidating": CachePolicy(
+            ttl=timedelta(seconds=10),
+            max_entries=10,
+            stale_while_revalidate=timedelta(seconds=5),
+        ),
+    })
+
+
+def test_least_recently_used_is_evicted(response_cache):
+    response_cache.set("small", ("mp1", "a"), 1)
+    response_cache.set("small", ("mp1", "b"), 2)
+    assert response_cache.get("small", ("mp1", "a")) == 1
+
+    response_cache.set("small", ("mp1", "c"), 3)
+    assert response_cache.get("small", ("mp1", "b")) is None
+    assert response_cache.get("small", ("mp1", "a")) == 1
+    assert response_cache.get("small", ("mp1", "c")) == 3
+    assert response_cache.stats()["small"].evictions == 1
+
+
+def test_expired_value_only_served_stale(response_cache, clock):
+    response_cache.set("small", ("mp1",), "value")
+    clock.advance(9)
+    assert response_cache.get("small", ("mp1",)) == "value"
+
+    clock.advance(1)
+    assert response_cache.get("small", ("mp1",)) is None
+    assert response_cache.get("small", ("mp1",), allow_stale=True) == "value"
+    assert response_cache.stats()["small"] == CacheStats(hits=1, stale_hits=1, misses=1, evictions=0)
+
+
+def test_stale_while_revalidate_window(response_cache, clock):
+    key = ("mp1",)
+    assert response_cache.get_revalidating("revalidating", key) == (None, True)
+
+    response_cache.set("revalidating", key, "value")
+    assert response_cache.get_revalidating("revalidating", key) == ("value", False)
+
+    clock.advance(12)
+    assert response_cache.get_revalidating("revalidating", key) == ("value", True)
+
+    clock.advance(3)
+    assert response_cache.get_revalidating("revalidating", key) == (None, True)
+    # Kept for fallback when the refresh fails
+    assert response_cache.get("revalidating", key, allow_stale=True) == "value"
+
+
+def test_invalidate_drops_metering_point(response_cache):
+    response_cache.set("small", ("mp1", "a"), 1)
+    response_cache.set("revalidating", ("mp1",), 2)
+    response_cache.set("revalidating", ("mp2",), 3)
+
+    assert response_cache.invalidate("mp1") == 2
+    assert response_cache.get("small", ("mp1", "a")) is None
+    assert response_cache.get("revalidating", ("mp2",)) == 3
+
+
+def test_size_bound_grows_with_metering_points(response_cache):
+    for metering_point in ("mp1", "mp2", "mp3"):
+        response_cache.add_metering_point(metering_point)
+        response_cache.set("small", (metering_point, "a"), 1)
+        response_cache.set("small", (metering_point, "b"), 2)
+
+    # Two entries per metering point fit without evicting each other
+    assert response_cache.stats()["small"].evictions == 0
+    assert response_cache.get("small", ("mp1", "a")) == 1
+
+    response_cache.set("small", ("mp3", "c"), 3)
+    assert response_cache.stats()["small"].evictions == 1
+
+
+def test_removed_metering_point_gives_back_its_room(response_cache):
+    response_cache.add_metering_point("mp1")
+    response_cache.add_metering_point("mp2")
+    for key in ("a", "b"):
+        response_cache.set("small", ("mp1", key), key)
+        response_cache.set("small", ("mp2", key), key)
+
+    assert response_cache.remove_metering_point("mp1") == 2
+    assert response_cache.get("small", ("mp1", "a")) is None
+
+    response_cache.set("small", ("mp2", "c"), "c")
+    assert response_cache.get("small", ("mp2", "a")) is None
+    assert response_cache.get("small", ("mp2", "c")) == "c"
@@ -0,0 +1,116 @@
+"""Tests for the charges price tables."""
+from datetime import datetime, timezone
+
+import pytest
+
+from eloverblik.models import ChargesData, TimeSeries
+
+
+def _tariff(name: str, prices, valid_from: str = "2024-01-01T00:00:00", valid_to=None) -> dict:
+    """Tariff item of a getcharges response, with one price per slot."""
+    if not isinstance(prices, list):
+        prices = [prices] * 24
+    return {
+        "name": name,
+        "periodType": "P1H" if len(prices) == 24 else "PT15M",
+        "validFromDate": valid_from,
+        "validToDate": valid_to,
+        "prices": [{"position": str(slot + 1), "price": price} for slot, price in enumerate(prices)],
+    }
+
+
+def _charges(tariffs=(), subscriptions=(), fees=()) -> ChargesData:
+    return ChargesData({"result": [{"result": {
+        "tariffs": list(tariffs),
+        "subscriptions": list(subscriptions),
+        "fees": list(fees),
+    }}]})
+
+
+SUBSCRIPTION = {"name": "Netabonnement", "price": 23.0, "validFromDate": "2024-01-01T00:00:00", "validToDate": None}
+FEE = {"name": "Gebyr", "price": 5.0, "validFromDate": "2024-01-01T00:00:00", "validToDate": None}
+
+
+def test_hourly_prices_follow_danish_time():
+    charges = _charges([_tariff("Nettarif", [hour / 100 for hour in range(24)]), _tariff("Elafgift", 0.5)])
+
+    # Naive times are Danish local time
+    assert charges.get_price_sum_at(datetime(2024, 6, 1, 17, 30)) == pytest.approx(0.67)
+    # 15:00 UTC is 17:00 in Danish summer time
+    assert charges.get_hour_kwh_price_at(datetime(2024, 6, 1, 15, tzinfo=timezone.utc)) == pytest.approx(0.67)
+
+
+def test_quarter_hour_prices_and_hourly_mean():
+    charges = _charges([_tariff("Nettarif", [slot / 1000 for slot in range(96)]), _tariff("Elafgift", 0.5)])
+
+    assert charges.slots_per_day == 96
+    assert charges.get_price_sum_at(datetime(2024, 6, 1, 1, 45)) == pytest.approx(0.507)
+    # Hourly consumption is priced with the mean of the hour's four prices
+    assert charges.get_hour_kwh_price_at(datetime(2024, 6, 1, 1, 0)) == pytest.approx(0.5055)
+
+
+def test_subscriptions_and_fees_are_not_priced_per_kwh():
+    charges = _charges([_tariff("Nettarif", 0.25), _tariff("Elafgift", 0.5)], [SUBSCRIPTION], [FEE])
+    when = datetime(2024, 6, 1, 12)
+
+    assert charges.get_price_sum_at(when) == pytest.approx(28.75)
+    assert charges.get_hour_kwh_price_at(when) == pytest.approx(0.75)
+
+
+def test_cost_uses_the_price_per_kwh():
+    charges = _charges([_tariff("Nettarif", 0.25), _tariff("Elafgift", 0.5)], [SUBSCRIPTION], [FEE])
+    # One day of 1 kWh per hour, from Danish midnight
+    consumption = TimeSeries.from_values(
+        [1.0] * 24,
+        datetime(2024, 6, 1, 22, tzinfo=timezone.utc),
+        datetime(2024, 5, 31, 22, tzinfo=timezone.utc),
+        "PT1H",
+    )
+
+    assert charges.cost(consumption) == pytest.approx(18.0)
+
+
+NETTARIF_JANUARY = _tariff("Nettarif", 0.2, "2024-01-01T00:00:00", "2024-02-01T00:00:00")
+NETTARIF_FEBRUARY = _tariff("Nettarif", 0.3, "2024-02-01T00:00:00")
+
+
+def test_versions_apply_within_their_validity():
+    charges = _charges([NETTARIF_JANUARY, NETTARIF_FEBRUARY, _tariff("Elafgift", 0.5)])
+
+    assert charges.get_hour_kwh_price_at(datetime(2024, 1, 31, 23, 59)) == pytest.approx(0.7)
+    assert charges.get_hour_kwh_price_at(datetime(2024, 2, 1, 0, 0)) == pytest.approx(0.8)
+    # The earliest known version also covers the time before it
+    assert charges.get_hour_kwh_price_at(datetime(2023, 6, 1, 12)) == pytest.approx(0.7)
+
+
+def test_charge_without_successor_ends_at_valid_to():
+    charges = _charges([_tariff("Nettarif", 0.2), _tariff("Rabat", -0.1, "2024-01-01T00:00:00", "2024-03-01T00:00:00")])
+
+    assert charges.get_hour_kwh_price_at(datetime(2024, 2, 29, 23)) == pytest.approx(0.1)
+    assert charges.get_hour_kwh_price_at(datetime(2024, 3, 1, 0)) == pytest.approx(0.2)
+
+
+def test_merged_history_prices_older_data():
+    previous = _charges([NETTARIF_JANUARY, NETTARIF_FEBRUARY])
+    # The January version has expired and is no longer returned
+    current = _charges([NETTARIF_FEBRUARY])
+    assert current.get_hour_kwh_price_at(datetime(2024, 1, 15, 12)) == pytest.approx(0.3)
+
+    current.merge_history(previous)
+
+    assert current.get_hour_kwh_price_at(datetime(2024, 1, 15, 12)) == pytest.approx(0.2)
+    assert current.get_hour_kwh_price_at(datetime(2024, 2, 15, 12)) == pytest.approx(0.3)
+    assert len(current.versions) == 2
+
+
+def test_cost_is_split_at_version_boundaries():
+    charges = _charges([NETTARIF_JANUARY, NETTARIF_FEBRUARY])
+    # January 31 and February 1, 1 kWh per hour, from Danish midnight
+    consumption = TimeSeries.from_values(
+        [1.0] * 48,
+        datetime(2024, 2, 1, 23, tzinfo=timezone.utc),
+        datetime(2024, 1, 30, 23, tzinfo=timezone.utc),
+        "PT1H",
+    )
+
+    assert charges.cost(consumption) == pytest.approx(24 * 0.2 + 24 * 0.3)
@@ -0,0 +1,64 @@
+"""Tests for the circuit breaker."""
+from eloverblik import api_client
+from eloverblik.api_client import CIRCUIT_CLOSED, CIRCUIT_HALF_OPEN, CIRCUIT_OPEN, CircuitBreaker
+
+
+def _breaker(monkeypatch, clock) -> CircuitBreaker:
+    monkeypatch.setattr(api_client, "time", clock)
+    return CircuitBreaker(failure_threshold=2, open_seconds=10, max_open_seconds=30)
+
+
+def test_opens_after_consecutive_failures(monkeypatch, clock):
+    breaker = _breaker(monkeypatch, clock)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.before_request() == CIRCUIT_CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == CIRCUIT_OPEN
+    assert breaker.before_request() == CIRCUIT_OPEN
+
+
+def test_half_open_probe_closes_circuit(monkeypatch, clock):
+    breaker = _breaker(monkeypatch, clock)
+    breaker.record_failure()
+    breaker.record_failure()
+
+    clock.advance(10)
+    assert breaker.before_request() == CIRCUIT_HALF_OPEN
+    # Only one caller probes; the others keep failing fast
+    assert breaker.before_request() == CIRCUIT_OPEN
+
+    breaker.record_success()
+    assert breaker.state == CIRCUIT_CLOSED
+    assert breaker.before_request() == CIRCUIT_CLOSED
+
+
+def test_failed_probe_doubles_open_time_up_to_max(monkeypatch, clock):
+    breaker = _breaker(monkeypatch, clock)
+    breaker.record_failure()
+    breaker.record_failure()
+    clock.advance(10)
+    assert breaker.before_request() == CIRCUIT_HALF_OPEN
+    breaker.record_failure()
+
+    # 10 seconds doubled
+    clock.advance(19)
+    assert breaker.before_request() == CIRCUIT_OPEN
+    clock.advance(1)
+    assert breaker.before_request() == CIRCUIT_HALF_OPEN
+    breaker.record_failure()
+
+    # 20 seconds doubled, capped at 30
+    clock.advance(29)
+    assert breaker.before_request() == CIRCUIT_OPEN
+    clock.advance(1)
+    assert breaker.before_request() == CIRCUIT_HALF_OPEN
+
+    # A successful probe resets the open time
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    clock.advance(10)
+    assert breaker.before_request() == CIRCUIT_HALF_OPEN
@@ -0,0 +1,97 @@
+"""Tests for the request scheduler."""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from eloverblik import api_client
+from eloverblik.api_client import (
+    PRIORITY_BACKFILL,
+    PRIORITY_ENERGY,
+    PRIORITY_TOKEN,
+    EloverblikAPIError,
+    RequestScheduler,
+)
+
+
+def _wait_for_queue(scheduler: RequestScheduler, length: int):
+    """Wait until the given number of requests are queued."""
+    deadline = time.monotonic() + 5
+    while len(scheduler._queue) < length:
+        assert time.monotonic() < deadline, "requests were not queued"
+        time.sleep(0.01)
+
+
+def test_burst_then_empty_bucket():
+    scheduler = RequestScheduler(requests_per_minute=1, burst=2)
+    scheduler.acquire(timeout=0)
+    scheduler.acquire(timeout=0)
+    with pytest.raises(EloverblikAPIError):
+        scheduler.acquire(timeout=0)
+    assert scheduler._queue == []
+
+
+def test_refill_at_rate_up_to_burst(monkeypatch, clock):
+    monkeypatch.setattr(api_client, "time", clock)
+    scheduler = RequestScheduler(requests_per_minute=60, burst=2)
+    scheduler.acquire(timeout=0)
+    scheduler.acquire(timeout=0)
+
+    clock.advance(1)
+    scheduler.acquire(timeout=0)
+    with pytest.raises(EloverblikAPIError):
+        scheduler.acquire(timeout=0)
+
+    # A long idle time refills no more than the burst
+    clock.advance(3600)
+    scheduler.acquire(timeout=0)
+    scheduler.acquire(timeout=0)
+    with pytest.raises(EloverblikAPIError):
+        scheduler.acquire(timeout=0)
+
+
+def test_pause_empties_bucket_and_is_capped(monkeypatch, clock):
+    monkeypatch.setattr(api_client, "time", clock)
+    scheduler = RequestScheduler(requests_per_minute=60, burst=5)
+
+    scheduler.pause(3600)
+    clock.advance(api_client.MAX_RETRY_DELAY - 1)
+    with pytest.raises(EloverblikAPIError):
+        scheduler.acquire(timeout=0)
+
+    # Resumes after MAX_RETRY_DELAY at the sustained rate, not in a burst
+    clock.advance(2)
+    scheduler.acquire(timeout=0)
+    with pytest.raises(EloverblikAPIError):
+        scheduler.acquire(timeout=0)
+
+
+def test_queued_requests_served_by_priority():
+    scheduler = RequestScheduler(requests_per_minute=600, burst=1)
+    scheduler.pause(0.2)
+    order = []
+
+    def request(priority: int):
+        scheduler.acquire(priority, timeout=5)
+        order.append(priority)
+
+    threads = []
+    for priority in (PRIORITY_BACKFILL, PRIORITY_ENERGY, PRIORITY_TOKEN):
+        thread = threading.Thread(target=request, args=(priority,))
+        thread.start()
+        threads.append(thread)
+        _wait_for_queue(scheduler, len(threads))
+    for thread in threads:
+        thread.join(5)
+
+    assert order == [PRIORITY_TOKEN, PRIORITY_ENERGY, PRIORITY_BACKFILL]
+
+
+def test_async_acquire_times_out_and_leaves_queue():
+    scheduler = RequestScheduler(requests_per_minute=1, burst=1)
+    scheduler.acquire(timeout=0)
+
+    with pytest.raises(EloverblikAPIError):
+        asyncio.run(scheduler.async_acquire(timeout=0.05))
+    assert scheduler._queue == []
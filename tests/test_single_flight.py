@@ -0,0 +1,129 @@
+"""Tests for request coalescing."""
+import asyncio
+import threading
+
+import pytest
+
+from eloverblik.api_client import EloverblikAPIError, SingleFlight
+
+
+class TracedSingleFlight(SingleFlight):
+    """SingleFlight that signals when a caller joined a call in flight."""
+
+    def __init__(self):
+        super().__init__()
+        self.follower_joined = threading.Event()
+
+    def _join(self, key):
+        call, leader = super()._join(key)
+        if not leader:
+            self.follower_joined.set()
+        return call, leader
+
+
+def _run_threads(group: TracedSingleFlight, func):
+    """Run a leader and a follower call in threads and collect their outcomes."""
+    started = threading.Event()
+    release = threading.Event()
+    outcomes = {}
+
+    def leader_func():
+        started.set()
+        release.wait(5)
+        return func()
+
+    def run(name, call):
+        try:
+            outcomes[name] = ("result", group.do("key", call))
+        except Exception as e:
+            outcomes[name] = ("error", e)
+
+    leader = threading.Thread(target=run, args=("leader", leader_func))
+    leader.start()
+    assert started.wait(5)
+    follower = threading.Thread(target=run, args=("follower", lambda: pytest.fail("follower made the call")))
+    follower.start()
+    assert group.follower_joined.wait(5)
+    release.set()
+    leader.join(5)
+    follower.join(5)
+    return outcomes
+
+
+def test_follower_shares_leader_result():
+    group = TracedSingleFlight()
+    result = object()
+    calls = []
+
+    def func():
+        calls.append(1)
+        return result
+
+    outcomes = _run_threads(group, func)
+    assert outcomes == {"leader": ("result", result), "follower": ("result", result)}
+    assert calls == [1]
+    assert group._calls == {}
+
+
+def test_follower_gets_leader_exception():
+    group = TracedSingleFlight()
+    error = EloverblikAPIError("boom")
+
+    def func():
+        raise error
+
+    outcomes = _run_threads(group, func)
+    assert outcomes == {"leader": ("error", error), "follower": ("error", error)}
+    assert group._calls == {}
+
+
+def test_finished_call_is_not_cached():
+    group = SingleFlight()
+    assert group.do("key", lambda: 1) == 1
+    assert group.do("key", lambda: 2) == 2
+
+
+async def _run_tasks(group: TracedSingleFlight, func):
+    """Run a leader and a follower call as tasks and collect their outcomes."""
+    release = asyncio.Event()
+    calls = []
+
+    async def leader_func():
+        calls.append(1)
+        await release.wait()
+        return await func()
+
+    async def follower_func():
+        calls.append(2)
+
+    leader = asyncio.ensure_future(group.async_do("key", leader_func))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(group.async_do("key", follower_func))
+    await asyncio.sleep(0)
+    assert group.follower_joined.is_set()
+    release.set()
+    outcomes = await asyncio.gather(leader, follower, return_exceptions=True)
+    assert calls == [1]
+    return outcomes
+
+
+def test_async_follower_shares_leader_result():
+    group = TracedSingleFlight()
+    result = object()
+
+    async def func():
+        return result
+
+    assert asyncio.run(_run_tasks(group, func)) == [result, result]
+    assert group._calls == {}
+
+
+def test_async_follower_gets_leader_exception():
+    group = TracedSingleFlight()
+    error = EloverblikAPIError("boom")
+
+    async def func():
+        raise error
+
+    assert asyncio.run(_run_tasks(group, func)) == [error, error]
+    assert group._calls == {}
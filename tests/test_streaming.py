@@ -0,0 +1,127 @@
+"""Tests for the streaming time series parsers."""
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from eloverblik.models import iter_periods
+from eloverblik.streaming import (
+    ExportStreamParser,
+    TimeSeriesStreamParser,
+    iter_export_points,
+    iter_point_periods,
+    iter_time_series_points,
+)
+
+# Danish calendar days in UTC: a normal day, the 23 hour day when daylight
+# saving time starts and the 25 hour day when it ends
+NORMAL_DAY = ("2024-01-14T23:00:00Z", "2024-01-15T23:00:00Z", 24)
+SPRING_DAY = ("2024-03-30T23:00:00Z", "2024-03-31T22:00:00Z", 23)
+AUTUMN_DAY = ("2024-10-26T22:00:00Z", "2024-10-27T23:00:00Z", 25)
+
+
+def _period(start: str, end: str, hours: int) -> dict:
+    points = [
+        {"position": str(position), "out_Quantity.quantity": f"{position / 10:.3f}", "out_Quantity.quality": "A04"}
+        for position in range(1, hours + 1)
+    ]
+    # Nested form of the quantity keys
+    points[1] = {"position": "2", "out_Quantity": {"quantity": "9.5", "quality": "A03"}}
+    return {"resolution": "PT1H", "timeInterval": {"start": start, "end": end}, "Point": points}
+
+
+def _response(*days) -> dict:
+    return {"result": [{
+        "success": True,
+        "MyEnergyData_MarketDocument": {
+            "sender_MarketParticipant.name": "Energinet Målepunkt",
+            "TimeSeries": [{"mRID": "571313100000000000", "Period": [_period(*day) for day in days]}],
+        },
+    }]}
+
+
+def _chunks(body: bytes, size: int):
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+@pytest.mark.parametrize("size", [1, 7, 64 * 1024])
+def test_stream_matches_iter_periods_at_any_chunk_size(size):
+    response = _response(NORMAL_DAY, SPRING_DAY, AUTUMN_DAY)
+    body = json.dumps(response, ensure_ascii=False, indent=1).encode("utf-8")
+
+    periods = list(iter_point_periods(iter_time_series_points(_chunks(body, size))))
+
+    assert periods == list(iter_periods(response))
+    assert [len(period.values) for period in periods] == [24, 23, 25]
+    assert periods[0].values[1] == 9.5
+
+
+def test_points_are_returned_when_their_period_completes():
+    body = json.dumps(_response(NORMAL_DAY, SPRING_DAY)).encode("utf-8")
+    second_period = body.index(b'"resolution"', body.index(b'"resolution"') + 1)
+
+    parser = TimeSeriesStreamParser()
+    first = parser.feed(body[:second_period])
+    assert len(first) == 24
+    assert len(parser.feed(body[second_period:]) + parser.close()) == 23
+
+
+def test_missing_points_are_none_in_period():
+    response = _response(NORMAL_DAY)
+    del response["result"][0]["MyEnergyData_MarketDocument"]["TimeSeries"][0]["Period"][0]["Point"][-1]
+    body = json.dumps(response).encode("utf-8")
+
+    period, = iter_point_periods(iter_time_series_points([body]))
+    assert len(period.values) == 24
+    assert period.values[-1] is None
+    assert not period.is_complete
+
+
+def test_truncated_body_raises():
+    body = json.dumps(_response(NORMAL_DAY)).encode("utf-8")
+    with pytest.raises(ValueError):
+        list(iter_time_series_points([body[:-10]]))
+
+
+DANISH_EXPORT = (
+    "Målepunkt id;Fra dato;Til dato;Mængde;Kvalitet\n"
+    "571313100000000000;27-10-2024 00:00:00;27-10-2024 01:00:00;0,5;Målt\n"
+    "571313100000000000;27-10-2024 01:00:00;27-10-2024 02:00:00;0,6;Målt\n"
+    "571313100000000000;27-10-2024 02:00:00;27-10-2024 02:00:00;0,7;Målt\n"
+    "571313100000000000;27-10-2024 02:00:00;27-10-2024 03:00:00;0,8;Målt\n"
+    "571313100000000000;27-10-2024 03:00:00;27-10-2024 04:00:00;;Manglende\n"
+)
+
+
+@pytest.mark.parametrize("encoding", ["utf-8-sig", "cp1252"])
+def test_danish_export_with_repeated_autumn_hour(encoding):
+    lines = DANISH_EXPORT.encode(encoding).splitlines(keepends=True)
+
+    rows = list(iter_export_points(lines, "PT1H"))
+
+    assert {metering_point for metering_point, _ in rows} == {"571313100000000000"}
+    points = [point for _, point in rows]
+    assert [point.position for point in points] == [1, 2, 3, 4, 5]
+    assert [point.quantity for point in points] == [0.5, 0.6, 0.7, 0.8, None]
+    assert points[0].period_start == datetime(2024, 10, 26, 22, tzinfo=timezone.utc)
+    assert points[0].period_end - points[0].period_start == timedelta(hours=25)
+    assert points[0].quality == "Målt"
+
+
+def test_export_resolution_read_from_rows():
+    export = (
+        "Metering point id,From date,To date,Quantity\n"
+        "571313100000000000,2024-01-15 00:00:00,2024-01-15 00:15:00,0.1\n"
+        "571313100000000000,2024-01-15 00:15:00,2024-01-15 00:30:00,0.2\n"
+    )
+    parser = ExportStreamParser(None)
+    rows = [row for line in export.splitlines() for row in parser.feed(line)]
+
+    assert [(point.resolution, point.position) for _, point in rows] == [("PT15M", 1), ("PT15M", 2)]
+    period, = iter_point_periods(point for _, point in rows)
+    assert len(period.values) == 96
+
+
+def test_unrecognized_export_header_raises():
+    with pytest.raises(ValueError):
+        ExportStreamParser("PT1H").feed("id;start;value")
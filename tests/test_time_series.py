@@ -0,0 +1,123 @@
+"""Tests for the time series model."""
+from array import array
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from eloverblik.models import DayData, TimeSeries, TimeSeriesPeriod
+
+START = datetime(2024, 1, 14, 23, tzinfo=timezone.utc)
+QUARTER = timedelta(minutes=15)
+
+
+def _period(start: datetime, values, resolution: str = "PT1H", step: timedelta = timedelta(hours=1)) -> dict:
+    return {
+        "resolution": resolution,
+        "timeInterval": {
+            "start": start.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "end": (start + len(values) * step).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        },
+        "Point": [
+            {"position": str(position), "out_Quantity.quantity": str(value), "out_Quantity.quality": "A04"}
+            for position, value in enumerate(values, start=1) if value is not None
+        ],
+    }
+
+
+def _response(*periods) -> dict:
+    return {"result": [{
+        "success": True,
+        "MyEnergyData_MarketDocument": {"TimeSeries": [{"Period": list(periods)}]},
+    }]}
+
+
+def test_values_are_kept_in_a_typed_array():
+    time_series = TimeSeries(_response(_period(START, [0.5] * 24)))
+
+    assert isinstance(time_series._metering_data, array)
+    assert time_series._metering_data.typecode == "d"
+    assert time_series.start == START
+    assert time_series.data_date == START + timedelta(hours=24)
+    assert time_series.resolution == "PT1H"
+    assert time_series.get_total_metering_data() == pytest.approx(12.0)
+
+
+def test_periods_are_placed_by_offset_in_any_order():
+    second_day = START + timedelta(hours=24)
+    time_series = TimeSeries(_response(
+        _period(second_day, [2.0] * 24),
+        _period(START, [1.0] * 24),
+    ))
+
+    assert time_series.get_metering_data(1) == 1.0
+    assert time_series.get_metering_data(25) == 2.0
+    assert time_series.get_total_metering_data() == pytest.approx(72.0)
+
+
+def test_missing_positions_are_zero():
+    values = [1.0] * 24
+    values[3] = None
+    time_series = TimeSeries(_response(_period(START, values)))
+
+    assert time_series.get_metering_data(4) == 0.0
+    assert time_series.get_metering_data(24) == 1.0
+    with pytest.raises(IndexError):
+        time_series.get_metering_data(25)
+
+
+def test_failed_response_has_no_data():
+    time_series = TimeSeries({"result": [{"success": False, "errorCode": 20000, "errorText": "NoValidDataFound"}]})
+
+    assert time_series.get_total_metering_data() == 0.0
+    assert list(time_series.iter_hourly_values()) == []
+    with pytest.raises(IndexError):
+        time_series.get_metering_data(1)
+
+
+def test_from_period_matches_parsed_response():
+    period = TimeSeriesPeriod(START, START + timedelta(hours=3), "PT1H", [1.5, None, 2.5])
+
+    time_series = TimeSeries.from_period(period)
+
+    assert list(time_series._metering_data) == [1.5, 0.0, 2.5]
+    assert list(time_series.iter_hourly_values()) == [
+        (START, 1.5),
+        (START + timedelta(hours=1), 0.0),
+        (START + timedelta(hours=2), 2.5),
+    ]
+
+
+def test_hourly_start_is_derived_from_data_date():
+    time_series = TimeSeries.from_values([1.0, 2.0], START + timedelta(hours=2))
+
+    assert [hour for hour, _ in time_series.iter_hourly_values()] == [START, START + timedelta(hours=1)]
+
+
+def test_quarter_hours_are_summed_per_hour():
+    quarters = [0.1, 0.2, 0.3, 0.4] * 24
+    time_series = TimeSeries(_response(_period(START, quarters, "PT15M", QUARTER)))
+
+    assert time_series.points_per_hour == 4
+    assert time_series.data_date == START + timedelta(hours=24)
+    hourly = list(time_series.iter_hourly_values())
+    assert len(hourly) == 24
+    assert hourly[0][0] == START
+    assert hourly[23][0] == START + timedelta(hours=23)
+    assert all(value == pytest.approx(1.0) for _, value in hourly)
+
+
+def test_day_data_sums_quarter_hours():
+    quarters = [float(position) for position in range(1, 97)]
+    day = DayData(TimeSeries(_response(_period(START, quarters, "PT15M", QUARTER))))
+
+    assert day.get_metering_data(1) == 1.0 + 2.0 + 3.0 + 4.0
+    assert day.get_metering_data(24) == 93.0 + 94.0 + 95.0 + 96.0
+    assert day.get_total_metering_data() == sum(quarters)
+    with pytest.raises(IndexError):
+        day.get_metering_data(25)
+
+
+def test_hourly_and_daily_resolutions_have_one_point_per_hour():
+    assert TimeSeries(_response(_period(START, [1.0] * 24))).points_per_hour == 1
+    assert TimeSeries.from_values([1.0], START + timedelta(days=1), START, "P1D").points_per_hour == 1
+    assert TimeSeries.from_values([1.0], START + timedelta(days=31), START, "P1M").points_per_hour == 1
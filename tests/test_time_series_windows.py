@@ -0,0 +1,56 @@
+"""Tests for splitting time series ranges into API windows."""
+from datetime import datetime, timedelta
+
+from eloverblik.api_client import MAX_DAYS_PER_REQUEST, earliest_time_series_date, plan_time_series_windows
+
+
+def _today() -> datetime:
+    return datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def test_long_range_is_split_into_contiguous_windows():
+    date_to = _today() - timedelta(days=10)
+    date_from = date_to - timedelta(days=3 * MAX_DAYS_PER_REQUEST - 100)
+
+    windows = plan_time_series_windows(date_from, date_to)
+
+    assert len(windows) == 3
+    assert windows[0][0] == date_from
+    assert windows[-1][1] == date_to
+    for (_, previous_to), (next_from, _) in zip(windows, windows[1:]):
+        assert next_from == previous_to
+    for window_from, window_to in windows:
+        assert window_from < window_to
+        assert window_to - window_from <= timedelta(days=MAX_DAYS_PER_REQUEST)
+
+
+def test_windows_never_reach_today():
+    date_from = _today() - timedelta(days=5)
+
+    windows = plan_time_series_windows(date_from, _today() + timedelta(days=3))
+
+    assert windows == [(date_from, _today() - timedelta(days=1))]
+
+
+def test_range_within_yesterday_has_no_windows():
+    yesterday = _today() - timedelta(days=1)
+
+    assert plan_time_series_windows(yesterday, _today()) == []
+    assert plan_time_series_windows(yesterday, yesterday) == []
+
+
+def test_range_is_clamped_to_available_history():
+    earliest = earliest_time_series_date()
+
+    windows = plan_time_series_windows(earliest - timedelta(days=400), earliest + timedelta(days=30))
+
+    assert windows == [(earliest, earliest + timedelta(days=30))]
+
+
+def test_time_of_day_and_time_zone_are_dropped():
+    date_from = _today() - timedelta(days=20)
+    aware_from = (date_from + timedelta(hours=13)).astimezone()
+
+    windows = plan_time_series_windows(aware_from, date_from + timedelta(days=2, hours=5))
+
+    assert windows == [(date_from, date_from + timedelta(days=2))]
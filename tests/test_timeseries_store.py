@@ -0,0 +1,159 @@
+"""Tests for the local time series store."""
+import json
+import os
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from eloverblik import timeseries_store
+from eloverblik.models import TimeSeriesPeriod
+from eloverblik.timeseries_store import STORE_VERSION, TimeSeriesStore
+
+
+def _day_period(day: date, value: float = 0.5) -> TimeSeriesPeriod:
+    """Complete hourly period of a Danish winter day."""
+    start = datetime(day.year, day.month, day.day, tzinfo=timezone.utc) - timedelta(hours=1)
+    return TimeSeriesPeriod(start, start + timedelta(days=1), "PT1H", [value] * 24)
+
+
+@pytest.fixture
+def path(tmp_path) -> str:
+    return str(tmp_path / "eloverblik.timeseries.571313100000000000.json")
+
+
+def test_days_round_trip_through_month_files(path):
+    store = TimeSeriesStore(path)
+    assert store.add_day_periods([_day_period(date(2024, 1, 15), 0.25), _day_period(date(2024, 2, 1), 1.5)]) == 2
+    store.save()
+
+    chunk_dir = path[:-len(".json")] + ".days"
+    assert sorted(os.listdir(chunk_dir)) == ["2024-01.json", "2024-02.json"]
+    # Saved months are not kept in memory
+    assert store._chunks == {}
+
+    reloaded = TimeSeriesStore(path)
+    period = reloaded.get_day(date(2024, 1, 15))
+    assert period == _day_period(date(2024, 1, 15), 0.25)
+    assert [p.start for p in reloaded.get_days(date(2024, 1, 1), date(2024, 3, 1))] == [
+        _day_period(date(2024, 1, 15)).start,
+        _day_period(date(2024, 2, 1)).start,
+    ]
+    assert reloaded.get_day(date(2024, 1, 16)) is None
+    # Reads do not keep month files in memory either
+    assert reloaded._chunks == {}
+
+
+def test_incomplete_and_unchanged_days_are_not_stored(path):
+    store = TimeSeriesStore(path)
+    incomplete = _day_period(date(2024, 1, 15))._replace(values=[0.5] * 23 + [None])
+    assert store.add_day_periods([incomplete]) == 0
+    assert store.add_day_periods([_day_period(date(2024, 1, 15))]) == 1
+    assert store.add_day_periods([_day_period(date(2024, 1, 15))]) == 0
+    assert store.add_day_periods([_day_period(date(2024, 1, 15), 0.75)]) == 1
+
+
+def test_index_holds_bitmask_of_stored_days(path):
+    store = TimeSeriesStore(path)
+    store.add_day_periods([_day_period(date(2024, 1, 1)), _day_period(date(2024, 1, 3)), _day_period(date(2024, 1, 31))])
+    store.save()
+
+    with open(path, encoding="utf-8") as f:
+        index = json.load(f)
+    assert index["version"] == STORE_VERSION
+    assert index["days"] == {"2024-01": 1 | 1 << 2 | 1 << 30}
+
+
+def test_missing_day_ranges_are_coalesced(path):
+    store = TimeSeriesStore(path)
+    store.add_day_periods([_day_period(date(2024, 1, 3)), _day_period(date(2024, 1, 4)), _day_period(date(2024, 2, 1))])
+    store.save()
+
+    assert TimeSeriesStore(path).missing_day_ranges(date(2024, 1, 1), date(2024, 2, 3)) == [
+        (date(2024, 1, 1), date(2024, 1, 3)),
+        (date(2024, 1, 5), date(2024, 2, 1)),
+        (date(2024, 2, 2), date(2024, 2, 3)),
+    ]
+
+
+def test_version_1_store_is_migrated(path):
+    period = _day_period(date(2024, 1, 15), 0.25)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({
+            "version": 1,
+            "days": {"2024-01-15": [int(period.start.timestamp()), int(period.end.timestamp()), "PT1H", period.values]},
+            "months": {"2024-01": 7.5},
+            "final_months": ["2024-01"],
+        }, f)
+
+    store = TimeSeriesStore(path)
+    assert store.get_day(date(2024, 1, 15)) == period
+    store.save()
+
+    reloaded = TimeSeriesStore(path)
+    assert reloaded.get_day(date(2024, 1, 15)) == period
+    assert reloaded.get_months() == {"2024-01": 7.5}
+    assert reloaded.get_final_months() == {"2024-01"}
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f)["version"] == STORE_VERSION
+
+
+def test_unknown_version_is_discarded(path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"version": 99, "days": {"2024-01": 1}}, f)
+    assert TimeSeriesStore(path).missing_day_ranges(date(2024, 1, 1), date(2024, 1, 2)) == [(date(2024, 1, 1), date(2024, 1, 2))]
+
+
+def test_failed_write_keeps_previous_file(path, monkeypatch):
+    store = TimeSeriesStore(path)
+    store.add_day_periods([_day_period(date(2024, 1, 1))])
+    store.save()
+    with open(path, encoding="utf-8") as f:
+        saved = f.read()
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    store.add_day_periods([_day_period(date(2024, 1, 2))])
+    monkeypatch.setattr(timeseries_store.os, "replace", fail_replace)
+    store.save()
+    monkeypatch.undo()
+
+    with open(path, encoding="utf-8") as f:
+        assert f.read() == saved
+    # No temporary files are left behind, and the changes are kept for the next save
+    for directory in (os.path.dirname(path), path[:-len(".json")] + ".days"):
+        assert not [name for name in os.listdir(directory) if name.endswith(".tmp")]
+    store.save()
+    assert TimeSeriesStore(path).get_day(date(2024, 1, 2)) is not None
+
+
+def test_remove_deletes_all_files(path):
+    store = TimeSeriesStore(path)
+    store.add_day_periods([_day_period(date(2024, 1, 1))])
+    store.save()
+    store.remove()
+    assert os.listdir(os.path.dirname(path)) == []
+
+
+def _month_period(first_month: date, values: list) -> TimeSeriesPeriod:
+    """Monthly period starting at Danish midnight of a month's first day."""
+    start = datetime(first_month.year, first_month.month, 1, tzinfo=timezone.utc) - timedelta(hours=1)
+    return TimeSeriesPeriod(start, start + timedelta(days=31 * len(values)), "P1M", values)
+
+
+def test_months_are_stored_by_position(path):
+    store = TimeSeriesStore(path)
+    assert store.add_month_periods([_month_period(date(2023, 11, 1), [10.0, None, 12.5])]) == 2
+    assert store.add_month_periods([_month_period(date(2023, 11, 1), [10.0, None, 12.5])]) == 0
+    store.save()
+
+    assert TimeSeriesStore(path).get_months() == {"2023-11": 10.0, "2024-01": 12.5}
+
+
+def test_months_ended_before_cutoff_are_final(path):
+    store = TimeSeriesStore(path)
+    store.add_month_periods([_month_period(date(2024, 1, 1), [1.0, 2.0, 3.0])], finalize_before=date(2024, 3, 5))
+    store.save()
+
+    # March has not ended yet, so it is requested again
+    assert TimeSeriesStore(path).get_final_months() == {"2024-01", "2024-02"}